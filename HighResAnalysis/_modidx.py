@@ -151,6 +151,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                           'HighResAnalysis/convert.py')},
             'HighResAnalysis.mod.dut_cuts': { 'HighResAnalysis.mod.dut_cuts.DUTCut': ( 'mod.dut_cuts.html#dutcut',
                                                                                        'HighResAnalysis/mod/dut_cuts.py'),
+                                              'HighResAnalysis.mod.dut_cuts.DUTCut.MetaDir': ( 'mod.dut_cuts.html#dutcut.metadir',
+                                                                                               'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.__call__': ( 'mod.dut_cuts.html#dutcut.__call__',
                                                                                                 'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.__init__': ( 'mod.dut_cuts.html#dutcut.__init__',
@@ -209,6 +211,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                  'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.make_cluster': ( 'mod.dut_cuts.html#dutcut.make_cluster',
                                                                                                     'HighResAnalysis/mod/dut_cuts.py'),
+                                              'HighResAnalysis.mod.dut_cuts.DUTCut.make_cluster_': ( 'mod.dut_cuts.html#dutcut.make_cluster_',
+                                                                                                     'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.make_cluster_mask': ( 'mod.dut_cuts.html#dutcut.make_cluster_mask',
                                                                                                          'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.make_cluster_size': ( 'mod.dut_cuts.html#dutcut.make_cluster_size',
@@ -263,6 +267,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                 'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.set_slope': ( 'mod.dut_cuts.html#dutcut.set_slope',
                                                                                                  'HighResAnalysis/mod/dut_cuts.py'),
+                                              'HighResAnalysis.mod.dut_cuts.DUTCut.shared': ( 'mod.dut_cuts.html#dutcut.shared',
+                                                                                              'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.to_trk': ( 'mod.dut_cuts.html#dutcut.to_trk',
                                                                                               'HighResAnalysis/mod/dut_cuts.py'),
                                               'HighResAnalysis.mod.dut_cuts.DUTCut.trk2ev': ( 'mod.dut_cuts.html#dutcut.trk2ev',
@@ -357,12 +363,20 @@ d = { 'settings': { 'branch': 'master',
                                                                                                'HighResAnalysis/plotting/binning.py'),
                                                   'HighResAnalysis.plotting.binning.n': ( 'plotting.binning.html#n',
                                                                                           'HighResAnalysis/plotting/binning.py'),
+                                                  'HighResAnalysis.plotting.binning.nested_moments': ( 'plotting.binning.html#nested_moments',
+                                                                                                       'HighResAnalysis/plotting/binning.py'),
+                                                  'HighResAnalysis.plotting.binning.segment_reduce': ( 'plotting.binning.html#segment_reduce',
+                                                                                                       'HighResAnalysis/plotting/binning.py'),
                                                   'HighResAnalysis.plotting.binning.set_2d_entries': ( 'plotting.binning.html#set_2d_entries',
                                                                                                        'HighResAnalysis/plotting/binning.py'),
                                                   'HighResAnalysis.plotting.binning.set_2d_values': ( 'plotting.binning.html#set_2d_values',
                                                                                                       'HighResAnalysis/plotting/binning.py'),
                                                   'HighResAnalysis.plotting.binning.single_entries_2d': ( 'plotting.binning.html#single_entries_2d',
                                                                                                           'HighResAnalysis/plotting/binning.py'),
+                                                  'HighResAnalysis.plotting.binning.slice_correlation': ( 'plotting.binning.html#slice_correlation',
+                                                                                                          'HighResAnalysis/plotting/binning.py'),
+                                                  'HighResAnalysis.plotting.binning.slice_correlations': ( 'plotting.binning.html#slice_correlations',
+                                                                                                           'HighResAnalysis/plotting/binning.py'),
                                                   'HighResAnalysis.plotting.binning.width': ( 'plotting.binning.html#width',
                                                                                               'HighResAnalysis/plotting/binning.py')},
             'HighResAnalysis.plotting.draw': { 'HighResAnalysis.plotting.draw.Draw': ( 'plotting.draw.html#draw',
@@ -869,20 +883,30 @@ d = { 'settings': { 'branch': 'master',
                                                                                                   'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.PoissonI.init_fit': ( 'plotting.fit.html#poissoni.init_fit',
                                                                                                   'HighResAnalysis/plotting/fit.py'),
+                                              'HighResAnalysis.plotting.fit._batch_fit': ( 'plotting.fit.html#_batch_fit',
+                                                                                           'HighResAnalysis/plotting/fit.py'),
+                                              'HighResAnalysis.plotting.fit.batch_fit': ( 'plotting.fit.html#batch_fit',
+                                                                                          'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.crystalball': ( 'plotting.fit.html#crystalball',
                                                                                             'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.erfland': ( 'plotting.fit.html#erfland',
                                                                                         'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.gauss': ( 'plotting.fit.html#gauss',
                                                                                       'HighResAnalysis/plotting/fit.py'),
+                                              'HighResAnalysis.plotting.fit.hist_state': ( 'plotting.fit.html#hist_state',
+                                                                                           'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.langau': ( 'plotting.fit.html#langau',
                                                                                        'HighResAnalysis/plotting/fit.py'),
+                                              'HighResAnalysis.plotting.fit.langau_tf1': ( 'plotting.fit.html#langau_tf1',
+                                                                                           'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.langaupro': ( 'plotting.fit.html#langaupro',
                                                                                           'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.main': ( 'plotting.fit.html#main',
                                                                                      'HighResAnalysis/plotting/fit.py'),
                                               'HighResAnalysis.plotting.fit.make_fit': ( 'plotting.fit.html#make_fit',
-                                                                                         'HighResAnalysis/plotting/fit.py')},
+                                                                                         'HighResAnalysis/plotting/fit.py'),
+                                              'HighResAnalysis.plotting.fit.state_hash': ( 'plotting.fit.html#state_hash',
+                                                                                           'HighResAnalysis/plotting/fit.py')},
             'HighResAnalysis.plotting.html': { 'HighResAnalysis.plotting.html.File': ( 'plotting.html.html#file',
                                                                                        'HighResAnalysis/plotting/html.py'),
                                                'HighResAnalysis.plotting.html.File.__init__': ( 'plotting.html.html#file.__init__',
@@ -1037,6 +1061,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                          'HighResAnalysis/plotting/latex.py')},
             'HighResAnalysis.plotting.save': { 'HighResAnalysis.plotting.save.SaveDraw': ( 'plotting.save.html#savedraw',
                                                                                            'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.File': ( 'plotting.save.html#savedraw.file',
+                                                                                                'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.__del__': ( 'plotting.save.html#savedraw.__del__',
                                                                                                    'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.__init__': ( 'plotting.save.html#savedraw.__init__',
@@ -1045,12 +1071,20 @@ d = { 'settings': { 'branch': 'master',
                                                                                                          'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.close_file': ( 'plotting.save.html#savedraw.close_file',
                                                                                                       'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.collect': ( 'plotting.save.html#savedraw.collect',
+                                                                                                   'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.create_overview': ( 'plotting.save.html#savedraw.create_overview',
                                                                                                            'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.dummy': ( 'plotting.save.html#savedraw.dummy',
+                                                                                                 'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.export': ( 'plotting.save.html#savedraw.export',
+                                                                                                  'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.file_name': ( 'plotting.save.html#savedraw.file_name',
                                                                                                      'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.find_config': ( 'plotting.save.html#savedraw.find_config',
                                                                                                        'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.flush': ( 'plotting.save.html#savedraw.flush',
+                                                                                                 'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.histo': ( 'plotting.save.html#savedraw.histo',
                                                                                                  'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.init_info': ( 'plotting.save.html#savedraw.init_info',
@@ -1059,6 +1093,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                         'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.open_file': ( 'plotting.save.html#savedraw.open_file',
                                                                                                      'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.overview': ( 'plotting.save.html#savedraw.overview',
+                                                                                                    'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.print_http': ( 'plotting.save.html#savedraw.print_http',
                                                                                                       'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.remove_plots': ( 'plotting.save.html#savedraw.remove_plots',
@@ -1081,6 +1117,10 @@ d = { 'settings': { 'branch': 'master',
                                                                                                        'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.SaveDraw.sl': ( 'plotting.save.html#savedraw.sl',
                                                                                               'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save.SaveDraw.wait': ( 'plotting.save.html#savedraw.wait',
+                                                                                                'HighResAnalysis/plotting/save.py'),
+                                               'HighResAnalysis.plotting.save._export': ( 'plotting.save.html#_export',
+                                                                                          'HighResAnalysis/plotting/save.py'),
                                                'HighResAnalysis.plotting.save.main': ( 'plotting.save.html#main',
                                                                                        'HighResAnalysis/plotting/save.py')},
             'HighResAnalysis.plotting.utils': { 'HighResAnalysis.plotting.utils.AsymVar': ( 'plotting.utils.html#asymvar',
@@ -1241,6 +1281,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                             'HighResAnalysis/plotting/utils.py')},
             'HighResAnalysis.src.analysis': { 'HighResAnalysis.src.analysis.Analysis': ( 'src.analysis.html#analysis',
                                                                                          'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.Analysis.Draw': ( 'src.analysis.html#analysis.draw',
+                                                                                              'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.__init__': ( 'src.analysis.html#analysis.__init__',
                                                                                                   'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.__repr__': ( 'src.analysis.html#analysis.__repr__',
@@ -1265,8 +1307,12 @@ d = { 'settings': { 'branch': 'master',
                                                                                                         'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.make_pickle_path': ( 'src.analysis.html#analysis.make_pickle_path',
                                                                                                           'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.Analysis.meta_cache': ( 'src.analysis.html#analysis.meta_cache',
+                                                                                                    'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.meta_file_size': ( 'src.analysis.html#analysis.meta_file_size',
                                                                                                         'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.Analysis.meta_pattern': ( 'src.analysis.html#analysis.meta_pattern',
+                                                                                                      'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.print_meta_file_size': ( 'src.analysis.html#analysis.print_meta_file_size',
                                                                                                               'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.Analysis.print_meta_file_sizes': ( 'src.analysis.html#analysis.print_meta_file_sizes',
@@ -1291,6 +1337,14 @@ d = { 'settings': { 'branch': 'master',
                                                                                                   'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.BeamTest.__str__': ( 'src.analysis.html#beamtest.__str__',
                                                                                                  'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.lazy_class_attr': ( 'src.analysis.html#lazy_class_attr',
+                                                                                                'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.lazy_class_attr.__get__': ( 'src.analysis.html#lazy_class_attr.__get__',
+                                                                                                        'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.lazy_class_attr.__init__': ( 'src.analysis.html#lazy_class_attr.__init__',
+                                                                                                         'HighResAnalysis/src/analysis.py'),
+                                              'HighResAnalysis.src.analysis.lazy_class_attr.__set_name__': ( 'src.analysis.html#lazy_class_attr.__set_name__',
+                                                                                                             'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.load_config': ( 'src.analysis.html#load_config',
                                                                                             'HighResAnalysis/src/analysis.py'),
                                               'HighResAnalysis.src.analysis.main': ( 'src.analysis.html#main',
@@ -1321,6 +1375,46 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                  'HighResAnalysis/src/batch_analysis.py'),
                                                     'HighResAnalysis.src.batch_analysis.BatchAnalysis.unit_str': ( 'src.batch_analysis.html#batchanalysis.unit_str',
                                                                                                                    'HighResAnalysis/src/batch_analysis.py')},
+            'HighResAnalysis.src.benchmark': { 'HighResAnalysis.src.benchmark.Benchmark': ( 'src.benchmark.html#benchmark',
+                                                                                            'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.Ana': ( 'src.benchmark.html#benchmark.ana',
+                                                                                                'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.Converter': ( 'src.benchmark.html#benchmark.converter',
+                                                                                                      'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.__init__': ( 'src.benchmark.html#benchmark.__init__',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.__repr__': ( 'src.benchmark.html#benchmark.__repr__',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.analysis': ( 'src.benchmark.html#benchmark.analysis',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.baseline': ( 'src.benchmark.html#benchmark.baseline',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.init_run': ( 'src.benchmark.html#benchmark.init_run',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.run': ( 'src.benchmark.html#benchmark.run',
+                                                                                                'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.save': ( 'src.benchmark.html#benchmark.save',
+                                                                                                 'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.show': ( 'src.benchmark.html#benchmark.show',
+                                                                                                 'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time': ( 'src.benchmark.html#benchmark.time',
+                                                                                                 'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_align': ( 'src.benchmark.html#benchmark.time_align',
+                                                                                                       'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_convert': ( 'src.benchmark.html#benchmark.time_convert',
+                                                                                                         'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_cuts': ( 'src.benchmark.html#benchmark.time_cuts',
+                                                                                                      'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_eff': ( 'src.benchmark.html#benchmark.time_eff',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_init': ( 'src.benchmark.html#benchmark.time_init',
+                                                                                                      'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_server': ( 'src.benchmark.html#benchmark.time_server',
+                                                                                                        'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.Benchmark.time_txy': ( 'src.benchmark.html#benchmark.time_txy',
+                                                                                                     'HighResAnalysis/src/benchmark.py'),
+                                               'HighResAnalysis.src.benchmark.main': ( 'src.benchmark.html#main',
+                                                                                       'HighResAnalysis/src/benchmark.py')},
             'HighResAnalysis.src.bins': { 'HighResAnalysis.src.bins.get_adc': ('src.bins.html#get_adc', 'HighResAnalysis/src/bins.py'),
                                           'HighResAnalysis.src.bins.get_corr': ('src.bins.html#get_corr', 'HighResAnalysis/src/bins.py'),
                                           'HighResAnalysis.src.bins.get_electrons': ( 'src.bins.html#get_electrons',
@@ -1347,6 +1441,12 @@ d = { 'settings': { 'branch': 'master',
                                           'HighResAnalysis.src.bins.get_y': ('src.bins.html#get_y', 'HighResAnalysis/src/bins.py')},
             'HighResAnalysis.src.calibration': { 'HighResAnalysis.src.calibration.Calibration': ( 'src.calibration.html#calibration',
                                                                                                   'HighResAnalysis/src/calibration.py'),
+                                                 'HighResAnalysis.src.calibration.Calibration.Draw': ( 'src.calibration.html#calibration.draw',
+                                                                                                       'HighResAnalysis/src/calibration.py'),
+                                                 'HighResAnalysis.src.calibration.Calibration.Fit': ( 'src.calibration.html#calibration.fit',
+                                                                                                      'HighResAnalysis/src/calibration.py'),
+                                                 'HighResAnalysis.src.calibration.Calibration.MetaDir': ( 'src.calibration.html#calibration.metadir',
+                                                                                                          'HighResAnalysis/src/calibration.py'),
                                                  'HighResAnalysis.src.calibration.Calibration.__call__': ( 'src.calibration.html#calibration.__call__',
                                                                                                            'HighResAnalysis/src/calibration.py'),
                                                  'HighResAnalysis.src.calibration.Calibration.__init__': ( 'src.calibration.html#calibration.__init__',
@@ -1385,6 +1485,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                               'HighResAnalysis/src/calibration.py'),
                                                  'HighResAnalysis.src.calibration.Calibration.get_lookup_table': ( 'src.calibration.html#calibration.get_lookup_table',
                                                                                                                    'HighResAnalysis/src/calibration.py'),
+                                                 'HighResAnalysis.src.calibration.Calibration.get_lut': ( 'src.calibration.html#calibration.get_lut',
+                                                                                                          'HighResAnalysis/src/calibration.py'),
                                                  'HighResAnalysis.src.calibration.Calibration.get_points': ( 'src.calibration.html#calibration.get_points',
                                                                                                              'HighResAnalysis/src/calibration.py'),
                                                  'HighResAnalysis.src.calibration.Calibration.get_thresholds': ( 'src.calibration.html#calibration.get_thresholds',
@@ -1497,6 +1599,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                               'HighResAnalysis/src/converter.py'),
                                                'HighResAnalysis.src.converter.Raw': ( 'src.converter.html#raw',
                                                                                       'HighResAnalysis/src/converter.py'),
+                                               'HighResAnalysis.src.converter.Raw.Draw': ( 'src.converter.html#raw.draw',
+                                                                                           'HighResAnalysis/src/converter.py'),
                                                'HighResAnalysis.src.converter.Raw.__init__': ( 'src.converter.html#raw.__init__',
                                                                                                'HighResAnalysis/src/converter.py'),
                                                'HighResAnalysis.src.converter.Raw.__repr__': ( 'src.converter.html#raw.__repr__',
@@ -1611,6 +1715,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                    'HighResAnalysis/src/currents.py'),
                                               'HighResAnalysis.src.currents.Currents.load_times': ( 'src.currents.html#currents.load_times',
                                                                                                     'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.Currents.lookup_data': ( 'src.currents.html#currents.lookup_data',
+                                                                                                     'HighResAnalysis/src/currents.py'),
                                               'HighResAnalysis.src.currents.Currents.print_run_times': ( 'src.currents.html#currents.print_run_times',
                                                                                                          'HighResAnalysis/src/currents.py'),
                                               'HighResAnalysis.src.currents.Currents.reload_data': ( 'src.currents.html#currents.reload_data',
@@ -1619,8 +1725,36 @@ d = { 'settings': { 'branch': 'master',
                                                                                                     'HighResAnalysis/src/currents.py'),
                                               'HighResAnalysis.src.currents.Currents.server_save_dir': ( 'src.currents.html#currents.server_save_dir',
                                                                                                          'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData': ( 'src.currents.html#hvdata',
+                                                                                       'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.__contains__': ( 'src.currents.html#hvdata.__contains__',
+                                                                                                    'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.__init__': ( 'src.currents.html#hvdata.__init__',
+                                                                                                'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.__repr__': ( 'src.currents.html#hvdata.__repr__',
+                                                                                                'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.add': ( 'src.currents.html#hvdata.add',
+                                                                                           'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.close': ( 'src.currents.html#hvdata.close',
+                                                                                             'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.get': ( 'src.currents.html#hvdata.get',
+                                                                                           'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.index': ( 'src.currents.html#hvdata.index',
+                                                                                             'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.load': ( 'src.currents.html#hvdata.load',
+                                                                                            'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.logs': ( 'src.currents.html#hvdata.logs',
+                                                                                            'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.read_all': ( 'src.currents.html#hvdata.read_all',
+                                                                                                'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.tags': ( 'src.currents.html#hvdata.tags',
+                                                                                            'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.HVData.write': ( 'src.currents.html#hvdata.write',
+                                                                                             'HighResAnalysis/src/currents.py'),
                                               'HighResAnalysis.src.currents.main': ( 'src.currents.html#main',
-                                                                                     'HighResAnalysis/src/currents.py')},
+                                                                                     'HighResAnalysis/src/currents.py'),
+                                              'HighResAnalysis.src.currents.read_hv_log': ( 'src.currents.html#read_hv_log',
+                                                                                            'HighResAnalysis/src/currents.py')},
             'HighResAnalysis.src.cut': { 'HighResAnalysis.src.cut.Cut': ('src.cut.html#cut', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cut.__add__': ('src.cut.html#cut.__add__', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cut.__call__': ( 'src.cut.html#cut.__call__',
@@ -1657,11 +1791,17 @@ d = { 'settings': { 'branch': 'master',
                                                                                     'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.__str__': ( 'src.cut.html#cuts.__str__',
                                                                                    'HighResAnalysis/src/cut.py'),
+                                         'HighResAnalysis.src.cut.Cuts.active': ('src.cut.html#cuts.active', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.add': ('src.cut.html#cuts.add', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.config_file': ( 'src.cut.html#cuts.config_file',
                                                                                        'HighResAnalysis/src/cut.py'),
+                                         'HighResAnalysis.src.cut.Cuts.count_bits': ( 'src.cut.html#cuts.count_bits',
+                                                                                      'HighResAnalysis/src/cut.py'),
+                                         'HighResAnalysis.src.cut.Cuts.cumulative': ( 'src.cut.html#cuts.cumulative',
+                                                                                      'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.exclude': ( 'src.cut.html#cuts.exclude',
                                                                                    'HighResAnalysis/src/cut.py'),
+                                         'HighResAnalysis.src.cut.Cuts.flow': ('src.cut.html#cuts.flow', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.generate': ( 'src.cut.html#cuts.generate',
                                                                                     'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.get': ('src.cut.html#cuts.get', 'HighResAnalysis/src/cut.py'),
@@ -1679,6 +1819,7 @@ d = { 'settings': { 'branch': 'master',
                                          'HighResAnalysis.src.cut.Cuts.n': ('src.cut.html#cuts.n', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.names': ('src.cut.html#cuts.names', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.none': ('src.cut.html#cuts.none', 'HighResAnalysis/src/cut.py'),
+                                         'HighResAnalysis.src.cut.Cuts.pack': ('src.cut.html#cuts.pack', 'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.register': ( 'src.cut.html#cuts.register',
                                                                                     'HighResAnalysis/src/cut.py'),
                                          'HighResAnalysis.src.cut.Cuts.remove': ('src.cut.html#cuts.remove', 'HighResAnalysis/src/cut.py'),
@@ -1735,6 +1876,26 @@ d = { 'settings': { 'branch': 'master',
                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis': ( 'src.dut_analysis.html#dutanalysis',
                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Currents': ( 'src.dut_analysis.html#dutanalysis.currents',
+                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Cut': ( 'src.dut_analysis.html#dutanalysis.cut',
+                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Draw': ( 'src.dut_analysis.html#dutanalysis.draw',
+                                                                                                         'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Efficiency': ( 'src.dut_analysis.html#dutanalysis.efficiency',
+                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.F': ( 'src.dut_analysis.html#dutanalysis.f',
+                                                                                                      'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.REF': ( 'src.dut_analysis.html#dutanalysis.ref',
+                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Residuals': ( 'src.dut_analysis.html#dutanalysis.residuals',
+                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Resolution': ( 'src.dut_analysis.html#dutanalysis.resolution',
+                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Tel': ( 'src.dut_analysis.html#dutanalysis.tel',
+                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.Tracks': ( 'src.dut_analysis.html#dutanalysis.tracks',
+                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.__init__': ( 'src.dut_analysis.html#dutanalysis.__init__',
                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.__repr__': ( 'src.dut_analysis.html#dutanalysis.__repr__',
@@ -1745,14 +1906,32 @@ d = { 'settings': { 'branch': 'master',
                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.ax_tits': ( 'src.dut_analysis.html#dutanalysis.ax_tits',
                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.cached_columns': ( 'src.dut_analysis.html#dutanalysis.cached_columns',
+                                                                                                                   'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.calc_txy': ( 'src.dut_analysis.html#dutanalysis.calc_txy',
+                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.column': ( 'src.dut_analysis.html#dutanalysis.column',
+                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.contracted_vars': ( 'src.dut_analysis.html#dutanalysis.contracted_vars',
                                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.contracted_xy': ( 'src.dut_analysis.html#dutanalysis.contracted_xy',
+                                                                                                                  'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.converter': ( 'src.dut_analysis.html#dutanalysis.converter',
                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.correlation_chunks': ( 'src.dut_analysis.html#dutanalysis.correlation_chunks',
+                                                                                                                       'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.correlation_mask': ( 'src.dut_analysis.html#dutanalysis.correlation_mask',
+                                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.correlation_time': ( 'src.dut_analysis.html#dutanalysis.correlation_time',
+                                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.correlation_trend': ( 'src.dut_analysis.html#dutanalysis.correlation_trend',
+                                                                                                                      'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.cs': ( 'src.dut_analysis.html#dutanalysis.cs',
                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.current': ( 'src.dut_analysis.html#dutanalysis.current',
                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.cut_id': ( 'src.dut_analysis.html#dutanalysis.cut_id',
+                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.deactivate_surface': ( 'src.dut_analysis.html#dutanalysis.deactivate_surface',
                                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.draw_charge_distribution': ( 'src.dut_analysis.html#dutanalysis.draw_charge_distribution',
@@ -1851,10 +2030,14 @@ d = { 'settings': { 'branch': 'master',
                                                                                                         'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.ev_str': ( 'src.dut_analysis.html#dutanalysis.ev_str',
                                                                                                            'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.expand_index': ( 'src.dut_analysis.html#dutanalysis.expand_index',
+                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.expand_vars': ( 'src.dut_analysis.html#dutanalysis.expand_vars',
                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.file_name': ( 'src.dut_analysis.html#dutanalysis.file_name',
                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.find_misalignment': ( 'src.dut_analysis.html#dutanalysis.find_misalignment',
+                                                                                                                      'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.fit_signal': ( 'src.dut_analysis.html#dutanalysis.fit_signal',
                                                                                                                'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.from_run': ( 'src.dut_analysis.html#dutanalysis.from_run',
@@ -1911,6 +2094,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                   'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.i': ( 'src.dut_analysis.html#dutanalysis.i',
                                                                                                       'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.in_binning': ( 'src.dut_analysis.html#dutanalysis.in_binning',
+                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.init_converter': ( 'src.dut_analysis.html#dutanalysis.init_converter',
                                                                                                                    'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.init_eff': ( 'src.dut_analysis.html#dutanalysis.init_eff',
@@ -1927,6 +2112,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.init_tracks': ( 'src.dut_analysis.html#dutanalysis.init_tracks',
                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.initialised': ( 'src.dut_analysis.html#dutanalysis.initialised',
+                                                                                                                'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.inv_x': ( 'src.dut_analysis.html#dutanalysis.inv_x',
                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.l2g': ( 'src.dut_analysis.html#dutanalysis.l2g',
@@ -1939,6 +2126,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.n': ( 'src.dut_analysis.html#dutanalysis.n',
                                                                                                       'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.periodic_map': ( 'src.dut_analysis.html#dutanalysis.periodic_map',
+                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.ph': ( 'src.dut_analysis.html#dutanalysis.ph',
                                                                                                        'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.ph_tit': ( 'src.dut_analysis.html#dutanalysis.ph_tit',
@@ -1951,20 +2140,28 @@ d = { 'settings': { 'branch': 'master',
                                                                                                               'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.r_phi': ( 'src.dut_analysis.html#dutanalysis.r_phi',
                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.read_data': ( 'src.dut_analysis.html#dutanalysis.read_data',
+                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.reload_data': ( 'src.dut_analysis.html#dutanalysis.reload_data',
                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.remove_file': ( 'src.dut_analysis.html#dutanalysis.remove_file',
                                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.report': ( 'src.dut_analysis.html#dutanalysis.report',
+                                                                                                           'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.save_plots': ( 'src.dut_analysis.html#dutanalysis.save_plots',
                                                                                                                'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.segment_centres': ( 'src.dut_analysis.html#dutanalysis.segment_centres',
                                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.segment_stats': ( 'src.dut_analysis.html#dutanalysis.segment_stats',
+                                                                                                                  'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.segment_values': ( 'src.dut_analysis.html#dutanalysis.segment_values',
                                                                                                                    'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.segments': ( 'src.dut_analysis.html#dutanalysis.segments',
                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.server_save_dir': ( 'src.dut_analysis.html#dutanalysis.server_save_dir',
                                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.show_init_profile': ( 'src.dut_analysis.html#dutanalysis.show_init_profile',
+                                                                                                                      'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.show_structure': ( 'src.dut_analysis.html#dutanalysis.show_structure',
                                                                                                                    'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.suffix': ( 'src.dut_analysis.html#dutanalysis.suffix',
@@ -1973,10 +2170,32 @@ d = { 'settings': { 'branch': 'master',
                                                                                                            'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.time': ( 'src.dut_analysis.html#dutanalysis.time',
                                                                                                          'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.DUTAnalysis.time_init': ( 'src.dut_analysis.html#dutanalysis.time_init',
+                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.DUTAnalysis.verify_alignment': ( 'src.dut_analysis.html#dutanalysis.verify_alignment',
                                                                                                                      'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.RunContext': ( 'src.dut_analysis.html#runcontext',
+                                                                                                   'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.RunContext.__call__': ( 'src.dut_analysis.html#runcontext.__call__',
+                                                                                                            'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.RunContext.__init__': ( 'src.dut_analysis.html#runcontext.__init__',
+                                                                                                            'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.RunContext.__repr__': ( 'src.dut_analysis.html#runcontext.__repr__',
+                                                                                                            'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.RunContext.reset': ( 'src.dut_analysis.html#runcontext.reset',
+                                                                                                         'HighResAnalysis/src/dut_analysis.py'),
                                                   'HighResAnalysis.src.dut_analysis.no_trans': ( 'src.dut_analysis.html#no_trans',
-                                                                                                 'HighResAnalysis/src/dut_analysis.py')},
+                                                                                                 'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.sub_analysis': ( 'src.dut_analysis.html#sub_analysis',
+                                                                                                     'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.sub_analysis.__call__': ( 'src.dut_analysis.html#sub_analysis.__call__',
+                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.sub_analysis.__get__': ( 'src.dut_analysis.html#sub_analysis.__get__',
+                                                                                                             'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.sub_analysis.__init__': ( 'src.dut_analysis.html#sub_analysis.__init__',
+                                                                                                              'HighResAnalysis/src/dut_analysis.py'),
+                                                  'HighResAnalysis.src.dut_analysis.sub_analysis.__set_name__': ( 'src.dut_analysis.html#sub_analysis.__set_name__',
+                                                                                                                  'HighResAnalysis/src/dut_analysis.py')},
             'HighResAnalysis.src.proteus': { 'HighResAnalysis.src.proteus.Proteus': ( 'src.proteus.html#proteus',
                                                                                       'HighResAnalysis/src/proteus.py'),
                                              'HighResAnalysis.src.proteus.Proteus.__create_default_cfg': ( 'src.proteus.html#proteus.__create_default_cfg',
@@ -2111,6 +2330,29 @@ d = { 'settings': { 'branch': 'master',
                                          'HighResAnalysis.src.run.Run.n_ev': ('src.run.html#run.n_ev', 'HighResAnalysis/src/run.py'),
                                          'HighResAnalysis.src.run.Run.print_info': ( 'src.run.html#run.print_info',
                                                                                      'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex': ('src.run.html#runindex', 'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.__getitem__': ( 'src.run.html#runindex.__getitem__',
+                                                                                           'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.__init__': ( 'src.run.html#runindex.__init__',
+                                                                                        'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.__repr__': ( 'src.run.html#runindex.__repr__',
+                                                                                        'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.batch': ( 'src.run.html#runindex.batch',
+                                                                                     'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.bias': ( 'src.run.html#runindex.bias',
+                                                                                    'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.dut_nr': ( 'src.run.html#runindex.dut_nr',
+                                                                                      'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.duts': ( 'src.run.html#runindex.duts',
+                                                                                    'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.load': ( 'src.run.html#runindex.load',
+                                                                                    'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.load_batches': ( 'src.run.html#runindex.load_batches',
+                                                                                            'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.load_key': ( 'src.run.html#runindex.load_key',
+                                                                                        'HighResAnalysis/src/run.py'),
+                                         'HighResAnalysis.src.run.RunIndex.runs': ( 'src.run.html#runindex.runs',
+                                                                                    'HighResAnalysis/src/run.py'),
                                          'HighResAnalysis.src.run.init_batch': ('src.run.html#init_batch', 'HighResAnalysis/src/run.py'),
                                          'HighResAnalysis.src.run.load_batches': ( 'src.run.html#load_batches',
                                                                                    'HighResAnalysis/src/run.py'),
@@ -2120,6 +2362,10 @@ d = { 'settings': { 'branch': 'master',
             'HighResAnalysis.src.scan': { 'HighResAnalysis.src.scan.Scan': ('src.scan.html#scan', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.__init__': ( 'src.scan.html#scan.__init__',
                                                                                       'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.code_key': ( 'src.scan.html#scan.code_key',
+                                                                                      'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.cut_key': ( 'src.scan.html#scan.cut_key',
+                                                                                     'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.cuts': ('src.scan.html#scan.cuts', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.draw_2vars': ( 'src.scan.html#scan.draw_2vars',
                                                                                         'HighResAnalysis/src/scan.py'),
@@ -2131,6 +2377,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                              'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.draw_graph': ( 'src.scan.html#scan.draw_graph',
                                                                                         'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.draw_mpv': ( 'src.scan.html#scan.draw_mpv',
+                                                                                      'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.draw_ph_around_cols': ( 'src.scan.html#scan.draw_ph_around_cols',
                                                                                                  'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.draw_ph_dists': ( 'src.scan.html#scan.draw_ph_dists',
@@ -2139,20 +2387,40 @@ d = { 'settings': { 'branch': 'master',
                                                                                                'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.draw_r_ph_cols': ( 'src.scan.html#scan.draw_r_ph_cols',
                                                                                             'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.fits': ('src.scan.html#scan.fits', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.init_analyses': ( 'src.scan.html#scan.init_analyses',
                                                                                            'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.init_analysis': ( 'src.scan.html#scan.init_analysis',
+                                                                                           'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.legend': ( 'src.scan.html#scan.legend',
                                                                                     'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.load_table': ( 'src.scan.html#scan.load_table',
+                                                                                        'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.mpvs': ('src.scan.html#scan.mpvs', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.n_ev': ('src.scan.html#scan.n_ev', 'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.read_values': ( 'src.scan.html#scan.read_values',
+                                                                                         'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.save_plots': ( 'src.scan.html#scan.save_plots',
                                                                                         'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.save_table': ( 'src.scan.html#scan.save_table',
+                                                                                        'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.server_save_dir': ( 'src.scan.html#scan.server_save_dir',
                                                                                              'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.stack': ( 'src.scan.html#scan.stack',
+                                                                                   'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.suffix': ( 'src.scan.html#scan.suffix',
                                                                                     'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.t': ('src.scan.html#scan.t', 'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.table': ( 'src.scan.html#scan.table',
+                                                                                   'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.table_path': ( 'src.scan.html#scan.table_path',
+                                                                                        'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.unit_key': ( 'src.scan.html#scan.unit_key',
+                                                                                      'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.values': ( 'src.scan.html#scan.values',
                                                                                     'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan.Scan.warm_caches': ( 'src.scan.html#scan.warm_caches',
+                                                                                         'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.x': ('src.scan.html#scan.x', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.Scan.x2str': ( 'src.scan.html#scan.x2str',
                                                                                    'HighResAnalysis/src/scan.py'),
@@ -2169,6 +2437,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                        'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.VScan.x': ('src.scan.html#vscan.x', 'HighResAnalysis/src/scan.py'),
                                           'HighResAnalysis.src.scan.VScan.x2str': ( 'src.scan.html#vscan.x2str',
+                                                                                    'HighResAnalysis/src/scan.py'),
+                                          'HighResAnalysis.src.scan._warm_cache': ( 'src.scan.html#_warm_cache',
                                                                                     'HighResAnalysis/src/scan.py')},
             'HighResAnalysis.src.spreadsheet': { 'HighResAnalysis.src.spreadsheet.colnum_string': ( 'src.spreadsheet.html#colnum_string',
                                                                                                     'HighResAnalysis/src/spreadsheet.py'),
@@ -2184,6 +2454,84 @@ d = { 'settings': { 'branch': 'master',
                                                                                                         'HighResAnalysis/src/spreadsheet.py'),
                                                  'HighResAnalysis.src.spreadsheet.make_timestamp': ( 'src.spreadsheet.html#make_timestamp',
                                                                                                      'HighResAnalysis/src/spreadsheet.py')},
+            'HighResAnalysis.src.standin': { 'HighResAnalysis.src.standin.StandIn': ( 'src.standin.html#standin',
+                                                                                      'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.__init__': ( 'src.standin.html#standin.__init__',
+                                                                                               'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.__repr__': ( 'src.standin.html#standin.__repr__',
+                                                                                               'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.activate': ( 'src.standin.html#standin.activate',
+                                                                                               'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.align': ( 'src.standin.html#standin.align',
+                                                                                            'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.eu_cli_converter': ( 'src.standin.html#standin.eu_cli_converter',
+                                                                                                       'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.exe': ( 'src.standin.html#standin.exe',
+                                                                                          'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.exes': ( 'src.standin.html#standin.exes',
+                                                                                           'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.install': ( 'src.standin.html#standin.install',
+                                                                                              'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.load_run': ( 'src.standin.html#standin.load_run',
+                                                                                               'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.noise_scan': ( 'src.standin.html#standin.noise_scan',
+                                                                                                 'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.occupancy': ( 'src.standin.html#standin.occupancy',
+                                                                                                'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.parse': ( 'src.standin.html#standin.parse',
+                                                                                            'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.recon': ( 'src.standin.html#standin.recon',
+                                                                                            'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.throttle': ( 'src.standin.html#standin.throttle',
+                                                                                               'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.StandIn.write_tree': ( 'src.standin.html#standin.write_tree',
+                                                                                                 'HighResAnalysis/src/standin.py'),
+                                             'HighResAnalysis.src.standin.main': ( 'src.standin.html#main',
+                                                                                   'HighResAnalysis/src/standin.py')},
+            'HighResAnalysis.src.synthetic': { 'HighResAnalysis.src.synthetic.SyntheticRun': ( 'src.synthetic.html#syntheticrun',
+                                                                                               'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.Settings': ( 'src.synthetic.html#syntheticrun.settings',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.__init__': ( 'src.synthetic.html#syntheticrun.__init__',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.__repr__': ( 'src.synthetic.html#syntheticrun.__repr__',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.add_data': ( 'src.synthetic.html#syntheticrun.add_data',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.add_to_runlog': ( 'src.synthetic.html#syntheticrun.add_to_runlog',
+                                                                                                             'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.calibration_dir': ( 'src.synthetic.html#syntheticrun.calibration_dir',
+                                                                                                               'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.exists': ( 'src.synthetic.html#syntheticrun.exists',
+                                                                                                      'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.find_duts': ( 'src.synthetic.html#syntheticrun.find_duts',
+                                                                                                         'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.find_trim': ( 'src.synthetic.html#syntheticrun.find_trim',
+                                                                                                         'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.from_settings': ( 'src.synthetic.html#syntheticrun.from_settings',
+                                                                                                             'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.generate': ( 'src.synthetic.html#syntheticrun.generate',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.generate_plane': ( 'src.synthetic.html#syntheticrun.generate_plane',
+                                                                                                              'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.generate_tracks': ( 'src.synthetic.html#syntheticrun.generate_tracks',
+                                                                                                               'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.init_planes': ( 'src.synthetic.html#syntheticrun.init_planes',
+                                                                                                           'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.init_z': ( 'src.synthetic.html#syntheticrun.init_z',
+                                                                                                      'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.make_log': ( 'src.synthetic.html#syntheticrun.make_log',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.remove': ( 'src.synthetic.html#syntheticrun.remove',
+                                                                                                      'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.to_local': ( 'src.synthetic.html#syntheticrun.to_local',
+                                                                                                        'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.to_metric': ( 'src.synthetic.html#syntheticrun.to_metric',
+                                                                                                         'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.write': ( 'src.synthetic.html#syntheticrun.write',
+                                                                                                     'HighResAnalysis/src/synthetic.py'),
+                                               'HighResAnalysis.src.synthetic.SyntheticRun.write_raw': ( 'src.synthetic.html#syntheticrun.write_raw',
+                                                                                                         'HighResAnalysis/src/synthetic.py')},
             'HighResAnalysis.utility.affine_transformations': { 'HighResAnalysis.utility.affine_transformations.m_transform': ( 'utility.affine_transformations.html#m_transform',
                                                                                                                                 'HighResAnalysis/utility/affine_transformations.py'),
                                                                 'HighResAnalysis.utility.affine_transformations.matrix': ( 'utility.affine_transformations.html#matrix',
@@ -2200,6 +2548,124 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                               'HighResAnalysis/utility/affine_transformations.py'),
                                                                 'HighResAnalysis.utility.affine_transformations.transition_matrix': ( 'utility.affine_transformations.html#transition_matrix',
                                                                                                                                       'HighResAnalysis/utility/affine_transformations.py')},
+            'HighResAnalysis.utility.cache': { 'HighResAnalysis.utility.cache.MetaCache': ( 'utility.cache.html#metacache',
+                                                                                            'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.__contains__': ( 'utility.cache.html#metacache.__contains__',
+                                                                                                         'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.__init__': ( 'utility.cache.html#metacache.__init__',
+                                                                                                     'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.__repr__': ( 'utility.cache.html#metacache.__repr__',
+                                                                                                     'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.con': ( 'utility.cache.html#metacache.con',
+                                                                                                'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.decode': ( 'utility.cache.html#metacache.decode',
+                                                                                                   'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.encode': ( 'utility.cache.html#metacache.encode',
+                                                                                                   'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.evict': ( 'utility.cache.html#metacache.evict',
+                                                                                                  'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.flush': ( 'utility.cache.html#metacache.flush',
+                                                                                                  'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.flush_all': ( 'utility.cache.html#metacache.flush_all',
+                                                                                                      'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.from_path': ( 'utility.cache.html#metacache.from_path',
+                                                                                                      'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.get': ( 'utility.cache.html#metacache.get',
+                                                                                                'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.keys': ( 'utility.cache.html#metacache.keys',
+                                                                                                 'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.load': ( 'utility.cache.html#metacache.load',
+                                                                                                 'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.memo_drop': ( 'utility.cache.html#metacache.memo_drop',
+                                                                                                      'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.memo_get': ( 'utility.cache.html#metacache.memo_get',
+                                                                                                     'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.memo_put': ( 'utility.cache.html#metacache.memo_put',
+                                                                                                     'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.migrate': ( 'utility.cache.html#metacache.migrate',
+                                                                                                    'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.print_stats': ( 'utility.cache.html#metacache.print_stats',
+                                                                                                        'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.put': ( 'utility.cache.html#metacache.put',
+                                                                                                'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.remove': ( 'utility.cache.html#metacache.remove',
+                                                                                                   'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.size': ( 'utility.cache.html#metacache.size',
+                                                                                                 'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.sizes': ( 'utility.cache.html#metacache.sizes',
+                                                                                                  'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.stats': ( 'utility.cache.html#metacache.stats',
+                                                                                                  'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.total': ( 'utility.cache.html#metacache.total',
+                                                                                                  'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.use': ( 'utility.cache.html#metacache.use',
+                                                                                                'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.MetaCache.vacuum': ( 'utility.cache.html#metacache.vacuum',
+                                                                                                   'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.array_id': ( 'utility.cache.html#array_id',
+                                                                                           'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.combine_cid': ( 'utility.cache.html#combine_cid',
+                                                                                              'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.fast_hash': ( 'utility.cache.html#fast_hash',
+                                                                                            'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.get_cid': ( 'utility.cache.html#get_cid',
+                                                                                          'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.main': ( 'utility.cache.html#main',
+                                                                                       'HighResAnalysis/utility/cache.py'),
+                                               'HighResAnalysis.utility.cache.set_cid': ( 'utility.cache.html#set_cid',
+                                                                                          'HighResAnalysis/utility/cache.py')},
+            'HighResAnalysis.utility.profiler': { 'HighResAnalysis.utility.profiler.Profiler': ( 'utility.profiler.html#profiler',
+                                                                                                 'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler._stage': ( 'utility.profiler.html#profiler._stage',
+                                                                                                        'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.bytes_read': ( 'utility.profiler.html#profiler.bytes_read',
+                                                                                                            'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.export': ( 'utility.profiler.html#profiler.export',
+                                                                                                        'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.finish': ( 'utility.profiler.html#profiler.finish',
+                                                                                                        'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.fork': ( 'utility.profiler.html#profiler.fork',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.html': ( 'utility.profiler.html#profiler.html',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.merge': ( 'utility.profiler.html#profiler.merge',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.peak_rss': ( 'utility.profiler.html#profiler.peak_rss',
+                                                                                                          'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.rows': ( 'utility.profiler.html#profiler.rows',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.save': ( 'utility.profiler.html#profiler.save',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.show': ( 'utility.profiler.html#profiler.show',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.stage': ( 'utility.profiler.html#profiler.stage',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.start': ( 'utility.profiler.html#profiler.start',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.start_cprofile': ( 'utility.profiler.html#profiler.start_cprofile',
+                                                                                                                'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.state': ( 'utility.profiler.html#profiler.state',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Profiler.stop_cprofile': ( 'utility.profiler.html#profiler.stop_cprofile',
+                                                                                                               'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage': ( 'utility.profiler.html#stage',
+                                                                                              'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.__init__': ( 'utility.profiler.html#stage.__init__',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.__repr__': ( 'utility.profiler.html#stage.__repr__',
+                                                                                                       'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.add': ( 'utility.profiler.html#stage.add',
+                                                                                                  'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.child': ( 'utility.profiler.html#stage.child',
+                                                                                                    'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.merge': ( 'utility.profiler.html#stage.merge',
+                                                                                                    'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.to_dict': ( 'utility.profiler.html#stage.to_dict',
+                                                                                                      'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.Stage.walk': ( 'utility.profiler.html#stage.walk',
+                                                                                                   'HighResAnalysis/utility/profiler.py'),
+                                                  'HighResAnalysis.utility.profiler.profiled': ( 'utility.profiler.html#profiled',
+                                                                                                 'HighResAnalysis/utility/profiler.py')},
             'HighResAnalysis.utility.utils': { 'HighResAnalysis.utility.utils.EventSpeed': ( 'utility.utils.html#eventspeed',
                                                                                              'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.EventSpeed.__init__': ( 'utility.utils.html#eventspeed.__init__',
@@ -2214,6 +2680,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                                   'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.__setstate__': ( 'utility.utils.html#pbar.__setstate__',
                                                                                                     'HighResAnalysis/utility/utils.py'),
+                                               'HighResAnalysis.utility.utils.PBar.attach': ( 'utility.utils.html#pbar.attach',
+                                                                                              'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.eta': ( 'utility.utils.html#pbar.eta',
                                                                                            'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.finish': ( 'utility.utils.html#pbar.finish',
@@ -2222,12 +2690,20 @@ d = { 'settings': { 'branch': 'master',
                                                                                                     'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.is_finished': ( 'utility.utils.html#pbar.is_finished',
                                                                                                    'HighResAnalysis/utility/utils.py'),
+                                               'HighResAnalysis.utility.utils.PBar.refresh': ( 'utility.utils.html#pbar.refresh',
+                                                                                               'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.set_last': ( 'utility.utils.html#pbar.set_last',
                                                                                                 'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.start': ( 'utility.utils.html#pbar.start',
                                                                                              'HighResAnalysis/utility/utils.py'),
+                                               'HighResAnalysis.utility.utils.PBar.tick': ( 'utility.utils.html#pbar.tick',
+                                                                                            'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.PBar.update': ( 'utility.utils.html#pbar.update',
                                                                                               'HighResAnalysis/utility/utils.py'),
+                                               'HighResAnalysis.utility.utils.PBar.value': ( 'utility.utils.html#pbar.value',
+                                                                                             'HighResAnalysis/utility/utils.py'),
+                                               'HighResAnalysis.utility.utils.PBar.wait': ( 'utility.utils.html#pbar.wait',
+                                                                                            'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils._parallel': ( 'utility.utils.html#_parallel',
                                                                                             'HighResAnalysis/utility/utils.py'),
                                                'HighResAnalysis.utility.utils.average_list': ( 'utility.utils.html#average_list',
@@ -20,9 +20,8 @@ from .src.batch_analysis import BatchAnalysis
 from .src.run import load_nrs
 from .src.scan import Ensemble, Scan, VScan, TScan
 from .utility.utils import *  # noqa
-from .src.spreadsheet import make
 from .plotting.utils import load_json
-from nbdev.showdoc import *
+from .utility.profiler import Profiler
 
 from fastcore.script import *
 
@@ -35,19 +34,28 @@ def analyse(test:bool=False, # Test run. Nothing is converted. Just initialize t
              verbose:bool=False, # Verbosity
              remove_meta:bool=False, # Removes meta files
              convert:bool=False, # Removes current analysis files and reconverts from the raw files
-             test_campaign:str=Analysis.find_testcampaign(), # Test campaign in the YYYYMM format, for example 201912
-             run:str=Analysis.Config.get_value('data', 'default run'), # Run number or batch id or scan id
-             dut:int=Analysis.Config.get_value('data', 'default dut', default=0), # DUT number in the telescope
+             test_campaign:str=None, # Test campaign in the YYYYMM format, for example 201912, by default from the working directory or the config
+             run:str=None, # Run number or batch id or scan id, by default from the config
+             dut:int=None, # DUT number in the telescope, by default from the config
              batch:str=None, # Batch name
+             profile:bool=False, # Records time, memory and bytes read of the analysis stages and writes a report to profiles/ at exit
+             cprofile:bool=False, # Dumps the cProfile statistics of the slowest stage (with --profile)
              run_plan:str=None # Create new runplan.json for beam test <YYYYMM>
            ):
     "runs the whole chain of data conversion, reconstruction, datastream merge and their alignment, telescope alignment and preliminary analysis starting from raw data and ending up with hdf5 files"
+    test_campaign = choose(test_campaign, Analysis.find_testcampaign)  # the config is only loaded when the script runs
+    run = Analysis.Config.get_value('data', 'default run') if run is None else run
+    dut = Analysis.Config.get_value('data', 'default dut', default=0) if dut is None else dut
     print(f'test: {test}, verbose: {verbose}, remove_meta: {remove_meta}, convert: {convert}, test_campaign: {test_campaign}, run: {run}, dut: {dut}, batch: {batch}, run_plan: {run_plan}')
     
     # Only make a run plan
     if run_plan is not None:
+        from HighResAnalysis.src.spreadsheet import make
         make(run_plan)
         exit(2)
+
+    if profile:
+        Profiler.start(f'analyse-{run}', cprofile)
     
     # The scans consist of an ensemble of runs of batches of runs 
     scans = load_json(Ensemble.FilePath)
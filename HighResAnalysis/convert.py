@@ -13,6 +13,7 @@ import uproot
 from .src.run import init_batch
 from .plotting.utils import choose, info, colored, GREEN, RED, check_call, critical, warning
 from .utility.utils import print_banner, PBAR, small_banner, byte2str
+from .utility.profiler import Profiler, profiled
 from .src.analysis import Analysis
 from .src.converter import Converter
 from .cern.converter import CERNConverter
@@ -56,6 +57,7 @@ class AutoConvert:
     def last_run(self):
         return choose(self.LastRun, self.Batch.max_run)
 
+    @profiled('copy raw files')
     def copy_raw_files(self):
         conv = self.converters
         n_missing = sum([not f.exists() for c in conv for f in c.raw_files])
@@ -69,7 +71,9 @@ class AutoConvert:
 
     @staticmethod
     def convert_run(c: Converter):
-        c.run(force=AutoConvert.Force)
+        with Profiler.stage(f'run {c.Run}') as s:
+            c.run(force=AutoConvert.Force)
+        c.Profile = Profiler.export(s)  # the stages of the worker process
         return c
 
     def run(self):
@@ -79,9 +83,11 @@ class AutoConvert:
             return True
         self.copy_raw_files()
         info(f'Creating pool with {cpu_count()} processes')
-        with Pool() as pool:
+        with Pool(initializer=Profiler.fork) as pool:
             result = pool.map_async(self.convert_run, conv)
             conv = result.get()
+            for c in conv:
+                Profiler.merge(c.Profile)
             small_banner('Summary:')
             for c in conv:
                 speed = f'{c.Run.n_ev}, {c.Run.n_ev / c.T1.total_seconds():1.0f} Events/s' if c.finished else 'NOT CONVERTED!'
@@ -99,7 +105,9 @@ class BatchConvert(AutoConvert):
     @staticmethod
     def convert_run(c: Converter):
         f, out = c.Proteus.Steps[-1]
-        c.run(force=True, steps=c.first_steps + [(partial(f, progress=False), out)], rm=False)
+        with Profiler.stage(f'run {c.Run}') as s:
+            c.run(force=True, steps=c.first_steps + [(partial(f, progress=False), out)], rm=False)
+        c.Profile = Profiler.export(s)
         return c
 
     @property
@@ -159,11 +167,13 @@ class BatchConvert(AutoConvert):
         else:
             info(f'found {out}')
 
+    @profiled('merge files')
     def merge_files(self):
         self.merge_proteus_files()
         if self.Converter.trigger_info_file() != self.Converter.proteus_raw_file_path():
             self.merge_trigger_info_files()
 
+    @profiled('fix event numbers')
     def fix_event_nrs(self):
         """fix the events numbers in the merged hdf5 file"""
         n_ev = [uproot.open(c.trigger_info_file())['Event'].num_entries for c in self.Converters]  # number of events for each run
@@ -76,11 +76,15 @@ class DUTCut(Cuts):
         if self.Ana.REF is not None:
             self.register('res', self.make_ref_residual(redo=redo), 60, 'small residuals to REF plane')
         self.register('tp', self.make_trigger_phase(_redo=redo), 40, 'trigger phase')
-        self.register('tstart', self.make_start_time(_redo=redo), 35, 'exclude first events')
-        self.register('chi2', self.make_chi2(_redo=redo), 50, f'small chi2 < q({self.get_config("chi2 quantile", dtype=float)})')
-        self.register('slope', self.make_slope(_redo=redo), 55, f'straight tracks < q({self.get_config("slope quantile", dtype=float)})')
+        self.register('tstart', self.shared('tstart', self.make_start_time, 'start time', redo), 35, 'exclude first events')
+        self.register('chi2', self.shared('chi2', self.make_chi2, 'chi2 quantile', redo), 50, f'small chi2 < q({self.get_config("chi2 quantile", dtype=float)})')
+        self.register('slope', self.shared('slope', self.make_slope, 'slope quantile', redo), 55, f'straight tracks < q({self.get_config("slope quantile", dtype=float)})')
         self.register('cs', self.make_cluster_size(_redo=redo), 56, f'cluster size <= {self.get_config("max cluster size")}')
 
+    def shared(self, name, f, cfg, redo=False):
+        """:returns the track or event space cut [name] of [f], which only depends on the config option [cfg], shared by all analyses of the run"""
+        return self.Ana.Context((name, str(self.get_config(cfg))), lambda: f(_redo=redo), _redo=redo)
+
     # ----------------------------------------
     # region GENERATE
     @save_cut('Fid', suf_args='all', cfg='fiducial', cfield='MetaSubDir')
@@ -129,9 +133,13 @@ class DUTCut(Cuts):
         return (tp >= low) & (tp <= high)
 
     @save_cut('Clu', suf_args='all')
-    def make_cluster(self, pl=None, _redo=False):
+    def make_cluster_(self, pl=None, _redo=False):
         return self.Ana.get_cluster_size(cut=False, pl=pl) > 0
 
+    def make_cluster(self, pl=None, _redo=False):
+        """:returns the tracks with a cluster in plane [pl], shared by all analyses of the run"""
+        return self.Ana.Context(('Clu', self.Ana.plane(pl).Number), lambda: self.make_cluster_(pl, _redo=_redo), _redo=_redo)
+
     def make_cs(self, n=1, pl=None):
         return self.Ana.get_cluster_size(cut=0, pl=pl) == n
 
@@ -281,7 +289,7 @@ class DUTCut(Cuts):
         self.get_res(**prep_kw(dkw, show=True))
 
     def get_track_events(self):
-        return array(self.Ana.F['Tracks']['Events'])
+        return self.Ana.Context(('TrackEvents',), lambda: array(self.Ana.F['Tracks']['Events']))
 
     def make_ev(self, ev, n=None):
         c = zeros(choose(n, self.Ana.NEvents), '?')
@@ -319,6 +327,10 @@ class DUTCut(Cuts):
     def to_trk(cut):
         return -1 if type(cut) is bool or cut is ... else cut
 
+    @property
+    def MetaDir(self):
+        return self.Ana.MetaDir
+
     def make_hdf5_path(self, *args, **kwargs):
         return self.Ana.make_hdf5_path(*args, **prep_kw(kwargs, sub_dir=self.MetaSubDir))
 
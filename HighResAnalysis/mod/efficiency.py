@@ -22,6 +22,8 @@ def eff_analysis(cls):
         ZArgs = {'z_tit': 'Efficiency [%]', 'z_range': [0, 100]}
 
         def __init__(self, parent: DUTAnalysis):  # noqa
+
+            self.Parent = parent
             self.__dict__.update(parent.__dict__)
             self.MetaSubDir = 'Eff'
             self.Cut = self.Tracks.Cut
@@ -39,7 +41,7 @@ def eff_analysis(cls):
             return (self.get_cluster_size(cut=cut).astype('?') * 100).astype('d')
 
         def segment_values(self, nx=2, ny=3, cut=None):
-            return hist_values_2d(self.draw_map(local=True, cut=cut, binning=bins.make2d(*self.segments(nx, ny)), save=False), err=False, flat=False)
+            return self.segment_stats(nx, ny, self.pvalues, self.Cut.get_nofid(cut))['mean']
 
         # ----------------------------------------
         # region DRAW
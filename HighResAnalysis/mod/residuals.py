@@ -7,7 +7,7 @@ __all__ = ['res_analysis']
 #!/usr/bin/env python  
 
 # %% ../../nbs/21_mod.residuals.ipynb 3
-from numpy import arctan, sqrt, array, quantile, mean, polyfit, identity, arange
+from numpy import arctan, sqrt, array, quantile, mean, polyfit, identity, arange, nan
 from functools import partial
 from uncertainties import ufloat
 
@@ -15,7 +15,7 @@ import HighResAnalysis.src.bins as bins
 
 from ..src.dut_analysis import DUTAnalysis, no_trans
 from ..plotting.utils import choose, prep_kw
-from ..plotting.fit import Gauss, FitRes
+from ..plotting.fit import Gauss, FitRes, batch_fit
 from ..plotting.draw import np_profile, set_x_range, ax_range
 from ..utility.utils import PBAR, uarr2n, save_pickle
 from ..utility.affine_transformations import transform, m_transform, matrix, scale_matrix, inv
@@ -81,7 +81,9 @@ def res_analysis(cls):
         @save_pickle('ResFit', suf_args='all', field='DUT')
         def fit(self, local=False, cut=None, pl=None, _redo=False):
             """Fit the residual distributions with a Gaussian. The distributions are usually not Gaussian shaped though..."""
-            return array([Gauss(f(show=False, cut=cut, pl=pl), thresh=.05).fit()[1:] for f in ([self.draw_x, self.draw_y] if local else [self.draw_u, self.draw_v])]) / (1 if local else 1e3)
+            h = [f(show=False, cut=cut, pl=pl) for f in ([self.draw_x, self.draw_y] if local else [self.draw_u, self.draw_v])]
+            fits = batch_fit(h, Gauss, nproc=1, redo=_redo, thresh=.05)
+            return array([[ufloat(nan, nan)] * 2 if r is None else r[1:] for r in fits]) / (1 if local else 1e3)  # nan for failed fits
 
         @staticmethod
         def mean_std(f, cut=None, pl=None, thresh=.3, rf=0.):
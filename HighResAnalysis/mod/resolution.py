@@ -19,7 +19,7 @@ from .residuals import res_analysis
 
 from uncertainties.umath import sqrt as usqrt # noqa
 from uncertainties import ufloat
-from numpy import linspace, array, tile
+from numpy import linspace, array, tile, quantile, searchsorted, minimum, sqrt
 
 # %% ../../nbs/25_mod.resolution.ipynb 5
 def reso_analysis(cls):
@@ -50,6 +50,29 @@ def reso_analysis(cls):
             self.Cut.set_slope(slope)
             return usqrt(mean_sigma(self.Residuals.dy())[1] ** 2 - 1 / 12) * self.Plane.PY * 1e3
 
+        def threshold_levels(self, q, var='chi2', cut=None):
+            """:returns for every cluster the index of the first quantile [q] (increasing) at which it passes the cut on [var] for 'chi2' (growing selections)
+               and the number of quantiles at which it passes for 'slope' (shrinking selections, q < .5)"""
+            if var == 'chi2':  # chi2 < quantile(chi2, q)
+                return searchsorted(quantile(self.get_chi2(cut=False), q), self.get_chi2(cut=cut), 'right')
+            k = [searchsorted(quantile(f(cut=False), q), f(cut=cut), 'left') for f in [self.get_slope_x, self.get_slope_y]]  # slope > quantile(slope, q)
+            k += [searchsorted(-quantile(f(cut=False), 1 - q), -f(cut=cut), 'left') for f in [self.get_slope_x, self.get_slope_y]]  # slope < quantile(slope, 1 - q)
+            return minimum.reduce(k)
+
+        def scan(self, q, var='chi2', y=False, cut=None):
+            """:returns the resolution [um] in x (or [y]) for every quantile [q] of the cut on [var] ('chi2' or 'slope').
+               The clusters are grouped once by the threshold at which they pass, so the scan costs about one residual computation."""
+            cut = self.Cut.exclude(var, cut)
+            m = bins.nested_moments(self.threshold_levels(q, var, cut), self.Residuals.dy(cut) if y else self.Residuals.dx(cut), len(q), shrink=var == 'slope')
+            s2 = [ufloat(s, s / sqrt(2 * n)) ** 2 if n > 1 else None for n, s in zip(m['n'], m['sigma'])]  # no resolution without entries
+            r = [ufloat(0, 0) if v is None else usqrt(v - 1 / 12 if y else max(ufloat(1 / 12, 0), v) - 1 / 12) for v in s2]
+            return array(r) * (self.Plane.PY if y else self.Plane.PX) * 1e3
+
+        @update_pbar
+        def scan_slope(self, q, chi2):
+            """:returns the slope scan of [q] at the [chi2] quantile"""
+            return self.scan(q, 'slope', cut=self.Cut.exclude(['chi2', 'slope']) & self.Cut(cut=False, data=self.Cut.make_chi2(chi2, _save=False)))
+
         def draw_x(self, **dkw):
             return self.Residuals.draw_x(**prep_kw(dkw, lf=.5, rf=.5, stats=set_statbox(all_stat=True, form='.2f')))
 
@@ -73,18 +96,16 @@ def reso_analysis(cls):
 
         def draw_x_vs_chi2(self, n=20):
             x = linspace(1 / n, 1, n)
-            PBAR.start(n)
-            self.Draw.graph(x, [self.x(i) for i in x])
+            self.Draw.graph(x, self.scan(x, 'chi2'))
 
         def draw_x_vs_slope(self, n=20):
             x = linspace(0, .5 - .5 / n, n)
-            PBAR.start(n)
-            self.Draw.graph(x, [self.x(slope=i) for i in x])
+            self.Draw.graph(x, self.scan(x, 'slope'))
 
         def draw_x_vs_pars(self, n=10):
             x, y = linspace(.5 / n, .5, n), linspace(.1, .4, n)
-            PBAR.start(n ** 2)
-            d = array([[self.x(i, j) for j in y] for i in x])
+            PBAR.start(n)
+            d = array([self.scan_slope(y, i) for i in x])
             self.Draw.prof2d(x.repeat(10), tile(y, 10), d.flatten(), bins.from_p(x) + bins.from_p(y))
             return d
 
@@ -34,9 +34,9 @@ class TrackCut(DUTCut):
         if not hasattr(self.Ana, 'IsRef'):
             self.register('fid', self.make_fiducial(redo=redo), 30, 'tracks in fiducial area')
         self.register('mask', self.make_mask(_redo=redo), 31, 'masked pixels for tracks')
-        self.register('tstart', self.make_start_time(_redo=redo), 40, 'exclude first events')
-        self.register('chi2', self.make_chi2(_redo=redo), 50, f'chi2 < {100 * self.get_config("chi2 quantile", dtype=float)}%q')
-        self.register('slope', self.make_slope(_redo=redo), 88, '{}%q < slope < {}%q'.format(*100 * abs(array([0, 1]) - self.get_config('slope quantile', dtype=float))))
+        self.register('tstart', self.shared('tstart', self.make_start_time, 'start time', redo), 40, 'exclude first events')
+        self.register('chi2', self.shared('chi2', self.make_chi2, 'chi2 quantile', redo), 50, f'chi2 < {100 * self.get_config("chi2 quantile", dtype=float)}%q')
+        self.register('slope', self.shared('slope', self.make_slope, 'slope quantile', redo), 88, '{}%q < slope < {}%q'.format(*100 * abs(array([0, 1]) - self.get_config('slope quantile', dtype=float))))
 
     def make_trk(self, trks):
         return self.make_ev(trks, self.Ana.NTracks)
@@ -3,10 +3,11 @@
 # %% auto 0
 __all__ = ['freedman_diaconis', 'width', 'n', 'increase_range', 'entries', 'single_entries_2d', 'entries_2d', 'from_uvec',
            'from_vec', 'from_p', 'make', 'make2d', 'find_range', 'find', 'find_2d', 'hn', 'from_hist', 'hx', 'hy',
-           'h2d', 'h2dgrid', 'set_2d_values', 'set_2d_entries']
+           'h2d', 'h2dgrid', 'set_2d_values', 'set_2d_entries', 'segment_reduce', 'slice_correlation',
+           'slice_correlations', 'nested_moments']
 
 # %% ../../nbs/03_plotting.binning.ipynb 1
-from numpy import array, append, arange, linspace, diff, isfinite, quantile, ceil, all
+from numpy import array, append, arange, linspace, diff, isfinite, quantile, ceil, all, bincount, digitize, sqrt, zeros, where, nan, errstate
 from .utils import choose, is_iter, mean_sigma
 from uncertainties import ufloat
 
@@ -141,3 +142,69 @@ def set_2d_entries(h, arr):
     [h.SetBinEntries((nx + 2) * (iy + 1) + (ix + 1), arr[iy, ix]) for ix in range(nx) for iy in range(ny)]
 # endregion HISTOGRAM
 # ----------------------------------------
+
+# %% ../../nbs/03_plotting.binning.ipynb 26
+# ----------------------------------------
+# region REDUCE
+def segment_reduce(x, y, v, sx, sy):
+    """groups the values [v] by the 2D segments with edges [sx], [sy] (bins are [low, high) like in ROOT)
+       :returns structured array with shape (ny, nx) with the segment centres, the number of entries, the mean of [v] with its error
+                (spread / sqrt(n) as for a TProfile) and the efficiency (fraction of non-zero values) in %"""
+    sx, sy, v = array(sx, 'd'), array(sy, 'd'), array(v, 'd')
+    nx, ny = sx.size - 1, sy.size - 1
+    ix, iy = digitize(x, sx) - 1, digitize(y, sy) - 1
+    sel = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+    i = iy[sel] * nx + ix[sel]
+    cnt, s, s2, k = [bincount(i, weights=w, minlength=nx * ny) for w in [None, v[sel], v[sel] ** 2, v[sel] != 0]]
+    c = cnt.clip(1)  # avoid division by zero in empty segments
+    m = s / c
+    r = zeros(nx * ny, dtype=[('x', 'd'), ('y', 'd'), ('n', 'i8'), ('mean', 'd'), ('err', 'd'), ('eff', 'd')])
+    r['x'], r['y'] = [(e[:-1] + diff(e) / 2)[j] for e, j in [(sx, arange(nx * ny) % nx), (sy, arange(nx * ny) // nx)]]
+    r['n'], r['mean'], r['err'], r['eff'] = cnt, m, sqrt((s2 / c - m ** 2).clip(0) / c), 100 * k / c
+    return r.reshape(ny, nx)
+
+# %% ../../nbs/03_plotting.binning.ipynb 27
+def slice_correlation(t, x, y, edges, chunk=2 ** 22):
+    """streams over the values [x], [y] in chunks of size [chunk] and accumulates the sums of x, y, x², y² and xy in each slice of [t] with [edges]
+       :returns structured array with the slice centres, the number of entries and the correlation factor (nan for slices with less than 3 entries)"""
+    return slice_correlations(((t[i:i + chunk], x[i:i + chunk], y[i:i + chunk]) for i in range(0, len(t), chunk)), edges)[0]
+
+
+def slice_correlations(chunks, edges, k=1):
+    """accumulates the sums of x, y, x², y² and xy in each slice of t with [edges] for [k] pairs of variables over the [chunks] (t, x, y),
+       where x and y hold the k variables of the chunk as rows. Only one chunk has to be in memory, so the chunks may be read from a file.
+       :returns a structured array as in `slice_correlation` for every pair"""
+    edges, n = array(edges, 'd'), len(edges) - 1
+    s, o = zeros((k, 6, n)), None
+    for t, x, y in chunks:
+        x, y = array(x, 'd').reshape(k, -1), array(y, 'd').reshape(k, -1)
+        if not x.shape[1]:
+            continue
+        o = (x.mean(1, keepdims=True), y.mean(1, keepdims=True)) if o is None else o  # shift the values for numerical stability
+        j = digitize(t, edges) - 1
+        sel = (j >= 0) & (j < n)
+        j, x, y = j[sel], x[:, sel] - o[0], y[:, sel] - o[1]
+        for i in range(k):
+            s[i] += [bincount(j, weights=w, minlength=n) for w in [None, x[i], y[i], x[i] * x[i], y[i] * y[i], x[i] * y[i]]]
+    r = zeros((k, n), dtype=[('t', 'd'), ('n', 'i8'), ('corr', 'd')])
+    for i, (c, sx, sy, sxx, syy, sxy) in enumerate(s):
+        cov, vx, vy = c * sxy - sx * sy, c * sxx - sx ** 2, c * syy - sy ** 2
+        r[i]['t'], r[i]['n'] = edges[:-1] + diff(edges) / 2, c
+        with errstate(divide='ignore', invalid='ignore'):
+            r[i]['corr'] = where((c > 2) & (vx > 0) & (vy > 0), cov / sqrt(vx * vy), nan)
+    return r
+
+# %% ../../nbs/03_plotting.binning.ipynb 28
+def nested_moments(k, v, n, shrink=False):
+    """computes the moments of [v] for [n] nested selections in one pass. Entry i is in selection j if j >= k[i] (growing selections) or j < k[i] if [shrink].
+       :returns structured array with the number of entries, the mean and the standard deviation (as in mean_sigma) of every selection"""
+    v = array(v, 'd')
+    v0 = v.mean() if v.size else 0  # shift the values for numerical stability
+    c, s, s2 = [bincount(k.clip(0, n), weights=w, minlength=n + 1) for w in [None, v - v0, (v - v0) ** 2]]
+    c, s, s2 = [a[::-1].cumsum()[::-1][1:] if shrink else a.cumsum()[:-1] for a in [c, s, s2]]
+    r = zeros(n, dtype=[('n', 'i8'), ('mean', 'd'), ('sigma', 'd')])
+    with errstate(divide='ignore', invalid='ignore'):
+        r['n'], r['mean'], r['sigma'] = c, where(c > 0, s / c, nan) + v0, sqrt(where(c > 1, (s2 - s ** 2 / c) / (c - 1), nan).clip(0))
+    return r
+# endregion REDUCE
+# ----------------------------------------
@@ -37,6 +37,7 @@ from scipy.stats import binned_statistic
 from screeninfo import get_monitors, Monitor, common
 from numpy import array, zeros, mean, sqrt, where
 from uncertainties import ufloat
+from uncertainties.core import Variable, AffineScalarFunc
 
 import HighResAnalysis.plotting.binning as bins
 from .binning import increase_range, quantile
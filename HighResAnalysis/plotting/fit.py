@@ -1,20 +1,26 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/04_plotting.fit.ipynb.
 
 # %% auto 0
-__all__ = ['Fit', 'make_fit', 'PoissonI', 'Expo', 'gauss', 'Gauss', 'Landau', 'Erf', 'crystalball', 'Crystalball', 'erfland',
-           'ErfLand', 'Langau', 'NLandau', 'langau', 'langaupro', 'main']
+__all__ = ['FitCache', 'FitCacheSize', 'Fit', 'make_fit', 'PoissonI', 'Expo', 'gauss', 'Gauss', 'Landau', 'Erf', 'crystalball',
+           'Crystalball', 'erfland', 'ErfLand', 'Langau', 'NLandau', 'langau', 'langau_tf1', 'langaupro', 'hist_state',
+           'state_hash', 'batch_fit', 'main']
 
 # %% ../../nbs/04_plotting.fit.ipynb 2
 #!/usr/bin/env python
+import ROOT
 from ROOT import TF1, Math, TMath, TH1F
-from numpy import exp, array, mean, sqrt, where, sign
+from numpy import exp, array, mean, sqrt, where, sign, pi, linspace, ndarray, histogram
 from scipy.special import erf
 from os.path import join
 from functools import partial
+from hashlib import md5
+from multiprocessing import Pool, cpu_count
 from fastcore.script import *
 from fastcore.basics import patch
 from .draw import *
-from .utils import BaseDir, choose, prep_kw, do_nothing
+from .utils import choose, prep_kw, do_nothing, warning
+from ..utility.utils import Dir
+from ..utility.profiler import profiled
 from uncertainties import ufloat
 from inspect import signature
 
@@ -29,7 +35,7 @@ class Fit(object):
                  par_names=None): # List of parameter names of the fitting function
         self.Name = name
         self.Histo = h
-        self.Draw = Draw(join(BaseDir, 'config', 'main.ini'))
+        self.Draw = Draw(Dir.joinpath('config', 'main.ini'))  # the main config of the analysis dir
 
         # Range and Values
         self.XMin, self.XMax = choose(fit_range, self.find_fit_range)
@@ -164,6 +170,7 @@ def print_parameters(self:Fit):
 
 # %% ../../nbs/04_plotting.fit.ipynb 32
 @patch
+@profiled('fit')
 def fit(self:Fit, 
         n:int=1, # number of iterations 
         draw=True, # Overlay the fitting function on histogram
@@ -414,7 +421,7 @@ class Langau(Fit):
         self.XMin, self.XMax = [k * self.Histo.GetMean() for k in [.1, 3]] if fit_range is None else fit_range
 
     def init_fit(self):
-        return Draw.make_tf1(self.Name, langau, 0, self.get_x_max() * 3, [1] * self.NPars, nconv=self.NConvolutions, nsigma=self.NSigma)
+        return langau_tf1(self.Name, 0, self.get_x_max() * 3, self.NConvolutions, self.NSigma)
 
     def get_par_names(self):
         return ['Width', 'MPV', 'Area', 'GSigma']
@@ -520,7 +527,39 @@ def langau(x:float,       # independent variable
 
     return pars[2] * step * sum_int / sqrt(2 * pi) / pars[3]
 
-# %% ../../nbs/04_plotting.fit.ipynb 52
+# %% ../../nbs/04_plotting.fit.ipynb 53
+ROOT.gInterpreter.Declare("""
+namespace hra {
+    struct LangauConv {
+        int NConv;
+        double NSigma;
+        LangauConv(int nconv, double nsigma) : NConv(nconv), NSigma(nsigma) {}
+        double operator()(const double *x, const double *par) const {
+            const double mpc = par[1] + 0.22278298 * par[0];  // MP shift correction
+            const double xlow = x[0] - NSigma * par[3], step = 2 * NSigma * par[3] / NConv;
+            double sum = 0.;
+            for (int i = 0; i < NConv; ++i) {
+                const double xx = xlow + (i + .5) * step;
+                sum += TMath::Landau(xx, mpc, par[0]) / par[0] * TMath::Gaus(x[0], xx, par[3]);
+            }
+            return par[2] * step * sum / sqrt(2 * TMath::Pi()) / par[3];
+        }
+    };
+    TF1 *langau_tf1(const char *name, double xmin, double xmax, int nconv, double nsigma) {
+        return new TF1(name, LangauConv(nconv, nsigma), xmin, xmax, 4);
+    }
+}""") if not hasattr(ROOT, 'hra') else do_nothing()
+
+# %% ../../nbs/04_plotting.fit.ipynb 54
+def langau_tf1(name:str,        # name of the TF1
+               xmin:float,      # lower range of the function
+               xmax:float,      # upper range of the function
+               nconv:int=100,   # number of convolutions
+               nsigma:float=5): # number of sigmas, extent of the convolution intergral
+    "returns a `TF1` of the Landau Gaussian convolution (same parameters as `langau`) which is evaluated in compiled C++"
+    return Draw.add(ROOT.hra.langau_tf1(name, xmin, xmax, int(nconv), float(nsigma)))
+
+# %% ../../nbs/04_plotting.fit.ipynb 55
 def langaupro(params, maxx, FWHM):
 
     """
@@ -615,7 +654,73 @@ def langaupro(params, maxx, FWHM):
     FWHM = fxr - fxl
     return (0)
 
-# %% ../../nbs/04_plotting.fit.ipynb 53
+# %% ../../nbs/04_plotting.fit.ipynb 59
+FitCache = {}  # fit results by hash of the fit class, its arguments and the histogram
+FitCacheSize = 1000  # maximum number of cached fit results, the oldest are dropped first
+
+# %% ../../nbs/04_plotting.fit.ipynb 60
+def hist_state(h,            # 1D histogram or an array of raw values
+               bins='auto'): # bins for raw values, see `numpy.histogram`
+    "returns the bin edges, contents and errors of a histogram or of the histogrammed raw values"
+    if isinstance(h, ndarray):
+        v, e = histogram(h, bins)
+        return e.astype('d'), v.astype('d'), sqrt(v)
+    n = h.GetNbinsX()
+    e = array([h.GetBinLowEdge(i) for i in range(1, n + 2)], 'd')
+    return e, array([h.GetBinContent(i) for i in range(1, n + 1)], 'd'), array([h.GetBinError(i) for i in range(1, n + 1)], 'd')
+
+# %% ../../nbs/04_plotting.fit.ipynb 61
+def state_hash(fcls, state, fkw:dict) -> str:
+    "returns the hash of the fit class, its arguments and the histogram state"
+    m = md5(f'{fcls.__module__}.{fcls.__name__}{sorted(fkw.items())}'.encode())
+    for a in state:
+        m.update(a.tobytes())
+    return m.hexdigest()
+
+# %% ../../nbs/04_plotting.fit.ipynb 62
+def _batch_fit(fcls, state, name, fkw):
+    "fits a single histogram state, returns the exception instead of raising it"
+    try:
+        e, v, err = state
+        h = TH1F(name, name, e.size - 1, e)
+        h.SetDirectory(0)
+        for i in range(v.size):
+            h.SetBinContent(i + 1, v[i])
+            h.SetBinError(i + 1, err[i])
+        h.SetEntries(v.sum())
+        return fcls(h, **fkw).fit(draw=False)
+    except Exception as err:
+        return err
+
+# %% ../../nbs/04_plotting.fit.ipynb 63
+def batch_fit(hs,            # list of 1D histograms or arrays of raw values
+              fcls=Gauss,    # `Fit` class used for every histogram
+              nproc=None,    # number of processes, defaults to the number of cores, 1 fits in the current process
+              bins='auto',   # bins for raw values, see `numpy.histogram`
+              redo=False,    # ignore cached results
+              **fkw) -> list: # keyword arguments for the fit class
+    "fits all histograms with `fcls` in a process pool and returns a list of `FitRes` (`None` for failed fits)"
+    states = [hist_state(h, bins) for h in hs]
+    keys = [state_hash(fcls, s, fkw) for s in states]
+    todo = {k: s for k, s in zip(keys, states) if redo or k not in FitCache}  # fit identical histograms only once
+    nproc = min(choose(nproc, cpu_count()), len(todo))
+    args = [(fcls, s, f'h_batch_{k[:8]}', fkw) for k, s in todo.items()]
+    if nproc > 1:
+        with Pool(nproc) as pool:
+            res = pool.starmap(_batch_fit, args)
+    else:
+        res = [_batch_fit(*a) for a in args]
+    for k, r in zip(todo, res):
+        if isinstance(r, Exception):
+            warning(f'{fcls.__name__} fit of histogram {keys.index(k)} failed: {r!r}')
+            r = None
+        FitCache[k] = r
+    res = [FitCache[k] for k in keys]
+    for k in list(FitCache)[:max(0, len(FitCache) - FitCacheSize)]:
+        del FitCache[k]
+    return res
+
+# %% ../../nbs/04_plotting.fit.ipynb 64
 @call_parse
 def main():
     z = Crystalball(fit_range=[-10, 20])
@@ -7,30 +7,52 @@ __all__ = ['SaveDraw', 'main']
 #!/usr/bin/env python
 
 # %% ../../nbs/02_plotting.save.ipynb 3
-from ROOT import TFile
+from ROOT import TFile, gROOT
 from fastcore.script import *
 from os.path import join
 from . import html
 from .draw import *
 from .utils import *
 from .utils import BaseDir
+from ..utility.profiler import Profiler, profiled
 from pathlib import Path
+from atexit import register
+from pickle import dumps, loads
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 # %% ../../nbs/02_plotting.save.ipynb 4
+def _export(data:bytes, paths:list, pal):
+    "saves the pickled canvas `data` to all `paths`, runs in the export processes of `SaveDraw`"
+    gROOT.SetBatch(True)
+    set_root_warnings(False)
+    set_palette(pal)
+    c = loads(data)
+    for p in paths:
+        c.SaveAs(p)
+        if not Path(p).exists():
+            raise OSError(f'could not save {p}')
+    return paths
+
+# %% ../../nbs/02_plotting.save.ipynb 5
 class SaveDraw(Draw):
 
     Save = True
     SaveOnServer = True
 
     ServerMountDir: Path = None
-    Dummy = TFile(str(Draw.Dir.joinpath('dummy.root')), 'RECREATE')
+    Dummy: TFile = None  # file to return to after writing on the server, created on first use
+
+    Exporter: ProcessPoolExecutor = None  # background processes which render the plot files
+    Pending = []  # futures of the exports in progress
+
+    Files = {}  # ROOT files on the server opened in UPDATE mode, one per path for all instances
+    HTML = {}  # html pages (with their palette) of every ROOT file which are created at flush
+    Flush = None  # exit hook, registered with the first instance
 
     def __init__(self, analysis=None, results_dir=None, sub_dir=''):
         self.Analysis = analysis
         super(SaveDraw, self).__init__(self.find_config())
 
-        self.File = None
-
         # INFO
         SaveDraw.Save = Draw.Config.get_value('SAVE', 'save', default=False)
 
@@ -40,12 +62,20 @@ class SaveDraw(Draw):
 
         # Server
         SaveDraw.ServerMountDir = Path(Draw.Config.get_value('SAVE', 'server mount directory', default=None)).expanduser()
+        if SaveDraw.Flush is None:
+            SaveDraw.Flush = register(SaveDraw.flush)
 
     def __del__(self):
         remove_file(join(self.Dir, 'dummy.root'), warn=False)
 
     # ----------------------------------------
     # region INIT
+    @staticmethod
+    def dummy():
+        if SaveDraw.Dummy is None:
+            SaveDraw.Dummy = TFile(str(Draw.Dir.joinpath('dummy.root')), 'RECREATE')
+        return SaveDraw.Dummy
+
     def find_config(self):
         if hasattr(self.Analysis, 'MainConfig'):
             return self.Analysis.MainConfig.FilePath
@@ -71,33 +101,30 @@ class SaveDraw(Draw):
     def file_name(self):
         d = self.server_dir
         return None if d is None else d.joinpath('plots.root')
+
+    @property
+    def File(self):
+        return SaveDraw.Files.get(self.file_name)
     # endregion INIT
     # ----------------------------------------
 
     # ----------------------------------------
     # region SET
     def open_file(self, *exclude, prnt=False):
-        if self.File is None or exclude:
-            pal = Draw.Palette
+        """opens the ROOT file on the server once per session in UPDATE mode, shared by all instances, and removes all cycles of the keys in `exclude`"""
+        if self.File is None:
             info('opening ROOT file on server ...', prnt=prnt)
-            data = {}
-            if self.file_name.exists():
-                if self.file_name.stat().st_size < 1000:   # file must be corrupted or empty
-                    self.rm_plots()
-                f0 = TFile(str(self.file_name), 'UPDATE')
-                data = {key.GetName(): f0.Get(key.GetName()) for key in f0.GetListOfKeys()}
-            f = TFile(str(self.file_name), 'RECREATE')
-            set_palette(pal)
-            for key, c in data.items():
-                if c and key not in exclude:
-                    c.Write(key)
-            f.Write()
-            self.File = f
+            if self.file_name.exists() and self.file_name.stat().st_size < 1000:   # file must be corrupted or empty
+                self.rm_plots()
+            SaveDraw.Files[self.file_name] = TFile(str(self.file_name), 'UPDATE')
+            SaveDraw.dummy().cd()
+        for key in exclude:
+            self.File.Delete(f'{key};*')
 
     def close_file(self):
-        if self.File is not None:
-            self.File.Close()
-            self.File = None
+        f = SaveDraw.Files.pop(self.file_name, None)
+        if f is not None:
+            f.Close()
 
     def rm_plots(self):
         remove_file(self.file_name)
@@ -107,9 +134,26 @@ class SaveDraw(Draw):
 
     def create_overview(self, x=4, y=3, redo=True):
         if self.server_dir is not None:
-            html.create_tree(self.file_name.with_name('tree.html'))
-            if not self.file_name.with_suffix('.html').exists() or redo:
-                html.create_root_overview(self.file_name, x, y, verbose=self.Verbose)
+            SaveDraw.overview(self.file_name, x, y, redo)
+
+    @staticmethod
+    def overview(file_name: Path, x=4, y=3, redo=True):
+        html.create_tree(file_name.with_name('tree.html'))
+        if not file_name.with_suffix('.html').exists() or redo:
+            html.create_root_overview(file_name, x, y, verbose=Draw.Verbose)
+
+    @staticmethod
+    def flush():
+        """waits for the pending exports, creates the pending html pages and the overviews and closes the ROOT files of all instances"""
+        SaveDraw.wait()
+        files, SaveDraw.HTML = SaveDraw.HTML, {}
+        for f, pages in files.items():
+            for p, pal in pages.items():
+                html.create_root(p, title=p.parent.name, pal=pal, verbose=Draw.Verbose)
+            SaveDraw.overview(f, redo=False)
+        for f in SaveDraw.Files.values():
+            f.Close()
+        SaveDraw.Files = {}
 
     def set_sub_dir(self, name):
         self.SubDir = name
@@ -133,6 +177,7 @@ class SaveDraw(Draw):
         self.save_plots(choose(fn, file_name), prnt=prnt, show=show, save=save)
         return c
 
+    @profiled('save plots')
     def save_plots(self, savename, sub_dir=None, canvas=None, full_path=None, prnt=True, ftype=None, show=True, save=True, cname=None, **kwargs):
         """ Saves the canvas at the desired location. If no canvas is passed as argument, the active canvas will be saved. However, for applications without graphical interface,
          such as in SSl terminals, it is recommended to pass the canvas to the method. """
@@ -158,11 +203,38 @@ class SaveDraw(Draw):
         canvas.Update()
         Draw.set_show(show)  # needs to be in the same batch so that the pictures are created, takes forever...
         set_root_warnings(False)
-        for f in choose(make_list(ftype), default=['pdf'], decider=ftype):
-            canvas.SaveAs(f'{file_path}.{f.strip(".")}')
+        self.export(canvas, [f'{file_path}.{f.strip(".")}' for f in choose(make_list(ftype), default=['pdf'], decider=ftype)])
         self.save_on_server(canvas, file_path.name, save=full_path is None, prnt=prnt)
         Draw.set_show(True)
 
+    @staticmethod
+    def export(canvas, paths):
+        """saves the canvas to the `paths` in the background. The number of export processes is set by 'export workers' in the SAVE section,
+        with 0 the plots are saved directly. At most four exports per process are queued, further calls block until one is finished."""
+        n = Draw.Config.get_value('SAVE', 'export workers', default=2)
+        if n < 1:
+            return [canvas.SaveAs(p) for p in paths]
+        if SaveDraw.Exporter is None:
+            SaveDraw.Exporter = ProcessPoolExecutor(n, initializer=Profiler.fork)
+        if len(SaveDraw.Pending) >= 4 * n:
+            wait(SaveDraw.Pending, return_when=FIRST_COMPLETED)
+            SaveDraw.collect()
+        SaveDraw.Pending.append(SaveDraw.Exporter.submit(_export, dumps(canvas), paths, Draw.Palette))
+
+    @staticmethod
+    def collect(block=False):
+        """removes the finished exports from the queue and reports the failed ones"""
+        wait(SaveDraw.Pending) if block else do_nothing()
+        for fut in [fut for fut in SaveDraw.Pending if fut.done()]:
+            SaveDraw.Pending.remove(fut)
+            if fut.exception() is not None:
+                warning(f'Error exporting plot ...:\n  {fut.exception()}')
+
+    @staticmethod
+    def wait():
+        """blocks until all plots are exported"""
+        SaveDraw.collect(block=True)
+
     def print_http(self, file_name, prnt=True, force_print=False):
         prnt = force_print or prnt and Draw.Verbose and not Draw.Show
         info(join('https://diamond.ethz.ch', self.ServerMountDir.name, Path(self.server_dir, file_name).relative_to(self.ServerMountDir)), prnt=prnt)
@@ -173,14 +245,12 @@ class SaveDraw(Draw):
             d.mkdir(parents=True, exist_ok=True)
             p = d.joinpath(f'{Path(file_name).stem}.html')
             self.open_file(file_name)
-            html.create_root(p, title=p.parent.name, pal=55 if is_iter(Draw.Palette) else Draw.Palette, verbose=self.Verbose)
+            SaveDraw.HTML.setdefault(self.file_name, {})[p] = 55 if is_iter(Draw.Palette) else Draw.Palette
             self.File.cd()
             canvas.Write(file_name)
             self.File.Write()
-            SaveDraw.Dummy.cd()
+            SaveDraw.dummy().cd()
             self.print_http(p.name, prnt)
-            self.create_overview(redo=False)
-            self.close_file()
 
     @staticmethod
     def save_last(canvas=None, ext='pdf', prnt=None):
@@ -196,7 +266,7 @@ class SaveDraw(Draw):
     # endregion SAVE
     # ----------------------------------------
 
-# %% ../../nbs/02_plotting.save.ipynb 5
+# %% ../../nbs/02_plotting.save.ipynb 6
 @call_parse
 def main():
     z = SaveDraw()
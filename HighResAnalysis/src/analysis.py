@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/32_src.analysis.ipynb.
 
 # %% auto 0
-__all__ = ['BeamTest', 'load_config', 'Analysis', 'main']
+__all__ = ['BeamTest', 'load_config', 'lazy_class_attr', 'Analysis', 'main']
 
 # %% ../../nbs/32_src.analysis.ipynb 2
 from os import getcwd
@@ -11,11 +11,11 @@ from pathlib import Path
 from datetime import datetime
 from fastcore.script import *
 from fastcore.basics import patch
-from nbdev import *
+from functools import cached_property
 
-from ..plotting.save import *
-from ..plotting.utils import warning, Config, choose, info, add_to_info, GREEN, RED
-from ..utility.utils import Dir, print_banner, byte2str, ensure_dir
+from ..plotting.utils import warning, Config, choose, info, add_to_info, remove_file, GREEN, RED
+from ..utility.utils import Dir, print_banner, byte2str, ensure_dir, do_nothing
+from ..utility.cache import MetaCache
 
 # %% ../../nbs/32_src.analysis.ipynb 3
 class BeamTest:
@@ -53,16 +53,30 @@ def load_config():
         copyfile(Dir.joinpath('config', 'default.ini'), config_file_path)
     return Config(config_file_path)
 
+
+class lazy_class_attr:
+    """class attribute which is evaluated with `f(cls)` on first access and then stored on the defining class"""
+    def __init__(self, f):
+        self.F = f
+
+    def __set_name__(self, owner, name):
+        self.Owner, self.Name = owner, name
+
+    def __get__(self, obj, cls=None):
+        v = self.F(self.Owner)
+        setattr(self.Owner, self.Name, v)
+        return v
+
 # %% ../../nbs/32_src.analysis.ipynb 5
 class Analysis:
     """ The analysis class provides default behaviour objects in the analysis framework and is the parent of all other analysis objects. 
     The main part"""
-    # Analysis Class Variables
-    Config = load_config()
-    Locations = Config.get_value('data', 'beam tests', type)
-    DataDir = Path(Config.get('data', 'dir')).expanduser()
+    # Analysis Class Variables, the config is only loaded on first access
+    Config = lazy_class_attr(lambda cls: load_config())
+    Locations = lazy_class_attr(lambda cls: cls.Config.get_value('data', 'beam tests', type))
+    DataDir = lazy_class_attr(lambda cls: Path(cls.Config.get('data', 'dir')).expanduser())
     ResultsDir = Dir.joinpath('results')
-    MetaDir = Dir.joinpath(Config.get('SAVE', 'meta directory'))
+    MetaDir = lazy_class_attr(lambda cls: Dir.joinpath(cls.Config.get('SAVE', 'meta directory')))
 
     def __init__(self, 
                  beamtest:str=None, # A year and a month of the beam test, for example '201912' for DESY and '201810' for CERN
@@ -74,8 +88,8 @@ class Analysis:
 
         self.BeamTest = self.load_test_campaign(beamtest)
         self.MetaSubDir = meta_sub_dir
-
-        self.Draw = SaveDraw(self, results_dir=self.BeamTest.Tag)
+        MetaCache.Budget = Analysis.Config.get_value('SAVE', 'meta cache size', default=MetaCache.Budget)
+        MetaCache.MemoBudget = Analysis.Config.get_value('SAVE', 'meta memory size', default=MetaCache.MemoBudget)
 
     def __str__(self):
         return f'{self.__class__.__name__.replace("Analysis", "").upper()} ANALYSIS'.strip(' ')
@@ -89,6 +103,12 @@ class Analysis:
     def server_save_dir(self):
         return
 
+    @cached_property
+    def Draw(self):
+        """the plotting (and thereby ROOT) is only loaded when the first plot is drawn"""
+        from HighResAnalysis.plotting.save import SaveDraw
+        return SaveDraw(self, results_dir=self.BeamTest.Tag)
+
 
 
     @staticmethod
@@ -144,24 +164,33 @@ class Analysis:
     def run_str(self):
         return str(self.Run) if hasattr(self, 'Run') else ''
 
+    @property
+    def meta_cache(self):
+        return MetaCache.load(self.MetaDir)
+
+    @property
+    def meta_pattern(self):
+        return f'*_{self.BeamTest.Tag}_{self.run_str}*'
+
     def get_meta_files(self):
-        return [*Path(self.MetaDir).rglob(f'*_{self.BeamTest.Tag}_{self.run_str}*')] if self.run_str else []
+        return self.meta_cache.keys(self.meta_pattern) if self.run_str else []
 
     @property
     def meta_file_size(self):
-        return sum(p.stat().st_size for p in self.get_meta_files())
+        return self.meta_cache.size(self.meta_pattern) if self.run_str else 0
 
     def print_meta_file_size(self):
         info(f'total size of metadata: {byte2str(self.meta_file_size)}')
 
     def print_meta_file_sizes(self):
-        for p in self.get_meta_files():
-            info(f'{p}: {byte2str(p.stat().st_size)}')
+        for key, size in (self.meta_cache.sizes(self.meta_pattern) if self.run_str else []):
+            info(f'{key}: {byte2str(size)}')
         self.print_meta_file_size()
 
     def remove_metadata(self):
         s = self.meta_file_size
-        for p in self.get_meta_files():
+        self.meta_cache.remove(self.meta_pattern) if self.run_str else do_nothing()
+        for p in [*Path(self.MetaDir).rglob(self.meta_pattern)] if self.run_str else []:  # old meta files which were not moved to the cache yet
             remove_file(p)
         info(f'removed {byte2str(s)} of meta files')
 
@@ -0,0 +1,182 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/45_src.benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['Benchmark', 'main']
+
+# %% ../../nbs/45_src.benchmark.ipynb 2
+from json import dump
+from pathlib import Path
+from platform import node
+from shutil import rmtree
+from tempfile import gettempdir
+from datetime import datetime
+from time import perf_counter
+from functools import cached_property
+from numpy import array, mean
+from fastcore.script import *
+
+from .analysis import Analysis
+from .synthetic import SyntheticRun
+from .converter import Converter
+from .standin import StandIn
+from ..plotting.utils import info, warning, load_json, choose, critical
+from ..utility.utils import Dir, print_table, ensure_dir
+
+# %% ../../nbs/45_src.benchmark.ipynb 4
+class Benchmark:
+    """ Timings of the main analysis steps on a synthetic run, compared to the stored baseline of the machine. """
+
+    Dir = Dir.joinpath('benchmarks')
+    Cases = ['init', 'cuts', 'txy', 'align', 'eff', 'server', 'convert']
+    Tolerance = 1.2  # ratio to the baseline which counts as regression
+
+    def __init__(self, n_events:int=100000, # number of events of the synthetic run
+                 repeat:int=3, # number of timed repetitions of each case
+                 seed:int=0, # seed of the synthetic run
+                 data_dir:Path=None, # directory for the synthetic data and its meta data, defaults to a temporary directory
+                 beam_test:str='201912', # beam test with the geometry and DUTs of the synthetic run
+                 dut:int=0): # DUT number
+
+        self.DataDir = Path(choose(data_dir, Path(gettempdir(), 'hra-bench')))
+        self.DataDir.mkdir(parents=True, exist_ok=True)
+        Analysis.DataDir, Analysis.MetaDir = self.DataDir, self.DataDir.joinpath('metadata')  # never mix the synthetic with the real data
+        self.NEvents, self.Repeat, self.DUTNr = int(n_events), repeat, dut
+        self.Run = self.init_run(beam_test, seed)
+        self.BaselineFile = Benchmark.Dir.joinpath(f'{node()}.json')
+        self.Results = {}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} on {self.Run!r}'
+
+    # ----------------------------------------
+    # region INIT
+    def init_run(self, beam_test, seed, redo=False):
+        run = SyntheticRun(Analysis.load_test_campaign(beam_test), n_events=self.NEvents, seed=seed)
+        if redo or not run.exists:
+            rmtree(Analysis.MetaDir, ignore_errors=True)  # cached data of the previous synthetic run
+            run.write()
+        return run
+
+    def analysis(self):
+        from HighResAnalysis.src.dut_analysis import DUTAnalysis
+        return DUTAnalysis(self.Run.Number, self.DUTNr, self.Run.BeamTest.Tag, verbose=False)
+
+    @cached_property
+    def Ana(self):
+        """analysis with all cuts, shared by the cases which do not time the construction"""
+        ana = self.analysis()
+        _ = ana.Cut
+        return ana
+
+    @cached_property
+    def Converter(self):
+        """converter of a synthetic run with only the raw file, which uses the stand-in executables and a copy of the proteus configuration"""
+        StandIn(self.DataDir.joinpath('software')).activate(self.DataDir.joinpath('proteus'))
+        run = SyntheticRun.from_settings(self.Run.Settings, number=self.Run.Number + 1)
+        run.write_raw()
+        return Converter(run.BeamTest.Path, run.Number)
+    # endregion INIT
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region CASES
+    def time_init(self):
+        """construction of the DUTAnalysis"""
+        return self.analysis
+
+    def time_cuts(self):
+        """generation of all cuts without cached masks"""
+        ana = self.analysis()
+        ana.remove_metadata()
+        return lambda: ana.Cut
+
+    def time_txy(self):
+        """aligned local track positions"""
+        return self.Ana.get_txy
+
+    def time_align(self):
+        """iterative residual alignment"""
+        return lambda: self.Ana.Residuals.align(_redo=True)
+
+    def time_eff(self):
+        """efficiency map"""
+        return lambda: self.Ana.Efficiency.draw_map(show=False, save=False)
+
+    def time_server(self):
+        """writing a plot to the server file and creating its html page"""
+        from HighResAnalysis.plotting.save import SaveDraw
+        from HighResAnalysis.plotting.draw import get_last_canvas
+        SaveDraw.ServerMountDir, SaveDraw.SaveOnServer = ensure_dir(self.DataDir.joinpath('server', 'data')).parent, True
+        self.Ana.Efficiency.draw_map(show=False, save=False)
+        c = get_last_canvas()
+
+        def f():
+            self.Ana.Draw.save_on_server(c, 'em-bench', prnt=False)
+            self.Ana.Draw.flush()
+        return f
+
+    def time_convert(self):
+        """conversion chain raw -> hdf5 with the stand-ins of EUDAQ and proteus"""
+        c = self.Converter
+        return lambda: c.run(force=True) or critical(f'{c!r} failed')
+    # endregion CASES
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region RUN
+    def time(self, name):
+        """:returns the times [s] of the repetitions of the case [name] after one warm-up"""
+        if name not in Benchmark.Cases:
+            critical(f'unknown benchmark case "{name}", choose from {Benchmark.Cases}')
+        setup = getattr(self, f'time_{name}')
+        setup()()
+        t = []
+        for i in range(self.Repeat):
+            f = setup()
+            t0 = perf_counter()
+            f()
+            t.append(perf_counter() - t0)
+        return array(t)
+
+    def run(self, cases=None, save=False):
+        for name in choose(cases, Benchmark.Cases):
+            info(f'timing {name} ...')
+            self.Results[name] = self.time(name)
+        self.show()
+        if save or not self.BaselineFile.exists():
+            self.save()
+        return self.Results
+
+    @property
+    def baseline(self):
+        d = load_json(self.BaselineFile) if self.BaselineFile.exists() else {}
+        return d.get('cases', {}) if d.get('events') == self.NEvents else {}
+
+    def save(self):
+        ensure_dir(Benchmark.Dir)
+        d = {'events': self.NEvents, 'date': datetime.now().strftime('%Y-%m-%d %H:%M'), 'cases': {**self.baseline, **{n: round(t.min(), 5) for n, t in self.Results.items()}}}
+        with open(self.BaselineFile, 'w') as f:
+            dump(d, f, indent=2)
+        info(f'saved baseline to {self.BaselineFile}')
+
+    def show(self):
+        base, rows, slow = self.baseline, [], []
+        for n, t in self.Results.items():
+            r = t.min() / base[n] if n in base else None
+            rows.append([n, f'{t.min():.4f}', f'{mean(t):.4f}', f'{base[n]:.4f}' if n in base else '-', '-' if r is None else f'{r:.2f}', getattr(self, f'time_{n}').__doc__])
+            slow += [n] if r is not None and r > Benchmark.Tolerance else []
+        print_table(rows, ['case', 'best [s]', 'mean [s]', 'baseline [s]', 'ratio', 'description'])
+        if slow:
+            warning(f'slower than the baseline by more than {(Benchmark.Tolerance - 1) * 100:.0f}%: {", ".join(slow)}')
+    # endregion RUN
+    # ----------------------------------------
+
+# %% ../../nbs/45_src.benchmark.ipynb 5
+@call_parse
+def main(cases:str=None,     # comma separated names of the cases, all by default
+         n:int=100000,       # number of events of the synthetic run
+         repeat:int=3,       # number of timed repetitions of each case
+         save:bool=False,    # store the results as new baseline of this machine
+         data_dir:str=None): # directory for the synthetic data, defaults to a temporary directory
+    "time the main analysis steps on a synthetic run and compare them to the baseline"
+    Benchmark(n, repeat, data_dir=data_dir).run(None if cases is None else cases.split(','), save)
@@ -10,15 +10,15 @@ __all__ = ['Calibration']
 from numpy import genfromtxt, all, delete, round, argmax, savetxt, isnan, any, array, concatenate, zeros
 from copy import deepcopy
 from pathlib import Path
+from functools import cached_property
 
 import HighResAnalysis.src.bins as bins
-from ..plotting.save import Draw, SaveDraw, FitRes
 from ..plotting.utils import warning, info, ensure_dir
-from ..plotting.fit import Erf
 from .analysis import Analysis
 from .run import Run
 from ..utility.utils import *
 from ..utility.utils import Dir
+from ..utility.profiler import profiled
 
 # %% ../../nbs/42_src.calibration.ipynb 4
 class Calibration:
@@ -38,7 +38,6 @@ class Calibration:
         # Calibration
         self.HighRangeFactor = 7
         self.Trim, self.Number = self.get_trim_number(n)
-        self.Fit = Erf(fit_range=[0, 255 * 7]).Fit
         self.Points = None
         self.Fits = None
 
@@ -47,7 +46,6 @@ class Calibration:
         self.FitFileName = self.Dir.joinpath(f'fitpars-{self.Trim}.txt')
         self.CalPath = self.Dir.parent.joinpath('fitpars-.txt')  # enter trim and DUT in eudaq
 
-        self.Draw = SaveDraw(self, results_dir=str(self.DUT))
         self.correct_file()
 
     def __call__(self, x, y, adc):
@@ -56,6 +54,16 @@ class Calibration:
     def __repr__(self):
         return f'ADC Calibration of {self.Run.DUT}'
 
+    @cached_property
+    def Draw(self):
+        from HighResAnalysis.plotting.save import SaveDraw  # ROOT is only loaded for drawing and fitting
+        return SaveDraw(self, results_dir=str(self.DUT))
+
+    @cached_property
+    def Fit(self):
+        from HighResAnalysis.plotting.fit import Erf
+        return Erf(fit_range=[0, 255 * 7]).Fit
+
     @property
     def server_save_dir(self):
         return Path('duts', str(self.DUT), 'calibration', self.RawFileName.stem)
@@ -113,13 +121,17 @@ class Calibration:
 
     # ----------------------------------------
     # region GET
+    @property
+    def MetaDir(self):
+        return Analysis.MetaDir
+
     def make_hdf5_path(self, name='', suf=''):
-        d = ensure_dir(Dir.joinpath('metadata', 'calibration'))
+        d = ensure_dir(self.MetaDir.joinpath('calibration'))
         return d.joinpath(f'{"_".join(str(v) for v in [name, self.Run.DUT, self.Trim, self.Number, suf] if v)}.hdf5')
 
     @save_hdf5('Points', arr=True, field='Tag')
     def get_all_points(self, _redo=False):
-        return genfromtxt(self.RawFileName, skip_header=3, dtype='u2')[:, :-3].reshape((self.NX, self.NY, -1))   # last three entries are pixel info
+        return genfromtxt(self.RawFileName, skip_header=3, dtype='i4')[:, :-3].astype('u2').reshape((self.NX, self.NY, -1))   # last three entries are pixel info
 
     def get_thresholds(self):
         p = self.get_all_points()
@@ -139,7 +151,7 @@ class Calibration:
     def get_vcals(self):
         """ :returns: the vcal dacs used for the calibration, which are saved in the header of the files. """
         f = self.RawFileName
-        return {'low range': genfromtxt(f, 'u2', skip_header=1, max_rows=1)[2:], 'high range': genfromtxt(f, 'u2', skip_header=2, max_rows=1)[2:]}
+        return {key: genfromtxt(f, 'i4', skip_header=i + 1, max_rows=1)[2:].astype('u2') for i, key in enumerate(['low range', 'high range'])}  # the labels are read as -1
 
     @property
     def vcals(self):
@@ -154,10 +166,12 @@ class Calibration:
         x, y = x[y > 0], y[y > 0]  # take only non zero values
         if x.size < 5:
             return None
+        from HighResAnalysis.plotting.fit import Draw, FitRes
         self.Fit.SetParameters(255 / 2, 255 / 2, 400, 500)
         Draw.make_tgraph(x, y).Fit(self.Fit, 'q0', '', 0, 255 * 7)
         return FitRes(deepcopy(self.Fit))
 
+    @profiled('calibration fits')
     def fit_all(self):
         info(f'fit calibration points ({self.RawFileName.stem}) ...')
         x, y = self.vcals, self.get_all_points()
@@ -172,16 +186,21 @@ class Calibration:
     def get_chi2s(self, _redo=False):
         return array([[None if fit is None else fit.get_chi2() for fit in lst] for lst in self.get_fits()])
 
-    @update_pbar
-    def get_vcal(self, f, adc):
+    @staticmethod
+    def get_vcal(f, adc):
         return f.GetX(adc) if adc > f.GetMinimum() else 0
 
+    @update_pbar
+    def get_lut(self, fit):
+        """:returns the vcal of all 256 adc values of a single pixel"""
+        return [0] * 256 if fit is None else [self.get_vcal(fit.Fit, i) for i in range(256)]
+
     @save_hdf5('LUT', arr=True, dtype='f4', field='Tag')
     def get_lookup_table(self, _redo=False):
         fits = self.get_fits()
         info('creating calibration LUT ... ')
-        PBAR.start(256 * self.NPix)
-        return array([[[0 if f is None else self.get_vcal(f.Fit, i) for i in range(256)] for f in lst] for lst in fits])
+        PBAR.start(self.NPix)
+        return array([[self.get_lut(f) for f in lst] for lst in fits])
 
     def save_fit_pars(self):
         """ [0] + [1] * TMath::Erf((x - [2]) / [3]) -> [3] * (TMath::Erf((x - [0]) / [1]) + [2])"""
@@ -206,6 +225,7 @@ class Calibration:
 
     def draw_pxar_fit(self, col=14, row=14, **dkw):
         """ draws the Erf fit from pXar """
+        from HighResAnalysis.plotting.draw import Draw
         f = Draw.make_f(None, self.get_formula(), 0, 255 * 7, pars=self.read_fit_pars()[col, row])
         return self.draw(col, row, **prep_kw(dkw, title=f'Calibration Fit for Pixel {col} {row}', leg=f))
 
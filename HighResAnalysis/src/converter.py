@@ -16,6 +16,7 @@ import awkward as aw
 from datetime import timedelta
 from time import time
 from inspect import signature
+from functools import cached_property
 from subprocess import check_call
 import h5py
 
@@ -24,10 +25,10 @@ from .run import Run, Analysis, init_batch, DUT, Batch
 from .analysis import BeamTest
 from ..utility.utils import *
 from ..utility.utils import Dir
+from ..utility.profiler import Profiler
 # from HighResAnalysis.src.raw import Raw
 from .calibration import Calibration
 from .dut import Plane
-from ..plotting.draw import Draw
 from ..plotting.utils import warning, download_file, remove_file, add_to_info, GREEN, prep_kw, choose, info
 
 # %% ../../nbs/37_src.converter.ipynb 4
@@ -41,6 +42,7 @@ class Converter:
     """
 
     DUTName = None
+    ProteusDir = Dir.joinpath('proteus')  # proteus configurations of the beam tests
 
     def __init__(self, data_dir: Path, run_number, dut_name=None):
         self.T0 = time()
@@ -77,7 +79,8 @@ class Converter:
                     print(f'-----starting step {i}')
                     print_banner(f'Start converter step {i}: {s.__doc__}')
                     try:
-                        s(force=force) if 'force' in signature(s).parameters else s()
+                        with Profiler.stage(f'step {i}: {getattr(s, "func", s).__name__}'):
+                            s(force=force) if 'force' in signature(s).parameters else s()
                     except Exception as err:
                         warning(f'converter crashed: {err}')
                         remove_file(f)
@@ -161,7 +164,7 @@ class Converter:
     def init_proteus(self):
         soft_dir = self.SoftDir.joinpath(Analysis.Config.get('SOFTWARE', 'proteus'))
         data_dir = self.DataDir.joinpath('proteus')
-        conf_dir = Dir.joinpath('proteus', self.DataDir.stem)
+        conf_dir = self.ProteusDir.joinpath(self.DataDir.stem)
         me, se = [Analysis.Config.getint('align', opt) for opt in ['max events', 'skip events']]
         print('*************** Initing PROTEUS ******************')
         return Proteus(soft_dir, data_dir, conf_dir, raw_file=self.proteus_raw_file_path(), max_events=me, skip_events=se, dut_pos=self.dut_pos, duts=self.dut_names, align_run=self.Run.Number)
@@ -382,11 +385,15 @@ class Raw:
 
         self.Steps = [(self.convert, self.OutFilePath)]
         self.AtStep = step
-        self.Draw = Draw(Analysis.Config.FilePath)
 
     def __repr__(self):
         return f'{self.__class__.__name__} file analysis run {self.Run} ({self.RawFilePath.name})'
 
+    @cached_property
+    def Draw(self):
+        from HighResAnalysis.plotting.draw import Draw  # ROOT is only loaded for drawing
+        return Draw(Analysis.Config.FilePath)
+
     # ----------------------------------------
     # region CONVERT
     def load_raw_file_path(self):
@@ -1,29 +1,134 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/38_src.currents.ipynb.
 
 # %% auto 0
-__all__ = ['Currents', 'main']
+__all__ = ['read_hv_log', 'HVData', 'Currents', 'main']
 
 # %% ../../nbs/38_src.currents.ipynb 2
-from os.path import getsize
-
-from numpy import genfromtxt, datetime64, invert, char, uint32, mean, where, append, sign
-from pytz import timezone
+from os import getpid, replace
+from re import findall, MULTILINE
+from multiprocessing import Pool, cpu_count
+from functools import partial
+from os.path import getsize, basename, join
+
+from numpy import genfromtxt, datetime64, invert, char, uint32, mean, where, append, sign, argsort, searchsorted, arange, array, concatenate, isnan, cumsum, diff, zeros
+from datetime import datetime
+from pytz import timezone, utc
 from uncertainties import ufloat
 import h5py
 from pathlib import Path
 
 from .analysis import *
 from ..utility.utils import *
-from ..plotting.utils import mean_sigma, prep_kw, download_file, Config
+from ..plotting.utils import mean_sigma, prep_kw, download_file, Config, info, critical, remove_file
 from ..plotting.draw import Draw
 from glob import glob
 from fastcore.script import *
 import HighResAnalysis.src.bins as bins
 
 # %% ../../nbs/38_src.currents.ipynb 3
+def read_hv_log(p: Path, # path to the log file, named `*_YYYY_MM_DD_hh_mm_ss.log`
+                tz='Europe/Zurich'): # time zone of the log
+    "Vectorised reader of a Keithley log file, returns the timestamps [s], voltages and currents of the valid lines"
+    t0 = timezone(tz).localize(datetime.strptime(''.join(p.name.split('_')[-6:]), '%Y%m%d%H%M%S.log'))
+    num = rb'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    x = array(findall(rb'^(\d\d):(\d\d):(\d\d)[ \t]+' + num + rb'[ \t]+' + num, p.read_bytes(), MULTILINE), 'S').reshape(-1, 5)
+    t = x[:, :3].astype('i8') @ array([3600, 60, 1])
+    t += 24 * 3600 * cumsum(append(0, diff(t) < 0))  # midnight rollover
+    t += int(datetime(t0.year, t0.month, t0.day, tzinfo=utc).timestamp()) - int(t0.utcoffset().total_seconds())
+    data = zeros(t.size, [('timestamps', 'u4'), ('voltages', 'f2'), ('currents', 'f4')])
+    data['timestamps'], data['voltages'], data['currents'] = t, x[:, 3].astype('f8'), x[:, 4].astype('f8')
+    return data
+
+# %% ../../nbs/38_src.currents.ipynb 4
+class HVData:
+    """ current data of a beam test sorted by timestamp in chunks with a sparse time index, shared by all `Currents` of the campaign.
+        Time windows are found by a binary search in the index followed by a contiguous read of the covering chunks. """
+
+    Files = {}  # {file path: HVData}
+    Meta = ['index', 'logs']  # keys which are not current data
+    ChunkSize = 2 ** 12  # rows per chunk = distance between the entries of the time index
+
+    def __init__(self, p: Path):
+        self.Path = Path(p)
+        self.MTime = self.Path.stat().st_mtime_ns
+        self.F = h5py.File(self.Path, 'r')
+        self.Index = {}  # {tag: timestamps of the chunk starts}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} {self.Path} ({", ".join(self.tags)})'
+
+    def __contains__(self, tag):
+        return tag in self.F
+
+    @property
+    def tags(self):
+        return [key for key in self.F if key not in HVData.Meta]
+
+    @classmethod
+    def load(cls, p: Path):
+        """returns the shared store of file `p`, sorting legacy files on first use and reopening changed files"""
+        p = Path(p)
+        if p not in cls.Files or cls.Files[p].MTime != p.stat().st_mtime_ns:
+            cls.Files.pop(p).close() if p in cls.Files else do_nothing()  # release the handle of the replaced file
+            with h5py.File(p, 'r') as f:
+                legacy = 'index' not in f
+            cls.write(p, cls.read_all(p), cls.logs(p)) if legacy else do_nothing()
+            cls.Files[p] = cls(p)
+        return cls.Files[p]
+
+    def close(self):
+        self.F.close()
+
+    @staticmethod
+    def read_all(p: Path):
+        with h5py.File(p, 'r') as f:
+            return {key: f[key][()] for key in f if key not in HVData.Meta}
+
+    @staticmethod
+    def logs(p: Path):
+        """returns the names of the log files which are already in the store"""
+        if not p.exists():
+            return []
+        with h5py.File(p, 'r') as f:
+            return list(f['logs'].asstr()[()]) if 'logs' in f else []
+
+    @staticmethod
+    def add(p: Path, data: dict, logs: list):
+        """merges the {tag: data} of the new `logs` into the store"""
+        old = HVData.read_all(p) if HVData.logs(p) else {}  # legacy stores without log list are replaced
+        HVData.write(p, {tag: concatenate([old[tag], data[tag]]) if tag in old and tag in data else data.get(tag, old.get(tag)) for tag in {*old, *data}}, HVData.logs(p) + logs)
+
+    @staticmethod
+    def write(p: Path, data: dict, logs=None):
+        """saves the {tag: data} sorted by timestamp with chunked layout and the sparse time index, replaces `p` atomically"""
+        tmp = p.with_name(f'.{p.name}.{getpid()}')
+        with h5py.File(tmp, 'w') as f:
+            f.create_dataset('logs', data=array(choose(logs, []), 'S'))
+            for tag, d in data.items():
+                d = d[argsort(d['timestamps'], kind='stable')]
+                f.create_dataset(tag, data=d, chunks=(min(HVData.ChunkSize, max(d.size, 1)),))
+                f.create_dataset(f'index/{tag}', data=d['timestamps'][::HVData.ChunkSize])
+        replace(tmp, p)
+
+    def index(self, tag):
+        if tag not in self.Index:
+            self.Index[tag] = self.F['index'][tag][()]
+        return self.Index[tag]
+
+    def get(self, tag, t0, t1):
+        """returns the data of `tag` with timestamps in [t0, t1]"""
+        data, ind = self.F[tag], self.index(tag)
+        i0 = max(searchsorted(ind, t0, 'left') - 1, 0) * HVData.ChunkSize  # last chunk starting before t0
+        i1 = min(searchsorted(ind, t1, 'right') * HVData.ChunkSize, data.shape[0])
+        d = data[i0:i1]
+        return d[searchsorted(d['timestamps'], t0, 'left'):searchsorted(d['timestamps'], t1, 'right')]
+
+# %% ../../nbs/38_src.currents.ipynb 5
 class Currents(Analysis):
     """reads in information from the keithley log file"""
 
+    Found = {}  # {data file: found}, the current data of a beam test is only looked up and converted once
+
     def __init__(self, analysis=None, 
                  test_campaign=None, 
                  dut=None, 
@@ -92,19 +197,23 @@ class Currents(Analysis):
         return Config(self.DataDir.joinpath('config.ini'))
 
     def find_data(self):
-        if self.FileName.exists():
-            return True
-        if self.DataDir.joinpath(self.Tag).is_dir():  # convert raw current data if it exists
+        if not Currents.Found.get(self.FileName):
+            Currents.Found[self.FileName] = self.lookup_data()
+        return Currents.Found[self.FileName]
+
+    def lookup_data(self):
+        if any(self.DataDir.glob('*_*/*.log')):  # convert new raw current data if it exists
             self.convert_data()
             return True
+        if self.FileName.exists():
+            return True
         server, loc = [Analysis.Config.get('data', n) for n in ['server', 'server dir']]
         return download_file(server, Path(loc).joinpath(*self.FileName.parts[-4:]), self.FileName.parent, out=True) == 0
 
     def load_data(self):
         if not self.find_data():
             critical('could not find current data ...')
-        data = h5py.File(self.FileName, 'r')[self.Tag]
-        data = data[where((data['timestamps'] >= time_stamp(self.Begin, off=True)) & (data['timestamps'] <= time_stamp(self.End, off=True)))]
+        data = HVData.load(self.FileName).get(self.Tag, time_stamp(self.Begin, off=True), time_stamp(self.End, off=True))
         if self.IgnoreJumps:  # filter out jumps
             c = abs(data['currents'])
             data = data[append(False, c[:-1] * 100 > c[1:]) | ~c.astype('?')]  # take out the events that are 100 larger than the previous
@@ -208,28 +317,19 @@ class Currents(Analysis):
         return self.TimeZone.localize(datetime.strptime(log_date, '%Y%m%d%H%M%S.log'))
 
     def convert_data(self):
-        info('converting hv text files to hdf5 ...')
-        PBAR.start(len(glob(join(self.DataDir, '*', '*.log'))))
-        f = h5py.File(join(self.DataDir, 'data.hdf5'), 'w')
-        for d in glob(join(self.DataDir, '*_*')):
-            arrays = []
-            for file_name in glob(join(d, '*.log')):
-                if getsize(file_name) == 0:
-                    remove_file(file_name)
-                    continue
-                log_date = self.get_log_date(file_name)
-                data = genfromtxt(file_name, usecols=arange(3), dtype=[('timestamps', object), ('voltages', 'f2'), ('currents', 'f4')])
-                if not data.shape:
-                    remove_file(file_name)
-                    continue
-                data = data[where(invert(isnan(data['voltages'])))[0]]  # remove text entries
-                date_times = array(log_date.strftime('%Y-%m-%d ') + char.array(data['timestamps'].astype('U'))).astype(datetime64).astype(datetime)
-                data['timestamps'] = (array([time_stamp(dt, log_date.utcoffset().seconds) for dt in date_times]).astype('u4'))
-                data = data.astype([('timestamps', 'u4'), ('voltages', 'f2'), ('currents', 'f4')])
-                arrays.append(data)
+        """converts the new hv log files in parallel and adds them to the hdf5 store"""
+        done = set(HVData.logs(self.FileName))
+        files = [f for f in sorted(self.DataDir.glob('*_*/*.log')) if f'{f.parent.name}/{f.name}' not in done]
+        if not files:
+            return
+        info(f'converting {len(files)} hv log files to hdf5 ...')
+        PBAR.start(len(files))
+        data = {}
+        with Pool(min(cpu_count(), len(files))) as pool:
+            for f, d in zip(files, pool.imap(partial(read_hv_log, tz=self.TimeZone.zone), files)):
+                data.setdefault(f.parent.name, []).append(d) if d.size else remove_file(f)
                 PBAR.update()
-            if len(arrays):
-                f.create_dataset(basename(d), data=concatenate(arrays))
+        HVData.add(self.FileName, {tag: concatenate(arrays) for tag, arrays in data.items()}, [f'{f.parent.name}/{f.name}' for f in files])
     # endregion DATA ACQUISITION
     # ----------------------------------------
 
@@ -297,7 +397,7 @@ class Currents(Analysis):
     def get_time_from_log(self, t_str, year_str):
         return self.TimeZone.localize(datetime.strptime(year_str.strftime('%Y%m%d') + t_str, '%Y%m%d%H:%M:%S'))
 
-# %% ../../nbs/38_src.currents.ipynb 4
+# %% ../../nbs/38_src.currents.ipynb 6
 @call_parse
 def main(v:Param(action='store_false'),
          collection:Param(action='store_true', help='begin analysis collection'),
@@ -8,29 +8,38 @@ __all__ = ['Cuts', 'Cut']
 
 # %% ../../nbs/35_src.cut.ipynb 3
 from typing import Any
-from numpy import array, all, invert, ones, log10, count_nonzero, cumsum, ceil, ndarray
+import numpy
+from numpy import array, all, invert, ones, log10, count_nonzero, ceil, ndarray, zeros, packbits, unpackbits, bitwise_and
 
 from ..utility.utils import print_table, make_list, choose, Dir, is_iter, critical
 from ..plotting.utils import Config, warning
+from ..utility.cache import set_cid, get_cid, combine_cid
 
 # %% ../../nbs/35_src.cut.ipynb 4
 class Cuts:
     """ Class that holds several cuts with functionality to combine them """
 
+    BitCount = array([bin(i).count('1') for i in range(256)], 'u1')  # number of set bits of a byte
+
     def __init__(self):
 
         self.Dir = Dir.joinpath('cuts')
         self.Config = self.init_config()
         self.Cuts = {}
+        self.Flows = {}   # cut-flow tables by the content ID of the masks
+        self.Packed = {}  # bit packed masks by their content ID
         self.make()
 
     def __call__(self, cut=None, **k):
         cut = cut.Values if isinstance(cut, Cut) else cut
-        values = array(cut)
+        values = set_cid(array(cut), get_cid(cut))
         return values if values.size > 1 else self.generate() if cut is None else ...
 
     def __add__(self, other=None):
-        return self.generate() if other is None else all([self.generate(), other], axis=0)
+        if other is None:
+            return self.generate()
+        c = self.generate()
+        return set_cid(all([c, other], axis=0), combine_cid('all', c, other))
 
     def __getitem__(self, v):
         return self.get(v)()
@@ -63,7 +72,7 @@ class Cuts:
 
     def generate(self):
         cuts = [cut.Values for cut in self.Cuts.values() if cut.Level < Cut.MaxLevel]
-        return all(cuts, axis=0).flatten() if len(cuts) else ...
+        return set_cid(all(cuts, axis=0).flatten(), combine_cid('all', *cuts)) if len(cuts) else ...
 
     def register(self, name, values=None, level=None, description=None):
         if isinstance(name, Cut):
@@ -99,32 +108,83 @@ class Cuts:
     def names(self):
         return [c.Name for c in self]
 
+    @property
+    def active(self):
+        """:returns the active cuts sorted by their level"""
+        return sorted(filter(lambda x: x.Level < Cut.MaxLevel, self.Cuts.values()))
+
+    @staticmethod
+    def count_bits(b):
+        return int(numpy.bitwise_count(b).sum()) if hasattr(numpy, 'bitwise_count') else int(Cuts.BitCount[b].sum(dtype='i8'))
+
+    def pack(self, cuts):
+        """:returns the masks of the [cuts] packed into bits (eight events per byte), the packs are kept for the masks with a content ID"""
+        ids = [get_cid(cut.Values) for cut in cuts]
+        p = [self.Packed[i] if i in self.Packed else packbits(cut.Values) for i, cut in zip(ids, cuts)]
+        self.Packed = {i: v for i, v in zip(ids, p) if i is not None}  # only keep the current masks
+        return p
+
+    def cumulative(self, cuts):
+        """yields the bit packed consecutive combination of the [cuts]"""
+        p = self.pack(cuts)
+        c = p[0].copy() if p else None
+        for i in range(len(p)):
+            yield bitwise_and(c, p[i], out=c)
+
+    def flow(self):
+        """:returns the cut-flow table with the individual and the cumulative number of selected events of the active cuts.
+           All counts are taken from the bit packed masks and the table is cached for the content of the masks."""
+        cuts = self.active
+        key = combine_cid('flow', *[cut.Values for cut in cuts])
+        if key is not None and key in self.Flows:
+            return self.Flows[key]
+        size = cuts[0].Size if cuts else 0
+        n = [self.count_bits(c) for c in self.cumulative(cuts)]  # surviving events after each cut
+        t = zeros(len(cuts), dtype=[('name', 'O'), ('level', 'i4'), ('size', 'i8'), ('single', 'i8'), ('n', 'i8'), ('n0', 'i8'), ('p', 'd'), ('description', 'O')])
+        for i, (cut, p) in enumerate(zip(cuts, self.pack(cuts))):
+            t[i] = cut.Name, cut.Level, cut.Size, self.count_bits(p), n[i], n[i - 1] if i else size, 1 - n[i] / size if size else 0, cut.Description  # nothing is removed from empty masks
+        self.Flows = {} if key is None else {key: t}  # only keep the table of the current cuts
+        return t
+
     def get_consecutive(self):
-        return cumsum(sorted(filter(lambda x: x.Level < Cut.MaxLevel, self.Cuts.values())))
+        """:returns the consecutive combinations of the active cuts as an array of `Cut`, like the cumulative sum of the cuts"""
+        cuts = self.active
+        c = [Cut(cut.Name, unpackbits(v, count=cut.Size).view('?'), cut.Level, cut.Description) for cut, v in zip(cuts, self.cumulative(cuts))]
+        for i in range(1, len(c)):
+            c[i].N0 = c[i - 1].N
+        return array(c, object)
 
     def get_nofid(self, cut=None, fid=False):
         return self(cut) if fid else self.exclude('fid', cut)
 
     def include(self, *names):
-        return all([self[n] for n in names], axis=0)
+        cuts = [self[n] for n in names]
+        return set_cid(all(cuts, axis=0), combine_cid('all', *cuts))
 
     def exclude(self, exclude, cut=None):
         if cut is not None:
             return self(cut)
         exclude = make_list(exclude)
         cuts = [cut.Values for cut in self.Cuts.values() if cut.Level < Cut.MaxLevel and cut.Name not in exclude]
-        return all(cuts, axis=0).flatten() if len(cuts) else ...
+        return set_cid(all(cuts, axis=0).flatten(), combine_cid('all', *cuts)) if len(cuts) else ...
 
     def add(self, cut: ndarray):
-        return self() & self(cut)
+        c0, c1 = self(), self(cut)
+        return set_cid(c0 & c1, combine_cid('&', c0, c1))
 
     def remove(self, name):
         return self.Cuts.pop(name) if name in self.Cuts else None
 
     def show(self, raw=False):
-        rows = [[cut.Name, '{:5d}'.format(cut.Level), cut.Size, cut.nstr, cut.exstr, cut.pstr, cut.Value if raw else cut.Description] for cut in self.get_consecutive()]
-        c = Cut('all', self.generate(), 0, 'final cut')
-        print_table([row for row in rows if row[2]], ['Cut Name', 'Level', 'Size', 'N', 'Exl', 'P', 'Description'], [c.Name, '', c.Size, c.nstr, c.exstr, c.pstr, c.Description])
+        """prints the cut-flow table, [raw] shows the number of events selected by each cut alone instead of the description"""
+        t = self.flow()
+        if not t.size:
+            return warning(f'{self} has no active cuts')
+        w = int(ceil(log10(t[0]['size'])))
+        rows = [[r['name'], f'{r["level"]:5d}', r['size'], f'{r["n"]:{w}d}', f'{r["n0"] - r["n"]:{w}d}', f'{r["p"] * 100:.1f}%', r['single'] if raw else r['description']] for r in t]
+        n, size = t[-1]['n'], t[-1]['size']
+        print_table([row for row in rows if row[2]], ['Cut Name', 'Level', 'Size', 'N', 'Exl', 'P', 'Single' if raw else 'Description'],
+                    ['all', '', size, f'{n:{w}d}', f'{size - n:{w}d}', f'{(1 - n / size) * 100:.1f}%', 'final cut'])
 
 # %% ../../nbs/35_src.cut.ipynb 5
 class Cut:
@@ -136,6 +196,7 @@ class Cut:
 
         self.Name = name
         self.Values = ones(values, '?') if type(values) is int else values.Values if isinstance(values, Cut) else array(values)
+        set_cid(self.Values, f'ones{values}' if type(values) is int else get_cid(values.Values if isinstance(values, Cut) else values))
         self.Level = level
         self.Description = description
         self.Size = self.Values.size
@@ -154,7 +215,7 @@ class Cut:
             warning(f'could not add cuts! Array has incorrect size ({values.size}), {self.Size} required')
             return self
         n, d, lev = (other.Name, other.Description, other.Level) if isinstance(other, Cut) else (self.Name, self.Description, self.Level)
-        return Cut(n, self.Values & values, lev, d, self.N)
+        return Cut(n, set_cid(self.Values & values, combine_cid('&', self.Values, values)), lev, d, self.N)
 
     def __gt__(self, other):
         return self.Level > other.Level
@@ -8,7 +8,6 @@ from ..utility.utils import Dir
 from uncertainties import ufloat
 from numpy import array, arange
 from ..plotting.utils import prep_kw, add_perr, Config, critical
-from ..plotting.draw import Draw
 from .analysis import Analysis
 
 # %% ../../nbs/33_src.dut.ipynb 3
@@ -126,6 +125,7 @@ class Plane:
         return self.PY * self.NRows
 
     def get_grid(self, off=-.5, **dkw):
+        from HighResAnalysis.plotting.draw import Draw
         return Draw.grid(arange(self.NCols + 1) + off, arange(self.NRows + 1) + off, **prep_kw(dkw, show=False))
 
     def draw_grid(self, off=-.5, **dkw):
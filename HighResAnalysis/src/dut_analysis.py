@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/29_src.dut_analysis.ipynb.
 
 # %% auto 0
-__all__ = ['no_trans', 'DUTAnalysis']
+__all__ = ['no_trans', 'sub_analysis', 'RunContext', 'DUTAnalysis']
 
 # %% ../../nbs/29_src.dut_analysis.ipynb 2
 #!/usr/bin/env python
@@ -10,8 +10,11 @@ __all__ = ['no_trans', 'DUTAnalysis']
 import h5py
 from typing import Any
 from pathlib import Path
+from time import time
+from contextlib import contextmanager
 from datetime import timedelta, datetime
-from numpy import zeros, array, mean, sqrt
+from numpy import zeros, array, count_nonzero, mean, sqrt, arange, bincount, floor, digitize, argsort, cumsum, split, concatenate, diff, linspace, ones, quantile, tile, where
+from uncertainties import ufloat
 from fastcore.utils import *
 from fastcore.basics import patch
 import HighResAnalysis.cern.converter
@@ -23,15 +26,20 @@ import HighResAnalysis.src.bins as bins
 from ..mod.dut_cuts import DUTCut
 
 from ..plotting.fit import *
-from ..plotting.utils import remove_file, critical
+from ..plotting.save import SaveDraw
+from ..plotting.draw import Draw, FitRes, ax_range, gStyle, get_fw_center, get_fwhm, get_last_canvas, graph_y, hist_xyz, n_pal, set_statbox, set_time_axis
+from ..plotting.utils import remove_file, critical, info, warning, add_err, cart2pol, get_kw, mean_sigma, rm_key
 
 from .analysis import *
+from .analysis import Dir
 from .currents import Currents
 from .dut import Plane
 from .run import Run
 
 from ..utility.affine_transformations import transform, m_transform
 from ..utility.utils import *
+from ..utility.cache import MetaCache, array_id
+from ..utility.profiler import Profiler, profiled
 
 # %% ../../nbs/29_src.dut_analysis.ipynb 4
 def no_trans(f):
@@ -44,11 +52,64 @@ def no_trans(f):
     return inner
 
 # %% ../../nbs/29_src.dut_analysis.ipynb 5
+class sub_analysis:
+    """lazily constructed sub-analysis: built on first access and cached in the instance dict.
+    Child analyses (with a `Parent`) share the object of their parent, `req` are built beforehand."""
+
+    def __init__(self, *req, after=None):
+        self.Req, self.After = req, after
+
+    def __call__(self, f):
+        self.F = f
+        self.__doc__ = f.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        self.Name = name
+
+    def __get__(self, ana, owner=None):
+        if ana is None:
+            return self
+        if 'Parent' in ana.__dict__:
+            v = getattr(ana.Parent, self.Name)
+        else:
+            [getattr(ana, r) for r in self.Req]
+            v = ana.time_init(self.Name, self.F, ana)
+        ana.__dict__[self.Name] = v
+        if self.After is not None and 'Parent' not in ana.__dict__:
+            self.After(ana, v)
+        return v
+
+# %% ../../nbs/29_src.dut_analysis.ipynb 6
+class RunContext:
+    """data of a run which is shared by the DUT analysis and all its sub-analyses (also the REF):
+    the open HDF5 file and the plane independent arrays (track events, cluster masks, track cuts)"""
+
+    def __init__(self, f=None):
+        self.F = f
+        self.Cache = {}
+
+    def __call__(self, key, f, *args, _redo=False, **kwargs):
+        """:returns the cached value of [key] or evaluates and stores f(*args, **kwargs)"""
+        if _redo or key not in self.Cache:
+            self.Cache[key] = f(*args, **kwargs)
+        return self.Cache[key]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} of {getattr(self.F, "filename", None)} with {len(self.Cache)} shared arrays'
+
+    def reset(self, f=None):
+        self.F = f
+        self.Cache.clear()
+
+# %% ../../nbs/29_src.dut_analysis.ipynb 7
 class DUTAnalysis(Analysis):
 
     Trans = True      # use internal algorithm to improve alignment of the local track coordinates
     L2G = False       # transform local to global coordinates instead of using global directly
     DrawColLeg = True # draw bias and readout column in in-pixel plots
+    Profile = False   # print the construction time of the data members and sub-analyses
+    Columns = None    # cache of the data columns while a report is compiled, see `cached_columns`
 
     def __init__(self, run_number, # run number string or Run structure
                  dut_number:int, # DUT number `0`, `1`, `2`
@@ -62,16 +123,18 @@ class DUTAnalysis(Analysis):
         self.print_start()
 
         # data
-        self.Converter = self.init_converter()
-        self.Calibration = self.Converter.load_calibration(self.DUT.Number)
+        self.InitProfile, self.InitDepth = [], 0  # [(depth, name, duration)] of the constructed members
+        self.Converter = self.time_init('Converter', self.init_converter)
+        self.Calibration = self.time_init('Calibration', self.Converter.load_calibration, self.DUT.Number)
         self.Proteus = self.Converter.Proteus
         self.Planes = self.init_planes()
         self.Plane = self.Planes[self.DUT.Plane.Number]  # update rotated
 
         if test:
+            self.Context = RunContext()
             return
 
-        self.F = self.load_file()
+        self.Context = RunContext(self.time_init('File', self.load_file))  # shared with all sub-analyses
 
         # INFO
         self.N = self.n
@@ -82,21 +145,7 @@ class DUTAnalysis(Analysis):
         self.Duration = (self.EndTime - self.StartTime).seconds
         self.Surface = False
 
-        # SUBCLASSES
-        self.Cut = DUTCut(self)
-        self.Residuals = self.init_residuals()
-
-        self.Tel = self.init_tel()
-        self.REF = self.init_ref()
-        self.Tracks = self.init_tracks()
-
-        self.Cut.make_additional()
-        self.Efficiency = self.init_eff()
-        self.Resolution = self.init_resolution()
-        self.Currents = Currents(self)
-
-        if self.BeamTest.Location == 'CERN':
-            self.verify_alignment()
+        # SUBCLASSES are constructed lazily on first access, see the SUB-ANALYSES region
 
     def __repr__(self):
         return f'{self} of {self.DUT}, {self.unit_str} ({self.BeamTest}), {self.ev_str}'
@@ -117,24 +166,42 @@ class DUTAnalysis(Analysis):
         return f'{self.DUT}-{self.Run}-{self.BeamTest.Location}'.lower().replace('ii6-', '')
 
     def save_plots(self, res=.2, n=50, pal=55, rz_cs=None, dc=False, rz_ph=None):
-        old_dir = self.Draw.ResultsDir
-        SaveDraw.SaveOnServer = False
-        self.Draw.ResultsDir = Dir.joinpath('tmp', self.suffix)
         r = self.r_fid()
-        # PH
-        self.draw_signal_distribution(x0=-.05, x1=1.05, fn=f'sd-{self.suffix}', qscale=.95)
-        self.draw_signal_map(res=res, **r, pal=pal, qz=.999, fn=f'sm-{self.suffix}', qscale=.95, pix_grid=False)
-        self.draw_signal_map(res=res, **r, pal=pal, qz=.999, fn=f'sm-grid-{self.suffix}', qscale=.95, pix_grid=True)
-        self.draw_ph_in_pixel(n, pal=pal, fn=f'ph-pix-{self.suffix}', qscale=.95, dc=dc, z_range=rz_ph)
-        # Other
-        self.draw_occupancy(cut=0, **r, pal=pal, fn=f'occ-{self.suffix}')
-        self.Efficiency.draw_map(res=res, **self.r_fid(), pal=pal, fn=f'em-{self.suffix}', leg=self.Cut.get_fid())
-        self.draw_cluster_size_map(res=.1, **r, pal=pal, qz=.995, fn=f'csm-{self.suffix}', z_range=rz_cs)
-        self.draw_cs_in_pixel(n, pal=pal, qz=.999, fn=f'cs-pix-{self.suffix}', z_range=rz_cs, dc=dc)
-        self.Efficiency.draw_in_pixel(n, pal=pal, z_range=[70, 100], fn=f'e-pix-{self.suffix}', dc=dc)
-        self.draw_hitmap_in_pixel(n, pal=pal, fn=f'hm-pix-{self.suffix}')
-        self.Draw.ResultsDir = old_dir
-        SaveDraw.SaveOnServer = True
+        products = [  # PH
+            (self.draw_signal_distribution, dict(x0=-.05, x1=1.05, fn=f'sd-{self.suffix}', qscale=.95)),
+            (self.draw_signal_map, dict(res=res, **r, pal=pal, qz=.999, fn=f'sm-{self.suffix}', qscale=.95, pix_grid=False)),
+            (self.draw_signal_map, dict(res=res, **r, pal=pal, qz=.999, fn=f'sm-grid-{self.suffix}', qscale=.95, pix_grid=True)),
+            (self.draw_ph_in_pixel, dict(n=n, pal=pal, fn=f'ph-pix-{self.suffix}', qscale=.95, dc=dc, z_range=rz_ph)),
+            # Other
+            (self.draw_occupancy, dict(cut=0, **r, pal=pal, fn=f'occ-{self.suffix}')),
+            (self.Efficiency.draw_map, dict(res=res, **r, pal=pal, fn=f'em-{self.suffix}', leg=self.Cut.get_fid())),
+            (self.draw_cluster_size_map, dict(res=.1, **r, pal=pal, qz=.995, fn=f'csm-{self.suffix}', z_range=rz_cs)),
+            (self.draw_cs_in_pixel, dict(n=n, pal=pal, qz=.999, fn=f'cs-pix-{self.suffix}', z_range=rz_cs, dc=dc)),
+            (self.Efficiency.draw_in_pixel, dict(n=n, pal=pal, z_range=[70, 100], fn=f'e-pix-{self.suffix}', dc=dc)),
+            (self.draw_hitmap_in_pixel, dict(n=n, pal=pal, fn=f'hm-pix-{self.suffix}'))]
+        return self.report(products, Dir.joinpath('tmp', self.suffix))
+
+    def report(self, products, res_dir=None, server=False):
+        """draws all [products] = [(draw method, kwargs)] in one pass over the shared data columns.
+        The coordinates, cuts and in-pixel variables are read and computed once and reused by every plot."""
+        old_dir, old_server = self.Draw.ResultsDir, SaveDraw.SaveOnServer
+        SaveDraw.SaveOnServer = server
+        self.Draw.ResultsDir = choose(res_dir, old_dir)
+        try:
+            with self.cached_columns():
+                return [f(**kw) for f, kw in products]
+        finally:
+            self.Draw.ResultsDir, SaveDraw.SaveOnServer = old_dir, old_server
+
+    @contextmanager
+    def cached_columns(self):
+        """share the data columns, cuts and in-pixel coordinates between all methods called within the context"""
+        old = DUTAnalysis.Columns
+        DUTAnalysis.Columns = {} if old is None else old
+        try:
+            yield DUTAnalysis.Columns
+        finally:
+            DUTAnalysis.Columns = old
 
     def r_fid(self, name='dia size'):
         rx, ry = self.Cut.get_config(name).reshape(2, -1) if name in self.Cut.Config.options() else (None, None)
@@ -208,14 +275,18 @@ class DUTAnalysis(Analysis):
             # self.remove_file()
             critical(f'error loading data file, deleting {self.file_name}\n{err}')
 
+    @property
+    def F(self):
+        return self.Context.F
+
     def reload_data(self):
-        self.F = self.load_file()
+        self.Context.reset(self.load_file())
 
     def show_structure(self):
         show_hdf5(self.F, str(self.Plane), 'Plane0', ex_str='Plane')
 
     def has_alignment(self, imax=20):
-        return all([file_exists(self.make_pickle_path('AM', imax, 'alignment', run='', dut=i)) for i in [self.DUT.Number, self.REF.DUT.Number]])
+        return all([MetaCache.from_path(self.make_pickle_path('AM', imax, 'alignment', run='', dut=i), self.MetaDir)[1] in self.meta_cache for i in [self.DUT.Number, self.REF.DUT.Number]])
 
     def verify_alignment(self, cut=100):
         """checks if the residuals are centred around 0 for a given cut [um]"""
@@ -225,6 +296,67 @@ class DUTAnalysis(Analysis):
     # endregion INIT
     # ----------------------------------------
 
+    # ----------------------------------------
+    # region SUB-ANALYSES
+    def time_init(self, name, f, *args):
+        """constructs a member with f(*args) and records the duration in the init profile"""
+        t, i = time(), len(self.InitProfile)
+        self.InitProfile.append([self.InitDepth, name, 0.])
+        self.InitDepth += 1
+        try:
+            with Profiler.stage(name):
+                return f(*args)
+        finally:
+            self.InitDepth -= 1
+            self.InitProfile[i][2] = time() - t
+            info(f'{"  " * self.InitDepth}initialised {name} in {self.InitProfile[i][2]:.2f} s', prnt=self.Profile and self.Verbose)
+
+    @property
+    def initialised(self):
+        return [name for d, name, t in self.InitProfile]
+
+    def show_init_profile(self):
+        rows = [[f'{"  " * d}{name}', f'{t:.3f}'] for d, name, t in self.InitProfile]
+        print_table(rows, ['member', 'duration [s]'], ['total', f'{sum(t for d, n, t in self.InitProfile if d == 0):.3f}'] if rows else None)
+
+    @sub_analysis()
+    def Draw(self):
+        return SaveDraw(self, results_dir=self.BeamTest.Tag)
+
+    @sub_analysis(after=lambda ana, cut: cut.make_additional())
+    def Cut(self):
+        return DUTCut(self)
+
+    @sub_analysis(after=lambda ana, res: ana.verify_alignment() if ana.BeamTest.Location == 'CERN' else do_nothing())
+    def Residuals(self):
+        return self.init_residuals()
+
+    @sub_analysis()
+    def Tel(self):
+        return self.init_tel()
+
+    @sub_analysis()
+    def REF(self):
+        return self.init_ref()
+
+    @sub_analysis('Tel')
+    def Tracks(self):
+        return self.init_tracks()
+
+    @sub_analysis('Cut', 'Tracks')
+    def Efficiency(self):
+        return self.init_eff()
+
+    @sub_analysis('REF')
+    def Resolution(self):
+        return self.init_resolution()
+
+    @sub_analysis()
+    def Currents(self):
+        return Currents(self)
+    # endregion SUB-ANALYSES
+    # ----------------------------------------
+
     # ----------------------------------------
     # region DATA
     def time(self, cut=None):
@@ -234,10 +366,37 @@ class DUTAnalysis(Analysis):
         t0, t1 = self.F['Event']['Time'][[0, -1]]
         return ufloat(mean([t0, t1]), (t1 - t0) / 2)
 
-    def get_data(self, grp, key=None, cut=None, pl=None, main_grp=None):
+    def column(self, f, *key):
+        """:returns the result of [f], which is cached under [key] while the columns are shared (see `cached_columns`)"""
+        if DUTAnalysis.Columns is None:
+            return f()
+        key = (self.file_name, self.DUT.Number, self.Cut.__class__.__name__, *key)
+        if key not in DUTAnalysis.Columns:
+            v = f()
+            for a in v if type(v) is tuple else [v]:
+                a.flags.writeable = False  # cached arrays are shared, hence not to be modified in place
+            DUTAnalysis.Columns[key] = v
+        return DUTAnalysis.Columns[key]
+
+    def cut_id(self, cut=None):
+        """:returns the resolved [cut] and its content ID"""
+        if type(cut) is bool:
+            return cut, str(cut)
+        cut = self.Cut(cut)
+        return cut, '...' if cut is ... else array_id(cut)
+
+    @profiled('read data')
+    def read_data(self, grp, key=None, pl=None, main_grp=None):
         data = self.F[choose(main_grp, str(self.Planes[choose(pl, self.Plane.Number)]))][grp]
-        data = array(data) if key is None else array(data[key])
-        return data if type(cut) is bool else self.Cut(cut, data, pl)
+        return array(data) if key is None else array(data[key])
+
+    def get_data(self, grp, key=None, cut=None, pl=None, main_grp=None):
+        if DUTAnalysis.Columns is None:
+            data = self.read_data(grp, key, pl, main_grp)
+            return data if type(cut) is bool else self.Cut(cut, data, pl)
+        (cut, cid), k = self.cut_id(cut), (grp, key, choose(pl, self.Plane.Number), main_grp)
+        data = self.column(partial(self.read_data, *k), 'data', *k)
+        return data if type(cut) is bool else self.column(lambda: self.Cut(cut, data, pl), 'data', *k, cid)
 
     def get_phs(self, e=False, cut=None, qscale=None):
         x = self.get_data('Clusters', 'Charge', cut) * (self.DUT.Vcal2ke if e else 1)
@@ -281,6 +440,12 @@ class DUTAnalysis(Analysis):
         return self.l2g(self.get_x(cut, pl), self.get_y(cut, pl), pl, centre) if DUTAnalysis.L2G else array([self.get_u(cut, pl), self.get_v(cut, pl)])
 
     def get_txy(self, local=True, cut=None, pl=None, centre=False):
+        if DUTAnalysis.Columns is not None:
+            (cut, cid), trans = self.cut_id(cut), DUTAnalysis.Trans and local
+            return self.column(lambda: self.calc_txy(local, cut, pl, centre), 'txy', local, cid, choose(pl, self.Plane.Number), centre, trans, DUTAnalysis.L2G)
+        return self.calc_txy(local, cut, pl, centre)
+
+    def calc_txy(self, local=True, cut=None, pl=None, centre=False):
         d = array([self.get_tx(cut, pl), self.get_ty(cut, pl)]) if local else self.get_tuv(cut, pl, centre)
         return m_transform(self.Residuals.m, *d) if DUTAnalysis.Trans and local else d
 
@@ -372,9 +537,17 @@ class DUTAnalysis(Analysis):
         return x[:-1] + diff(x) / 2, y[:-1] + diff(y) / 2
 
     def segment_values(self, nx=2, ny=2, f=None, cut=None):
-        sx, sy = self.segments(nx, ny)
-        (x, y), zz = self.get_txy(local=True, cut=cut), choose(f, self.phs, cut=cut)
-        return [zz[(x >= sx[i]) & (x <= sx[i + 1]) & (y >= sy[j]) & (y <= sy[j + 1])] for j in range(sy.size - 1) for i in range(sx.size - 1)]  # second for loop runs first
+        """:returns list of the values of [f] (default pulse height) in each segment, the x index runs first"""
+        (x, y), zz = self.get_txy(local=True, cut=cut), (self.phs if f is None else f)(cut=cut)
+        ix, iy = [digitize(v, s) - 1 for v, s in zip([x, y], self.segments(nx, ny))]
+        sel = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        i = iy[sel] * nx + ix[sel]
+        return split(zz[sel][argsort(i, kind='stable')], cumsum(bincount(i, minlength=nx * ny))[:-1])
+
+    def segment_stats(self, nx=2, ny=2, f=None, cut=None):
+        """:returns structured array (ny, nx) with the number of entries, mean, error and efficiency of [f] (default pulse height) in each segment"""
+        (x, y), zz = self.get_txy(local=True, cut=cut), (self.phs if f is None else f)(cut=cut)
+        return bins.segment_reduce(x, y, zz, *self.segments(nx, ny))
     # endregion MISC
     # ----------------------------------------
 
@@ -473,18 +646,63 @@ class DUTAnalysis(Analysis):
         y = [self.get_y(c, p, rot=True) for p in [pl, pl1]]
         return self.Draw.histo_2d(*y, **prep_kw(dkw, title='YCorr', x_tit=f'Row Plane {pl}', y_tit=f'Row Plane {choose(pl1, self.Plane.Number)}', file_name='YCorr'))
 
-    def draw_correlation_trend(self, pl=0, pl1=None, thresh=.2, **dkw):
-        c = self.Cut.make_correlation(pl, pl1)
-        d0, d1, t = self.get_xy(pl=pl, cut=c, rot=True), self.get_xy(pl=pl1, cut=c, rot=True), self.time(c)
-        g = [self.Draw.graph(*get_3d_correlations(self.Draw.histo_3d(t, d0[i], d1[i]), thresh=thresh), y_tit='Correlation Factor', show=False) for i in range(2)]
+    def correlation_mask(self, pl=0, pl1=None, i=0, chunk=2 ** 22):
+        """:returns the mask of the tracks [i, i + [chunk]) with a cluster in both planes [pl] and [pl1] (see `DUTCut.make_correlation`), read from the file"""
+        c0, c1 = [self.F[str(self.plane(p))]['Clusters']['Size'][i:i + chunk] > 0 for p in [pl, pl1]]
+        return c0 & c1
+
+    def correlation_chunks(self, pl=0, pl1=None, chunk=2 ** 22):
+        """yields the times and the rotated cluster positions (x, y) in the planes [pl] and [pl1] of the tracks with a cluster in both planes, read from the file in chunks of [chunk] tracks"""
+        ev, t, o = self.F['Tracks']['Events'], self.F['Event']['Time'], [0, 0]  # index of the first cluster of the chunk in each plane
+        for i in range(0, self.NTracks, chunk):
+            c, d = self.correlation_mask(pl, pl1, i, chunk), []
+            for j, p in enumerate([pl, pl1]):
+                g = self.F[str(self.plane(p))]['Clusters']
+                has = g['Size'][i:i + chunk] > 0  # the clusters are only stored for the tracks with a cluster
+                xy = [g[v][o[j]:o[j] + count_nonzero(has)][c[has]] for v in ['X', 'Y']]
+                d.append(xy[::-1] if self.plane(p).Rotated else xy)
+                o[j] += count_nonzero(has)
+            e = ev[i:i + chunk][c]
+            yield (t[e[0]:e[-1] + 1][e - e[0]] if e.size else zeros(0)), *d
+
+    def correlation_time(self, pl=0, pl1=None, chunk=2 ** 22, last=False):
+        """:returns the time of the first (or [last]) track with a cluster in both planes [pl] and [pl1] or `None` if there is no such track"""
+        for i in range(0, self.NTracks, chunk)[::-1 if last else 1]:
+            c = self.correlation_mask(pl, pl1, i, chunk).nonzero()[0]
+            if c.size:
+                return float(self.F['Event']['Time'][self.F['Tracks']['Events'][i + c[-1 if last else 0]]])
+
+    def correlation_trend(self, pl=0, pl1=None, n=100, chunk=2 ** 22):
+        """:returns structured array with the starts [t0] and centres [t] of [n] time slices, the number of entries and the correlation factors [x] and [y] between the planes [pl] and [pl1].
+           The cluster positions and times are read from the file in chunks of [chunk] tracks, such that the memory does not grow with the size of the run."""
+        t0, t1 = [self.correlation_time(pl, pl1, chunk, last) for last in [False, True]]
+        e = linspace(t0, t1 + 1, n + 1) if t0 is not None else linspace(0, 1, n + 1)  # the last event is inside the last slice
+        cx, cy = bins.slice_correlations(self.correlation_chunks(pl, pl1, chunk), e, k=2)
+        r = zeros(n, dtype=[('t0', 'd'), ('t', 'd'), ('n', 'i8'), ('x', 'd'), ('y', 'd')])
+        r['t0'], r['t'], r['n'], r['x'], r['y'] = e[:-1], cx['t'], cx['n'], cx['corr'], cy['corr']
+        return r
+
+    def find_misalignment(self, pl=2, thresh=.3, n=100):
+        """:returns the start time of the first time slice where one of the correlations with plane [pl] drops below [thresh] or `None` if the run is aligned"""
+        c = self.correlation_trend(pl, n=n)
+        bad = where((c['n'] > 2) & ((abs(c['x']) < thresh) | (abs(c['y']) < thresh)))[0]  # skip slices without entries
+        return None if bad.size == 0 else c['t0'][bad[0]]
+
+    def draw_correlation_trend(self, pl=0, pl1=None, n=100, thresh=None, **dkw):
+        if thresh is not None or n < 1:  # the third argument used to be the entry threshold of the projections of the 3D histogram
+            warning('the threshold of draw_correlation_trend is deprecated and ignored, slices with less than 3 entries are skipped and [n] sets the number of slices')
+            n = 100 if n < 1 else n
+        c = self.correlation_trend(pl, pl1, n)
+        c = c[c['n'] > 2]
+        g = [self.Draw.graph(c['t'], c[i], y_tit='Correlation Factor', show=False) for i in ['x', 'y']]
         return self.Draw.multigraph(g, 'CorrFac', ['x', 'y'], draw_opt='pl', **prep_kw(dkw, **self.t_args(), y_range=[-1.05, 1.05], file_name='CorrTrend'))
 
-    def draw_ev_alignment(self, pl=2, thresh=.3, **dkw):
-        gx, gy = self.draw_correlation_trend(pl, show=False).GetListOfGraphs()
-        (t, x), y = graph_xy(gx, err=False), graph_y(gy, err=False)
-        r = [1 if abs(ix) > thresh and abs(iy) > thresh else 2 for ix, iy in zip(x, y)]
-        x, y = t.repeat(r), ones(sum(r))
-        binning = bins.from_vec(graph_x(gx, err=False)) + [3, 0, 3]
+    def draw_ev_alignment(self, pl=2, thresh=.3, n=100, **dkw):
+        c = self.correlation_trend(pl, n=n)
+        c = c[c['n'] > 2]
+        r = where((abs(c['x']) > thresh) & (abs(c['y']) > thresh), 1, 2)
+        x, y = c['t'].repeat(r), ones(sum(r))
+        binning = bins.from_vec(c['t']) + [3, 0, 3]
         gStyle.SetPalette(3, array([1, 633, 418], 'i'))
         self.Draw.histo_2d(x, y, binning, 'Event Alignment', **prep_kw(dkw, **self.t_args(), y_tit='Alignment', stats=False, l_off_y=99, center_y=True, draw_opt='col', z_range=[0, 2]))
         Draw.legend([Draw.box(0, 0, 0, 0, line_color=c, fillcolor=c) for c in [418, 633]], ['aligned', 'misaligned'], 'f')
@@ -600,33 +818,80 @@ class DUTAnalysis(Analysis):
     # ----------------------------------------
     # region IN PIXEL
     def contracted_vars(self, mx=1, my=1, ox=0, oy=0, fz=None, cut=None, expand=True):
+        cut, cid = self.cut_id(cut) if DUTAnalysis.Columns is not None else (cut, None)
+        x, y, i = self.column(lambda: self.contracted_xy(mx, my, ox, oy, cut, expand), 'cxy', mx, my, ox, oy, cid, expand, DUTAnalysis.Trans)
+        z_ = zeros(x.size, dtype='?') if fz is None else fz(cut=cut)[i]
+        return array([x, y, z_])
+
+    def contracted_xy(self, mx=1, my=1, ox=0, oy=0, cut=None, expand=True):
+        """:returns the in-pixel coordinates in um and the indices of the original entries"""
         x, y = self.get_txy(cut=cut) + .5  # put 0 to the corner of the pixel (is in the centre by default)
-        z_ = zeros(x.size, dtype='?') if fz is None else fz(cut=cut)
         x, y = (x + ox / self.Plane.PXu) % mx, (y + oy / self.Plane.PYu) % my
-        return array(self.expand_vars(x, y, z_, mx, my) if expand else (x, y, z_)) * [[self.Plane.PX * 1e3], [self.Plane.PY * 1e3], [1]]  # convert from pixel to um
+        x, y, i = self.expand_index(x, y, mx, my) if expand else (x, y, arange(x.size))
+        return x * self.Plane.PX * 1e3, y * self.Plane.PY * 1e3, i  # convert from pixel to um
 
     @staticmethod
-    def expand_vars(x, y, z_, mx, my):
-        """copy the vars x, y, z to half a cell of size [mx, my] in each direction"""
+    def expand_index(x, y, mx, my):
+        """copy the coordinates x, y to half a cell of size [mx, my] in each direction
+           :returns the copied coordinates and the indices of the original entries"""
         d = array([x, y]).T
-        (x, y), e = concatenate([d + [i, j] for i in [-mx, 0, mx] for j in [-my, 0, my]]).T, tile(z_, 9)  # copy arrays in each direction
+        (x, y), i = concatenate([d + [i, j] for i in [-mx, 0, mx] for j in [-my, 0, my]]).T, tile(arange(d.shape[0]), 9)  # copy arrays in each direction
         cut = (x >= -mx / 2) & (x <= mx * 3 / 2) & (y >= -my / 2) & (y <= my * 3 / 2)  # select only half of the copied cells
-        return x[cut], y[cut], e[cut]
+        return x[cut], y[cut], i[cut]
+
+    @staticmethod
+    def periodic_map(x, y, z_, mx, my, n, binning, profile=True, title=''):
+        """fills the in-cell coordinates [x, y] in [0, mx), [0, my) once into [n] x [n] bins of a single cell and
+           builds the view of [binning] (half a cell in each direction) by wrapping the bin indices.
+           :returns TProfile2D of [z_] if [profile] else TH2F of the number of entries"""
+        from ROOT import TH2F, TProfile2D
+        (wx, wy), z_ = (mx / n, my / n), array(z_, dtype='d')
+        i = ((floor(x / wx + .5) % n) * n + floor(y / wy + .5) % n).astype('i')  # bins are centred on multiples of the width
+        cnt, s, s2 = [bincount(i, weights=w, minlength=n * n) for w in [None, z_, z_ ** 2]]
+        (nx, ex), (ny, ey) = binning[:2], binning[2:]
+        (cx, jx), (cy, jy) = [((e[:-1] + e[1:]) / 2, (floor((e[:-1] + e[1:]) / 2 / w + .5) % n).astype('i')) for e, w in [(ex, wx), (ey, wy)]]
+        inside = lambda c, m, w: (c > -m / 2 - w / 4) & (c < 3 * m / 2 + w / 4)  # only show half a cell around the cell
+        valid = inside(cx, mx, wx).reshape(-1, 1) & inside(cy, my, wy)
+        k = jx.reshape(-1, 1) * n + jy  # index of the single cell bin of each bin [ix, iy] of the view
+        full = lambda v: concatenate([zeros((1, ny + 2)), concatenate([zeros((nx, 1)), where(valid, v[k], 0), zeros((nx, 1))], axis=1), zeros((1, ny + 2))]).T.flatten()  # ROOT order
+        h = (TProfile2D if profile else TH2F)(Draw.get_name('p2' if profile else 'h2'), title, nx, ex, ny, ey)
+        h.SetContent(full(s if profile else cnt))
+        if profile:
+            h.GetSumw2().Set(h.GetNcells(), full(s2))
+            [h.SetBinEntries(int(b), e) for b, e in enumerate(full(cnt)) if e]
+        h.ResetStats()
+        h.SetEntries(cnt.sum())
+        return h
+
+    @staticmethod
+    def expand_vars(x, y, z_, mx, my):
+        """copy the vars x, y, z to half a cell of size [mx, my] in each direction"""
+        x, y, i = DUTAnalysis.expand_index(x, y, mx, my)
+        return x, y, array(z_)[i]
 
     def r_phi(self, cut=None, fz=None):
         x, y, zz = self.contracted_vars(*1 / self.DUT.RXY, fz=fz, cut=cut, expand=False)
         return [*cart2pol(x - self.DUT.PXu / 2, y - self.DUT.PYu / 2), zz]
 
+    @staticmethod
+    def in_binning(mx, my, n):
+        """:returns the binning of [n] x [n] bins per cell of size [mx, my] which shows half a cell around the cell"""
+        d = lambda w: round((n + .5) * (max(mx, my) / n - w) / w) * w  # extra spacing to account for different mx and my
+        return sum([bins.make(-(i + w) / 2 - d(w), (3 * i + w) / 2 + d(w), w, last=True) for i, w in [(mx, mx / n), (my, my / n)]], start=[])
+
     def draw_in(self, mx, my, ox=0, oy=0, n=None, cut=None, fz=None, dc=False, dr=False, expand=True, **dkw):
         mx *= 2 if dc else 1
         my *= 2 if dr else 1
-        x, y, z_ = self.contracted_vars(mx / self.Plane.PX * 1e-3, my / self.Plane.PY * 1e-3, ox, oy, fz, cut, expand)
+        x, y, z_ = self.contracted_vars(mx / self.Plane.PX * 1e-3, my / self.Plane.PY * 1e-3, ox, oy, fz, cut, expand=False)
         n = choose(n, bins.freedman_diaconis, x=x) // 2 * 2  # should be symmetric...
-        d = lambda w: round((n + .5) * (max(mx, my) / n - w) / w) * w  # extra spacing to account for different mx and my
-        binning = sum([bins.make(-(i + w) / 2 - d(w), (3 * i + w) / 2 + d(w), w, last=True) for i, w in [(mx, mx / n), (my, my / n)]], start=[])
+        binning = self.in_binning(mx, my, n)
         cell = self.Draw.box(0, 0, mx, my, width=2, show=False, fillstyle=1)
-        fh = self.Draw.prof2d if any(z_) else self.Draw.histo_2d
-        h = fh(x, y, zz=z_, binning=binning, save=False, show=False, **prep_kw(rm_key(dkw, 'show'), title='Signal In Cell', x_tit='X [#mum]', y_tit='Y [#mum]'))
+        prof, kw = any(z_), prep_kw(rm_key(dkw, 'show'), title='Signal In Cell', x_tit='X [#mum]', y_tit='Y [#mum]')
+        fh = self.Draw.prof2d if prof else self.Draw.histo_2d
+        if expand:  # fill a single cell and wrap it instead of copying the entries to the neighbouring cells
+            h = fh(self.periodic_map(x, y, z_, mx, my, int(n), binning, prof, kw['title']), save=False, show=False, **rm_key(kw, 'title'))
+        else:
+            h = fh(x, y, zz=z_, binning=binning, save=False, show=False, **kw)
         return self.Draw(h, **prep_kw(dkw, leg=self.draw_columns(show=get_kw('show', dkw, default=True)) + [cell]))
 
     def draw_in_cell(self, ox=0, oy=0, n=None, cut=None, fz=None, dc=False, dr=False, tit='PH', **dkw):
@@ -674,25 +939,28 @@ class DUTAnalysis(Analysis):
 
     
 
-# %% ../../nbs/29_src.dut_analysis.ipynb 6
+# %% ../../nbs/29_src.dut_analysis.ipynb 8
 @patch
 def fit_langau(self:Analysis, 
                h=None, # histogram to fit, if `None` then fit the signal distribution
                nconv=30, 
                show:bool=True, # whether or not to show the histogram that is being fitted
                chi_thresh=8, # maximum chi2 if not reached then increase the number of convolutions upto 80
-               fit_range=None):
+               fit_range=None, 
+               nmax=80, # maximum number of convolutions
+               step=5): # increase of the number of convolutions per iteration
         h = self.draw_signal_distribution(show=show) if h is None and hasattr(self, 'draw_signal_distribution') else h
-        fit = Langau(h, nconv, fit_range)
-        fit.get_parameters()
-        fit(draw=show)
-        get_last_canvas().Modified()
-        get_last_canvas().Update()
-        if fit.get_chi2() > chi_thresh and nconv < 80:
-            Draw.Count += 5
-            self.info('Chi2 too large ({c:2.2f}) -> increasing number of convolutions by 5'.format(c=fit.get_chi2()))
-            fit = self.fit_langau(h, nconv + Draw.Count, chi_thresh=chi_thresh, show=show)
+        for n in range(nconv, max(nconv, nmax) + 1, step):
+            fit = Langau(h, n, fit_range)
+            fit.get_parameters()
+            fit(draw=False)
+            if fit.get_chi2() <= chi_thresh or n + step > nmax:
+                break
+            self.info(f'Chi2 too large ({fit.get_chi2():2.2f}) -> increasing number of convolutions by {step}')
+        if show:
+            fit.Fit.Draw('same')
+            get_last_canvas().Modified()
+            get_last_canvas().Update()
         print('MPV: {:1.1f}'.format(fit.get_mpv()))
-        Draw.Count = 0
         self.Draw.add(fit)
         return fit
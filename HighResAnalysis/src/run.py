@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/30_src.run.ipynb.
 
 # %% auto 0
-__all__ = ['load_runlog', 'load_nrs', 'init_batch', 'load_batches', 'Batch', 'DUTBatch', 'Run', 'Ensemble', 'main']
+__all__ = ['RunIndex', 'load_runlog', 'load_nrs', 'init_batch', 'load_batches', 'Batch', 'DUTBatch', 'Run', 'Ensemble', 'main']
 
 # %% ../../nbs/30_src.run.ipynb 2
 #!/usr/bin/env python
@@ -10,66 +10,111 @@ __all__ = ['load_runlog', 'load_nrs', 'init_batch', 'load_batches', 'Batch', 'DU
 from numpy import where, roll, split, array
 from pathlib import Path
 from fastcore.script import *
-from nbdev import *
-from ..utility.utils import print_table, datetime, ev2str, remove_letters, Dir, small_banner, isint, do_pickle, file_hash
+from ..utility.utils import print_table, datetime, ev2str, remove_letters, Dir, small_banner, isint
 from ..plotting.utils import load_json, warning, critical
 from .analysis import Analysis, BeamTest
 from ..utility.utils import choose
 from .dut import DUT
-from .spreadsheet import make
 
 # %% ../../nbs/30_src.run.ipynb 5
+class RunIndex:
+    """ in-process index of the run log and the batches of a beam test, shared by `Run`, `Batch` and `Ensemble`.
+        It is reloaded if the modification time of the run log or the custom batch file changes. """
+
+    Indices = {}  # {data dir: RunIndex}
+
+    def __init__(self, p: Path): # path to the data dir of the beam test
+        self.Path = Path(p)
+        self.LogFile = self.Path.joinpath(Analysis.Config.get('data', 'runlog file'))
+        self.CustomFile = Dir.joinpath('ensembles', f'{self.Path.name}.json')
+        self.Key = self.load_key()
+
+        self.Log = load_json(self.LogFile)
+        self.Custom = load_json(self.CustomFile) if self.CustomFile.exists() else {}
+        self.Batches = self.load_batches()
+
+        # columns for the queries
+        self.Runs = array([int(run) for run in self.Log], 'i8')
+        self.Good = array([dic.get('status', 'green') == 'green' for dic in self.Log.values()])
+        self.Start, self.End = array([[dic['start'], dic['end']] for dic in self.Log.values()], 'i8').reshape(-1, 2).T
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} of {self.Path.name} ({self.Runs.size} runs, {len(self.Batches)} batches)'
+
+    def __getitem__(self, run):
+        return self.Log[str(run)]
+
+    @classmethod
+    def load(cls, p: Path, redo=False):
+        """returns the index of the data dir `p`, (re)building it if the run log or the custom batches changed"""
+        p = Path(p)
+        if p not in cls.Indices or redo or cls.Indices[p].load_key() != cls.Indices[p].Key:
+            cls.Indices[p] = cls(p)
+        return cls.Indices[p]
+
+    def load_key(self):
+        if not self.LogFile.exists():
+            warning('runlog file does not exist! -> creating new one!')
+            from HighResAnalysis.src.spreadsheet import make  # google api is only needed to create the run log
+            make(self.Path.stem.replace('-', ''))
+        return tuple(f.stat().st_mtime_ns if f.exists() else None for f in [self.LogFile, self.CustomFile])
+
+    def load_batches(self):
+        """ unify batches from the run log and the custom batches """
+        d = array(sorted([(run, dic['batch']) for run, dic in self.Log.items() if dic['status'] == 'green'], key=lambda x: x[1])).T
+        s = where(d[1] != roll(d[1], 1))[0]  # indices where the new batches start
+        batches = {batch: runs.astype('i8') for batch, runs in zip(d[1][s], split(d[0], s[1:]))}
+        good_runs = lambda runs: array([run for run in runs if self.Log.get(str(run), {}).get('status') == 'green'])  # custom batches may refer to runs which are not in the log
+        batches.update({batch: {dut: good_runs(d_runs) for dut, d_runs in runs.items()} if type(runs) is dict else good_runs(runs) for batch, runs in self.Custom.items()})
+        return dict(sorted(batches.items(), key=lambda dic_pair: int(remove_letters(dic_pair[0]))))
+
+    # ----------------------------------------
+    # region QUERY
+    def duts(self, run):
+        return self[run]['duts']
+
+    def dut_nr(self, run, dut_name):
+        return self.duts(run).index(dut_name)
+
+    def bias(self, run, dut_name):
+        return int(self[run]['hv'][self.dut_nr(run, dut_name)])
+
+    def batch(self, run):
+        return next((b for b, runs in self.Batches.items() if int(run) in (array([r for rs in runs.values() for r in rs]) if type(runs) is dict else runs)), None)
+
+    def runs(self, dut=None, bias=None, t0=None, t1=None, good=True):
+        """returns the run numbers with `dut` at `bias` which were (partly) taken in the time range [t0, t1] (timestamps or datetime)"""
+        t0, t1 = [t.timestamp() if isinstance(t, datetime) else t for t in [t0, t1]]
+        cut = (self.Good if good else True) & (self.End >= choose(t0, -1)) & (self.Start <= choose(t1, self.End.max(initial=0)))
+        runs = self.Runs[cut]
+        if dut is not None:
+            runs = array([r for r in runs if dut in self.duts(r) and (bias is None or self.bias(r, dut) == bias)], 'i8')
+        return runs
+    # endregion QUERY
+    # ----------------------------------------
+
+# %% ../../nbs/30_src.run.ipynb 6
 def load_runlog(p: Path): # path the runlog.json 
     "Loads runlog.json creating it if it does not exist"
-    f = p.joinpath(Analysis.Config.get('data', 'runlog file'))
-    if not f.exists():
-        warning('runlog file does not exist! -> creating new one!')
-        make(p.stem.replace('-', ''))
-    return load_json(f)
+    return RunIndex.load(p).Log
 
-# %% ../../nbs/30_src.run.ipynb 6
+# %% ../../nbs/30_src.run.ipynb 7
 def load_nrs(p:Path # Path to json runlog
             )->list:
     "returns list of runs in runlog.json with either no status or `green` = `good run` status"
-    log = load_runlog(p)
-    return [key for key, dic in log.items() if 'status' not in dic or dic['status'] == 'green']
+    return [str(run) for run in RunIndex.load(p).runs()]
 
-# %% ../../nbs/30_src.run.ipynb 7
+# %% ../../nbs/30_src.run.ipynb 8
 def init_batch(name, dut, beam_test: BeamTest, log=None):
     batches = load_batches(beam_test)
     return DUTBatch(name, beam_test, log) if type(batches[name]) == dict else Batch(name, dut, beam_test, log) if isint(dut) else Batch.from_dut_name(name, dut, beam_test, log)
 
-# %% ../../nbs/30_src.run.ipynb 8
+# %% ../../nbs/30_src.run.ipynb 9
 def load_batches(bt: BeamTest, redo=False):
-    """ unify batches from run logs and custom batches and save them in a tmp file. """
-    log_file = bt.Path.joinpath(Analysis.Config.get('data', 'runlog file'))
-    custom_file = Dir.joinpath('ensembles', f'{bt.Name}.json')
-    tmp_file = Analysis.MetaDir.joinpath('ensembles', f'{bt.Tag}.pickle')
-    tmp_file.parent.mkdir(exist_ok=True)
-
-    if tmp_file.exists() and not redo:
-        h1, h2, bs = do_pickle(tmp_file)
-        if file_hash(log_file) == h1 and file_hash(custom_file) == h2:
-            return bs
-
-    def load():
-        log = load_json(log_file)
-
-        # batches from log
-        d = array(sorted([(run, dic['batch']) for run, dic in log.items() if dic['status'] == 'green'], key=lambda x: x[1])).T
-        s = where(d[1] != roll(d[1], 1))[0]  # indices where the new batches start
-        batches = {batch: runs.astype('i8') for batch, runs in zip(d[1][s], split(d[0], s[1:]))}
-
-        # custom batches
-        if custom_file.exists():
-            good_runs = lambda runs: array([run for run in runs if log[str(run)]['status'] == 'green'])
-            batches.update({batch: {dut: good_runs(d_runs) for dut, d_runs in runs.items()} if type(runs) is dict else good_runs(runs) for batch, runs in load_json(custom_file).items()})
+    """ unified batches from run logs and custom batches """
+    return RunIndex.load(bt.Path, redo).Batches
 
-        return file_hash(log_file), file_hash(custom_file), dict(sorted(batches.items(), key=lambda dic_pair: int(remove_letters(dic_pair[0]))))
-
-    return do_pickle(tmp_file, load, redo=True)[2]
-
-# %% ../../nbs/30_src.run.ipynb 9
+# %% ../../nbs/30_src.run.ipynb 10
 class Batch:
     """ class containing the run infos of a single batch. """
 
@@ -83,7 +128,8 @@ class Batch:
         self.Name = name
         self.BeamTest = beam_test
         self.DataDir = beam_test.Path
-        self.Log = load_runlog(self.DataDir) if log is None else log
+        self.Index = RunIndex.load(self.DataDir)
+        self.Log = self.Index.Log if log is None else log
 
         self.Runs = self.load_runs(dut_nr)
         self.FirstRun = self.Runs[0]
@@ -107,8 +153,9 @@ class Batch:
 
     @classmethod
     def from_dut_name(cls, name, dut_name, bt: BeamTest, log=None):
-        log = load_runlog(bt.Path) if log is None else log
-        dut_nrs = list(set([log[str(nr)]['duts'].index(dut_name) for nr in load_batches(bt)[name]]))
+        index = RunIndex.load(bt.Path)
+        log = index.Log if log is None else log
+        dut_nrs = list(set([log[str(nr)]['duts'].index(dut_name) for nr in index.Batches[name]]))
         if len(dut_nrs) == 1:
             return cls(name, dut_nrs[0], bt, log)
         critical(f'cannot instanciate Batch {name} from DUT {dut_name}, varying DUT numbers ...')
@@ -120,9 +167,8 @@ class Batch:
         return all([d == duts[0] for d in duts])
 
     def load_runs(self, dut_nr):
-        batches = load_batches(self.BeamTest)
-        if self.Name in batches:
-            return [Run(nr, dut_nr, self.DataDir, log=self.Log) for nr in batches[self.Name]]
+        if self.Name in self.Index.Batches:
+            return [Run(nr, dut_nr, self.DataDir, log=self.Log) for nr in self.Index.Batches[self.Name]]
         critical('unknown batch name')
 
     @property
@@ -144,7 +190,7 @@ class Batch:
     def show_all(self):
         rows = []
         log = {int(i): dic for i, dic in self.Log.items()}
-        for n, rs in load_batches(self.BeamTest).items():
+        for n, rs in self.Index.Batches.items():
             duts, rs = (rs.keys(), list(rs.values())[0]) if type(rs) is dict else (log[rs[0]]['duts'], rs)
             t_str = [f'{datetime.fromtimestamp(t)}'[-8:-3] for t in [log[rs[0]]['start'], log[rs[-1]]['end']]]
             rows.append([n, f'{rs[0]:03d}-{rs[-1]:03d}', ev2str(sum([log[i]['events'] for i in rs])), ', '.join(duts)] + t_str)
@@ -155,11 +201,11 @@ class Batch:
 
     @staticmethod
     def find_dut_numbers(batch_name, dut_name, log, bt):
-        new_batches = load_json(Dir.joinpath('ensembles', f'{bt.Path.stem}.json'))
+        new_batches = RunIndex.load(bt.Path).Custom
         logs = [log[str(run)] for run in new_batches[batch_name]] if batch_name in new_batches else filter(lambda x: x['batch'] == batch_name and x['status'] == 'green', log.values())
         return [d['duts'].index(dut_name) for d in logs]
 
-# %% ../../nbs/30_src.run.ipynb 10
+# %% ../../nbs/30_src.run.ipynb 11
 class DUTBatch(Batch):
     """ extension of batch class for a single DUT (for runs with mismatching duts). """
 
@@ -173,10 +219,9 @@ class DUTBatch(Batch):
         return True
 
     def load_runs(self, dut_nr=None):
-        batches = load_batches(self.BeamTest)
-        return [Run.from_dut_name(nr, dut_name, self.DataDir, self.Log) for dut_name, nrs in batches[self.Name].items() for nr in nrs]
+        return [Run.from_dut_name(nr, dut_name, self.DataDir, self.Log) for dut_name, nrs in self.Index.Batches[self.Name].items() for nr in nrs]
 
-# %% ../../nbs/30_src.run.ipynb 11
+# %% ../../nbs/30_src.run.ipynb 12
 class Run:
     """ Run class containing all the information for a single run from the tree and the json file. """
 
@@ -229,7 +274,7 @@ class Run:
         return [str(self.Number), ev2str(self.n_ev), ', '.join(self.DUTs)] + [f'{datetime.fromtimestamp(t)}'[-8:-3] for t in [self.LogStart, self.LogEnd]]
 
     def load_info(self, log=None) -> dict:
-        return (load_runlog(self.TCDir) if log is None else log)[str(self)]
+        return (RunIndex.load(self.TCDir).Log if log is None else log)[str(self)]
 
     def print_info(self):
         print(f'{self!r}')
@@ -248,7 +293,7 @@ class Run:
     def n_ev(self):
         return self.Info['events']
 
-# %% ../../nbs/30_src.run.ipynb 13
+# %% ../../nbs/30_src.run.ipynb 15
 class Ensemble(object):
     """ General enseble class for runs and batches. """
 
@@ -260,7 +305,7 @@ class Ensemble(object):
         self.Dic = self.load_dic()
         self.DUTName = self.Dic.pop('dut')
         self.BeamTests = {bt: Analysis.load_test_campaign(bt) for bt in self.Dic}
-        self.Logs = {bt: load_runlog(Analysis.load_test_campaign(bt).Path) for bt in self.Dic}
+        self.Logs = {bt: RunIndex.load(self.BeamTests[bt].Path).Log for bt in self.Dic}
         self.Units = self.init_units()
         self.Size = len(self.Units)
         self.DUT = self.Units[0].DUT
@@ -293,7 +338,7 @@ class Ensemble(object):
     def biases(self):
         return [u.DUT.Bias for u in self.Units]
 
-# %% ../../nbs/30_src.run.ipynb 14
+# %% ../../nbs/30_src.run.ipynb 16
 @call_parse
 def main(a:Param(action='store_true'), # show all
         alle:Param(action='store_true'),
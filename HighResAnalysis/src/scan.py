@@ -8,23 +8,44 @@ __all__ = ['Scan', 'VScan', 'TScan']
 
 # %% ../../nbs/39_src.scan.ipynb 3
 from fastcore.script import *
-from numpy import array
+from numpy import array, empty, shape
+from hashlib import md5
+from inspect import signature, unwrap
+from uncertainties import ufloat
+import h5py
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count
 
+from .. import __version__
 from .run import Ensemble
+from .analysis import Analysis
 from .batch_analysis import DUTAnalysis, BatchAnalysis, Batch
 from ..mod.dut_cuts import DUTCut
 from ..plotting.draw import Draw
+from ..plotting.fit import Gauss, Langau, batch_fit
 from ..plotting.save import SaveDraw
-from ..plotting.utils import prep_kw, rm_key, choose
-from ..utility.utils import bias2rootstr, Dir
+from ..plotting.utils import prep_kw, rm_key, choose, info, warning, do_nothing
+from ..utility.utils import bias2rootstr, Dir, ensure_dir
 
 # %% ../../nbs/39_src.scan.ipynb 5
+def _warm_cache(unit, test=False):
+    """creates the cached artefacts of a run or batch in a worker process: the converted data (with the proteus alignment), the currents and the cuts
+    (with the REF residual alignment they depend on). Only the files in the data and meta directories are kept, the analysis itself is discarded."""
+    try:
+        ana = Scan.init_analysis(unit, verbose=False, test=test)
+        _ = ana.Cut, ana.Currents
+    except Exception as err:
+        return f'{unit}: {err!r}'
+
+# %% ../../nbs/39_src.scan.ipynb 6
 class Scan(Ensemble):
     """Base class defining actions on several runs or batches"""
 
     XArgs = {'x_tit': 'Time', 't_ax_off': 0}
+    SourceKey = None  # version and last modification of the package, see `code_key`
 
     def __init__(self, name, verbose=False, test=False):
 
@@ -33,6 +54,7 @@ class Scan(Ensemble):
         self.Anas = self.init_analyses(verbose, test)
         self.Draw = SaveDraw(self, results_dir=self.Name)
         self.Cut = DUTCut
+        self.Table, self.UCols = self.load_table()
 
     @property
     def server_save_dir(self):
@@ -59,12 +81,103 @@ class Scan(Ensemble):
     def values(self, f, cuts=None, *args, **kwargs):
         return array([f(ana, *args, **kwargs) for ana in self.Anas] if cuts is None else [f(ana, cut=cut, *args, **kwargs) for ana, cut in zip(self.Anas, cuts)])
 
+    def fits(self, f, fcls=Gauss, cuts=None, nproc=None, **fkw):
+        """fit the histograms of `f` of all analyses in a single batch, see `batch_fit`"""
+        cuts = choose(cuts, self.Size * [None])
+        return batch_fit([f(ana, cut=cut, show=False, save=False) for ana, cut in zip(self.Anas, cuts)], fcls, nproc, **fkw)
+
+    # ----------------------------------------
+    # region TABLE
+    @property
+    def table_path(self):
+        return Path(ensure_dir(Analysis.MetaDir.joinpath('scans'))).joinpath(f'{self.Name}.hdf5')
+
+    def load_table(self):
+        """:returns the results table {column: {unit key: (cut key, values)}} of the scan stored in the meta directory and the columns of ufloats"""
+        if not self.table_path.exists():
+            return {}, set()
+        with h5py.File(self.table_path, 'r') as f:
+            return {col: {u.decode(): (c.decode(), v) for u, c, v in zip(g['units'], g['cuts'], self.read_values(g))} for col, g in f.items()}, {col for col, g in f.items() if g.attrs['ufloat']}
+
+    @staticmethod
+    def read_values(g):
+        """:returns the values of the column group [g], which are stored in a single dataset or in one dataset per unit if their shapes differ"""
+        v = g['values']
+        return v[()] if isinstance(v, h5py.Dataset) else [v[str(i)][()] for i in range(len(v))]
+
+    def save_table(self):
+        with h5py.File(self.table_path, 'w') as f:
+            for col, d in self.Table.items():
+                g = f.create_group(col)
+                g.attrs['ufloat'] = col in self.UCols
+                g.create_dataset('units', data=array(list(d), 'S'))
+                g.create_dataset('cuts', data=array([c for c, v in d.values()], 'S'))
+                values = [v for c, v in d.values()]
+                if len({shape(v) for v in values}) < 2:
+                    g.create_dataset('values', data=array(values))
+                else:  # ragged column
+                    gv = g.create_group('values')
+                    for i, v in enumerate(values):
+                        gv.create_dataset(str(i), data=v)
+
+    @staticmethod
+    def stack(values):
+        """:returns the [values] as array, which is an object array of the single values if their shapes differ"""
+        if len({shape(v) for v in values}) < 2:
+            return array(values)
+        a = empty(len(values), object)
+        for i, v in enumerate(values):
+            a[i] = v
+        return a
+
+    @staticmethod
+    def unit_key(ana):
+        """:returns a key which changes if the run or batch is converted again"""
+        return f'{ana.BeamTest.Tag}_{ana.run_str}_{ana.DUT.Number}_{Path(ana.file_name).stat().st_mtime:.0f}'
+
+    @staticmethod
+    def cut_key(ana, cut=None):
+        """:returns the content ID of the resolved cut, which is tagged to the cut arrays and does not require hashing the event mask"""
+        return ana.cut_id(cut)[1]
+
+    @staticmethod
+    def code_key(f):
+        """:returns a fingerprint of the code of [f], the version and the last modification of the package and of the main config,
+        such that the values are recomputed if one of them changes. Changes of the helpers called by [f] are only covered by the package."""
+        if Scan.SourceKey is None:
+            Scan.SourceKey = f'{__version__}{max(p.stat().st_mtime for p in Path(__file__).parents[1].rglob("*.py"))}'
+        c = unwrap(f).__code__
+        m = md5(c.co_code + repr(c.co_consts).encode() + Scan.SourceKey.encode())
+        m.update(repr({s: dict(Analysis.Config[s]) for s in Analysis.Config.sections()}).encode())
+        return m.hexdigest()[:16]
+
+    def table(self, f, cuts=None, **kwargs):
+        """:returns the values of `f` for all analyses from the results table. Only the entries of new units, changed cuts or a changed code or main config are computed."""
+        use_cut = 'cut' in signature(f).parameters
+        cuts = choose(cuts, self.Size * [None])
+        col = '_'.join([f.__name__, *[f'{k}{v}' for k, v in kwargs.items()]])
+        d = self.Table.setdefault(col, {})
+        code = self.code_key(f)
+        keys = [(self.unit_key(ana), f'{code}_{self.cut_key(ana, cut)}' if use_cut else code) for ana, cut in zip(self.Anas, cuts)]
+        todo = [i for i, (u, c) in enumerate(keys) if u not in d or d[u][0] != c]
+        for i in todo:
+            v = f(self.Anas[i], cut=cuts[i], **kwargs) if use_cut else f(self.Anas[i], **kwargs)
+            self.UCols.add(col) if hasattr(v, 'n') else do_nothing()
+            d[keys[i][0]] = keys[i][1], array([v.n, v.s]) if hasattr(v, 'n') else array(v, 'd')
+        self.save_table() if todo else do_nothing()
+        return self.stack([ufloat(*d[u][1]) if col in self.UCols else d[u][1] for u, c in keys])
+    # endregion TABLE
+    # ----------------------------------------
+
+    def mpvs(self, cuts=None):
+        return array([None if r is None else r.get_pars()[1] for r in self.fits(DUTAnalysis.draw_signal_distribution, Langau, cuts)])
+
     def cuts(self, f, add=True, *args, **kwargs):
         cuts = [f(ana.Cut, *args, **kwargs) for ana in self.Anas]
         return [ana.Cut.add(c) for c, ana in zip(cuts, self.Anas)] if add else cuts
 
     def t(self):
-        return self.values(DUTAnalysis.mean_time)
+        return self.table(DUTAnalysis.mean_time)
 
     def x(self):
         return self.t()
@@ -76,7 +189,28 @@ class Scan(Ensemble):
         return Draw.legend(h, choose(self.x2str, titles), **kwargs)
 
     def init_analyses(self, verbose, test):
-        return [BatchAnalysis.from_batch(u, verbose, test) if isinstance(u, Batch) else DUTAnalysis.from_run(u, verbose, test) for u in self.Units]
+        self.warm_caches(test)
+        return [self.init_analysis(u, verbose, test) for u in self.Units]
+
+    @staticmethod
+    def init_analysis(u, verbose=False, test=False):
+        return BatchAnalysis.from_batch(u, verbose, test) if isinstance(u, Batch) else DUTAnalysis.from_run(u, verbose, test)
+
+    def warm_caches(self, test=False):
+        """converts the data and creates the cuts and alignments of all units in parallel worker processes, see `_warm_cache`.
+        The main process still constructs every analysis, which is cheap, but then only reads these artefacts from the data and meta directories.
+        The first unit of every beam test is done alone since it may convert the data shared by all its units (e.g. the currents)."""
+        if self.Size < 2 or test:  # nothing is converted or cached in test mode
+            return
+        first = list({(u.DataDir if isinstance(u, Batch) else u.TCDir): u for u in self.Units[::-1]}.values())
+        info(f'warming the caches of {self.Size} units ...')
+        try:
+            with ProcessPoolExecutor(min(cpu_count(), self.Size)) as pool:
+                for units in [first, [u for u in self.Units if u not in first]]:
+                    for err in pool.map(_warm_cache, units, [test] * len(units)):
+                        warning(f'could not warm cache of {err}') if err is not None else do_nothing()
+        except BrokenProcessPool:
+            warning('worker process died while warming the caches, continuing serially ...')
 
     def draw_graph(self, y, t=False, **dkw):
         x = self.t() if t else self.x()
@@ -89,19 +223,22 @@ class Scan(Ensemble):
         return self.Draw.multigraph(g, 'tit', self.x2str(), **prep_kw(dkw, file_name='test'))
 
     def draw_efficiency(self, t=False, cuts=None, **dkw):
-        return self.draw_graph(self.values(DUTAnalysis.eff, cuts), t, **prep_kw(dkw, y_tit='Efficiency [%]', file_name='Eff'))
+        return self.draw_graph(self.table(DUTAnalysis.eff, cuts), t, **prep_kw(dkw, y_tit='Efficiency [%]', file_name='Eff'))
 
-    def draw_current(self, t=False, cuts=None, **dkw):
-        return self.draw_graph(self.values(DUTAnalysis.current, cuts), t, **prep_kw(dkw, y_tit='Current [nA]', file_name='Curr'))
+    def draw_current(self, t=False, **dkw):
+        return self.draw_graph(self.table(DUTAnalysis.current), t, **prep_kw(dkw, y_tit='Current [nA]', file_name='Curr'))
 
     def draw_pulse_height(self, t=False, cuts=None, **dkw):
-        return self.draw_graph(self.values(DUTAnalysis.ph, cuts), t, **prep_kw(dkw, y_tit='Pulse Height [vcal]', file_name='PH'))
+        return self.draw_graph(self.table(DUTAnalysis.ph, cuts), t, **prep_kw(dkw, y_tit='Pulse Height [vcal]', file_name='PH'))
+
+    def draw_mpv(self, t=False, cuts=None, **dkw):
+        return self.draw_graph(self.mpvs(cuts), t, **prep_kw(dkw, y_tit='MPV [vcal]', file_name='MPV'))
 
     def draw_cluster_size(self, t=False, cuts=None, **dkw):
-        return self.draw_graph(self.values(DUTAnalysis.cs, cuts), t, **prep_kw(dkw, y_tit='Cluster Size', file_name='CS'))
+        return self.draw_graph(self.table(DUTAnalysis.cs, cuts), t, **prep_kw(dkw, y_tit='Cluster Size', file_name='CS'))
 
     def draw_r_ph_cols(self, t=False, cuts=None, r=7, **dkw):
-        return self.draw_graph(self.values(DUTAnalysis.r_ph_cols, cuts, r=r), t, **prep_kw(dkw, y_tit='Pulse Height Ratio', file_name='RPHCols'))
+        return self.draw_graph(self.table(DUTAnalysis.r_ph_cols, cuts, r=r), t, **prep_kw(dkw, y_tit='Pulse Height Ratio', file_name='RPHCols'))
 
     def draw_ph_dists(self, cuts=None, **dkw):
         cuts = choose(cuts, self.Size * [None])
@@ -112,7 +249,7 @@ class Scan(Ensemble):
         h = [ana.draw_signal_around_cols(r0, r1, save=False, **rm_key(dkw, 'save')) for ana in self.Anas]
         return self.Draw.stack(h, 'PHDistsCols', self.x2str(), **prep_kw(dkw, scale=True, file_name='PhDistsCols'))
 
-# %% ../../nbs/39_src.scan.ipynb 6
+# %% ../../nbs/39_src.scan.ipynb 7
 class VScan(Scan):
 
     XArgs = {'x_tit': 'Bias [V]'}
@@ -126,7 +263,7 @@ class VScan(Scan):
     def x2str(self):
         return bias2rootstr(*self.x()).tolist()
 
-# %% ../../nbs/39_src.scan.ipynb 7
+# %% ../../nbs/39_src.scan.ipynb 8
 class TScan(Scan):
 
     XArgs = {'x_tit': 'Trim [vcal]'}
@@ -0,0 +1,189 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/46_src.standin.ipynb.
+
+# %% auto 0
+__all__ = ['StandIn', 'main']
+
+# %% ../../nbs/46_src.standin.ipynb 2
+import toml
+import uproot
+import awkward as ak
+from json import loads, dumps
+from pathlib import Path
+from shutil import copytree, ignore_patterns
+from sys import executable
+from time import perf_counter, sleep
+from numpy import array, full, nan, bincount, histogram2d, arange, round
+from fastcore.script import *
+
+from .analysis import Analysis
+from .converter import Converter
+from .synthetic import SyntheticRun
+from ..plotting.utils import info, choose
+
+# %% ../../nbs/46_src.standin.ipynb 4
+class StandIn:
+    """ Stand-ins for the EUDAQ2 and proteus executables, which regenerate the `SyntheticRun` of the raw file and write the outputs of the real programs. """
+
+    Progs = {'eudaq2': ['euCliConverter'], 'proteus': ['pt-noisescan', 'pt-align', 'pt-recon']}  # keys of the sub-directories in the [SOFTWARE] config
+    Key = 'standin'  # name of the string with the run settings in the root files
+
+    def __init__(self, soft_dir: Path, # software directory with the sub-directories for EUDAQ2 and proteus
+                 speed:float=None): # processed events per second, as fast as possible if None
+
+        self.SoftDir = Path(soft_dir).expanduser()
+        self.Speed = speed
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} executables in {self.SoftDir}' + ('' if self.Speed is None else f' ({self.Speed:.0f} ev/s)')
+
+    # ----------------------------------------
+    # region INSTALL
+    def exe(self, prog):
+        key = next(key for key, progs in StandIn.Progs.items() if prog in progs)
+        return self.SoftDir.joinpath(Analysis.Config.get('SOFTWARE', key), 'bin', prog)
+
+    @property
+    def exes(self):
+        return [self.exe(prog) for progs in StandIn.Progs.values() for prog in progs]
+
+    def install(self):
+        """writes the executables into the software directory. They are scripts and not `python -m`, which would put the working directory first in the import path."""
+        speed = [] if self.Speed is None else ['--speed', str(self.Speed)]
+        for f in self.exes:
+            f.parent.mkdir(parents=True, exist_ok=True)
+            f.write_text(f'#!{executable}\nimport sys\nfrom HighResAnalysis.src.standin import main\nsys.argv[1:1] = {[*speed, f.name]!r}\nmain()\n')
+            f.chmod(0o755)
+        info(f'installed {self!r}, set "dir = {self.SoftDir}" in the [SOFTWARE] section of the config to use them')
+        return self
+
+    def activate(self, proteus_dir: Path = None):
+        """points the config of the current session to the stand-ins.
+           :param proteus_dir: directory for a copy of the proteus configurations, since the stand-ins write masks and alignments like the real programs"""
+        self.install()
+        Analysis.Config.set('SOFTWARE', 'dir', str(self.SoftDir))
+        if proteus_dir is not None:
+            copytree(Converter.ProteusDir, proteus_dir, ignore=ignore_patterns('tmp-*', '*.root'), dirs_exist_ok=True)
+            Converter.ProteusDir = Path(proteus_dir)
+        return self
+    # endregion INSTALL
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region PROGRAMS
+    @staticmethod
+    def parse(args):
+        """:returns the positional arguments and the options {name: value} of the command line [args] of a real program"""
+        pos, opts, it = [], {}, iter(args)
+        for a in it:
+            if a.startswith('--'):
+                opts[a[2:].replace('-', '_')] = True  # flags like --no-progress
+            elif a.startswith('-'):
+                opts[a[1:]] = next(it)
+            else:
+                pos.append(a)
+        return pos, opts
+
+    @staticmethod
+    def load_run(f: Path, n=None, s=None):
+        """:returns the synthetic run of the raw file or the root file of the converter and the range of events to process"""
+        f = Path(f)
+        settings = loads(f.read_text() if f.suffix == '.raw' else str(uproot.open(f)[StandIn.Key]))
+        run = SyntheticRun.from_settings(settings)
+        s, n = int(choose(s, 0)), None if n is None else int(n)
+        n = run.NEvents - s if n is None or n < 0 else min(n, run.NEvents - s)
+        return run, s, s + n
+
+    @staticmethod
+    def occupancy(f: Path, out: Path):
+        """writes the hit maps of the planes in the root file [f] of the converter to the histogram file [out]"""
+        with uproot.open(f) as fin, uproot.recreate(out) as fout:
+            for key in fin.keys(recursive=False, cycle=False, filter_classname='TDirectory'):
+                x, y = [ak.flatten(fin[f'{key}/Hits'][f'Pix_{i}'].array()).to_numpy() for i in ['X', 'Y']]
+                fout[f'{key}/hitmap'] = histogram2d(x, y, bins=[arange(x.max(initial=0) + 2), arange(y.max(initial=0) + 2)])
+
+    @staticmethod
+    def write_tree(f, name, data: dict):
+        """writes [data] as TTree like the real programs (uproot writes RNTuples by default)"""
+        f.mktree(name, {k: v.type if isinstance(v, ak.Array) else v.dtype for k, v in data.items()})
+        f[name].extend(data)
+
+    def throttle(self, t0, n):
+        """waits until processing [n] events since [t0] took the time given by the speed"""
+        if self.Speed is not None:
+            sleep(max(0., n / self.Speed - (perf_counter() - t0)))
+
+    def eu_cli_converter(self, i, o, c=None, m=None):
+        """writes the time stamps, the pixel hits and the trigger phases of the synthetic run in the raw file [i] to the root file [o]"""
+        t0 = perf_counter()
+        run, s, e = StandIn.load_run(i, m)
+        t, trk, planes = run.generate()
+        with uproot.recreate(o) as f:
+            f[StandIn.Key] = dumps(run.Settings)
+            StandIn.write_tree(f, 'Event', {'TimeStamp': (t[s:e] * 1e9).astype('u8')})
+            for pl, (tracks, clusters, phase) in zip(run.Planes, planes):
+                n = bincount(trk['Events'][clusters['Size'] > 0], minlength=run.NEvents)  # one hit per cluster
+                i0, i1 = n[:s].sum(), n[:e].sum()
+                pix = {'X': round(clusters['X'][i0:i1]), 'Y': round(clusters['Y'][i0:i1]), 'Value': clusters['Charge'][i0:i1]}
+                hits = {'Pix': ak.zip({k: ak.unflatten(array(v, 'i4'), n[s:e]) for k, v in pix.items()})}
+                StandIn.write_tree(f, f'{pl}/Hits', hits if phase is None else {**hits, 'TriggerPhase': phase[s:e]})
+        self.throttle(t0, e - s)
+
+    def noise_scan(self, input, output, c=None, u=None, **kwargs):
+        """writes the (empty) masks of the sensors in the noise scan section [u] of the config [c]"""
+        t0 = perf_counter()
+        run, s, e = StandIn.load_run(input, kwargs.get('n'), kwargs.get('s'))
+        StandIn.occupancy(input, f'{output}-hists.root')
+        with open(f'{output}-mask.toml', 'w') as f:
+            toml.dump({'sensors': [{'id': dic['id'], 'masked_pixels': []} for dic in toml.load(c)['noisescan'][u]['sensors']]}, f)
+        self.throttle(t0, e - s)
+
+    def align(self, input, output, g=None, n=None, s=None, **kwargs):
+        """writes the geometry [g] as result of the alignment step, since the planes of the synthetic run are not misaligned"""
+        t0 = perf_counter()
+        run, s, e = StandIn.load_run(input, n, s)
+        StandIn.occupancy(input, f'{output}-hists.root')
+        geo = toml.load(g)
+        geo['beam'] = {**geo.get('beam', {}), 'divergence': [run.Div] * 2, 'slope': [0., 0.]}
+        with open(f'{output}-geo.toml', 'w') as f:
+            toml.dump(geo, f)
+        self.throttle(t0, e - s)
+
+    def recon(self, input, output, d=None, n=None, s=None, **kwargs):
+        """writes the tracks with the interpolations and the matched clusters of all sensors in the device config [d]"""
+        t0 = perf_counter()
+        run, s, e = StandIn.load_run(input, n, s)
+        dev = toml.load(d)
+        masks = {dic['id']: array(dic['masked_pixels'], 'i4').reshape(-1, 2) for m in dev['pixel_masks'] if Path(m).exists() for dic in toml.load(m)['sensors']}
+        t, trk, planes = run.generate()
+        cut = (trk['Events'] >= s) & (trk['Events'] < e)
+        track_branches = {'evt_frame': trk['Events'], 'evt_ntracks': trk['N'], 'trk_size': trk['Size'], 'trk_chi2': trk['Chi2'], 'trk_dof': trk['Dof'], 'trk_du': trk['SlopeX'], 'trk_dv': trk['SlopeY']}
+        StandIn.occupancy(input, f'{output}-hists.root')
+        with uproot.recreate(f'{output}-trees.root') as f:
+            for i, (sensor, (tracks, clusters, phase)) in enumerate(zip(dev['sensors'], planes)):
+                m = masks.get(i, array([], 'i4').reshape(0, 2))
+                StandIn.write_tree(f, f'{sensor["name"]}/masked_pixels', {'col': m[:, 0], 'row': m[:, 1]})
+                hit = clusters['Size'] > 0
+                clu = {k: full(hit.size, nan) for k in ['U', 'V', 'X', 'Y']}  # proteus fills nan for tracks without matched cluster
+                for k in clu:
+                    clu[k][hit] = clusters[k]
+                value = full(hit.size, 0, 'i4')
+                value[hit] = clusters['Charge']
+                b = {**track_branches, 'trk_u': tracks['U'], 'trk_v': tracks['V'], 'trk_col': tracks['X'], 'trk_row': tracks['Y'], 'trk_std_u': tracks['eU'], 'trk_std_v': tracks['eV'],
+                     'clu_size': clusters['Size'], 'evt_nclusters': clusters['N'], 'clu_u': clu['U'], 'clu_v': clu['V'], 'clu_col': clu['X'], 'clu_row': clu['Y'], 'clu_value': value}
+                StandIn.write_tree(f, f'{sensor["name"]}/tracks_clusters_matched', {k: array(v, 'f4' if array(v).dtype == 'f2' else None)[cut] for k, v in b.items()})  # no half floats in ROOT
+        self.throttle(t0, e - s)
+    # endregion PROGRAMS
+    # ----------------------------------------
+
+# %% ../../nbs/46_src.standin.ipynb 5
+@call_parse
+def main(prog:str,                # euCliConverter, pt-noisescan, pt-align, pt-recon or install
+         args:Param('arguments of the real program or the software directory for install', nargs='...', opt=False)=None,
+         speed:float=None):       # processed events per second, as fast as possible by default
+    "run the stand-in of a program of EUDAQ2 or proteus or install the stand-ins"
+    if prog == 'install':
+        return StandIn(args[0], speed).install()
+    tool = StandIn(Path(), speed)
+    f = {'euCliConverter': tool.eu_cli_converter, 'pt-noisescan': tool.noise_scan, 'pt-align': tool.align, 'pt-recon': tool.recon}[prog]
+    pos, opts = StandIn.parse(args)
+    f(*pos, **opts)
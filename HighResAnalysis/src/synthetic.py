@@ -0,0 +1,215 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/44_src.synthetic.ipynb.
+
+# %% auto 0
+__all__ = ['SyntheticRun']
+
+# %% ../../nbs/44_src.synthetic.ipynb 2
+import h5py
+import toml
+from json import dump
+from pathlib import Path
+from numpy import arange, array, zeros, ones, full, repeat, floor, clip, cumsum, ceil, where, minimum
+from numpy.random import default_rng
+
+from .analysis import Analysis, BeamTest
+from .dut import Plane
+from ..plotting.utils import info, add_to_info, load_json, choose, remove_file, GREEN
+from ..utility.utils import Dir, remove_letters
+
+# %% ../../nbs/44_src.synthetic.ipynb 4
+class SyntheticRun:
+    """ Simulated run with straight tracks through the planes of the proteus geometry of the beam test.
+        The tracks have a Gaussian beam spot and divergence, each plane records a cluster with its efficiency if the track hits the sensor. """
+
+    Number = 900     # default run number, above the real runs of all beam tests
+    TelEff = .99     # efficiency of the telescope planes
+    TelRes = 3.5e-3  # spatial resolution of the telescope planes [mm]
+
+    # data types of the converter, see `Converter.root2hdf5`
+    Types = {'Tracks': {'Events': 'u4', 'N': 'u1', 'Size': 'f2', 'Chi2': 'f2', 'Dof': 'u1', 'SlopeX': 'f2', 'SlopeY': 'f2'},
+             'PlaneTracks': {'U': 'f2', 'V': 'f2', 'X': 'f4', 'Y': 'f4', 'eU': 'f2', 'eV': 'f2'},
+             'Clusters': {'Size': 'u2', 'N': 'u2', 'U': 'f2', 'V': 'f2', 'X': 'f2', 'Y': 'f2', 'Charge': 'i'}}
+
+    def __init__(self, beam_test: BeamTest, # beam test to which the run is added
+                 number:int=None, # run number
+                 n_events:int=100000, # number of triggered events
+                 duts:list=None, # DUT names, defaults to all DUTs with a pulse height calibration in the beam test
+                 eff=.98, # efficiency of the DUTs, single value or one per DUT
+                 tracks:float=.9, # mean number of tracks per event
+                 spot=(3., 3.), # sigma of the beam spot in x and y [mm]
+                 div:float=1e-3, # beam divergence [rad]
+                 rate:float=2e3, # trigger rate [Hz]
+                 seed:int=0): # seed of the random generator
+
+        self.BeamTest = beam_test
+        self.Number = choose(number, SyntheticRun.Number)
+        self.NEvents = int(n_events)
+        self.DUTs = choose(duts, self.find_duts)
+        self.Eff = array(eff, 'd') * ones(len(self.DUTs))
+        self.NTracks, self.Spot, self.Div, self.Rate = tracks, array(spot, 'd').reshape(2, 1), div, rate
+        self.Seed = seed
+        self.Comment = f'synthetic run ({self.NEvents} ev, eff {self.Eff.round(4).tolist()}, seed {self.Seed})'
+
+        # GEOMETRY
+        self.ConfigDir = Dir.joinpath('proteus', self.BeamTest.Name)
+        self.NTelPlanes = Analysis.Config.getint('TELESCOPE', 'planes')
+        self.NRefPlanes = sum(['REF' in d['type'] for d in toml.load(str(self.ConfigDir.joinpath('device.toml')))['sensors']])
+        self.Planes = self.init_planes()
+        self.Z = self.init_z()
+
+        self.FileName = self.BeamTest.Path.joinpath('data', f'run{self.Number:04d}.hdf5')
+        self.RawFileName = self.BeamTest.Path.joinpath('raw', f'run{self.Number:06d}.raw')
+        self.LogFile = self.BeamTest.Path.joinpath(Analysis.Config.get('data', 'runlog file'))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} {self.Number} ({self.BeamTest}, {self.NEvents} ev, DUTs: {", ".join(self.DUTs)})'
+
+    @property
+    def exists(self):
+        """:returns whether the run was already written with the same settings"""
+        return self.FileName.exists() and self.LogFile.exists() and load_json(self.LogFile).get(str(self.Number), {}).get('comment') == self.Comment
+
+    @property
+    def Settings(self):
+        """:returns the arguments to recreate the run with `from_settings`"""
+        return {'beam_test': str(self.BeamTest.Path), 'number': self.Number, 'n_events': self.NEvents, 'duts': list(self.DUTs), 'eff': self.Eff.tolist(), 'tracks': self.NTracks,
+                'spot': self.Spot.ravel().tolist(), 'div': self.Div, 'rate': self.Rate, 'seed': self.Seed}
+
+    @classmethod
+    def from_settings(cls, settings: dict, **kwargs):
+        d = {**settings, **kwargs}
+        return cls(BeamTest(Path(d.pop('beam_test'))), **d)
+
+    # ----------------------------------------
+    # region INIT
+    @property
+    def calibration_dir(self):
+        return Dir.joinpath('calibration', self.BeamTest.Name)
+
+    def find_duts(self):
+        return sorted(d.name for d in self.calibration_dir.glob('*') if d.is_dir())
+
+    def find_trim(self, dut):
+        """:returns the first pulse height calibration of the [dut] as 'trim-number' like in the run log"""
+        f = sorted(self.calibration_dir.joinpath(dut).glob('phCalibration[0-9]*_*-*.dat'))
+        return f'{remove_letters(f[0].stem.split("_")[0])}-{f[0].stem.split("-")[-1]}' if f else ''
+
+    def init_planes(self):
+        pl = [Plane(i, typ='TELESCOPE') for i in range(self.NTelPlanes)] + [Plane(self.NTelPlanes + i, typ='REF') for i in range(self.NRefPlanes)]
+        return pl + [Plane(len(pl) + i, typ='DUT') for i in range(len(self.DUTs))]
+
+    def init_z(self):
+        """:returns the z positions [mm] of the planes from the default geometry, which has all DUT slots"""
+        z = array([s['offset'][-1] for s in toml.load(str(self.ConfigDir.joinpath('geometry.toml')))['sensors']])
+        n = self.NTelPlanes + self.NRefPlanes
+        return array(list(z[:n]) + [z[min(n + i, z.size - 1)] for i in range(len(self.DUTs))])
+    # endregion INIT
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region GENERATE
+    @staticmethod
+    def to_local(uv, pl: Plane):
+        """:returns column and row of the metric local coordinates [uv] with the pixel centres at the integers"""
+        return uv / pl.PXY.reshape(2, 1) + (array([pl.NCols, pl.NRows]) / 2 - .5).reshape(2, 1)
+
+    @staticmethod
+    def to_metric(xy, pl: Plane):
+        return (xy - (array([pl.NCols, pl.NRows]) / 2 - .5).reshape(2, 1)) * pl.PXY.reshape(2, 1)
+
+    def generate_tracks(self, rng):
+        n_trk = minimum(rng.poisson(self.NTracks, self.NEvents), 255)
+        ev = repeat(arange(self.NEvents), n_trk)
+        size = where(rng.random(ev.size) < .95, self.NTelPlanes, self.NTelPlanes - 1)
+        dof = 2 * size - 4
+        return {'Events': ev.astype('u4'), 'N': n_trk[ev].astype('u1'), 'Size': size.astype('f2'), 'Chi2': rng.chisquare(dof).astype('f2'), 'Dof': dof.astype('u1'),
+                'SlopeX': rng.normal(0, self.Div, ev.size), 'SlopeY': rng.normal(0, self.Div, ev.size)}
+
+    def generate_plane(self, rng, pl: Plane, uv, eff):
+        """:returns the track interpolations and the matched clusters of the plane [pl] for the track positions [uv] [mm]"""
+        n = uv.shape[1]
+        txy = self.to_local(uv, pl)
+        hit = (txy > -.5).all(0) & (txy < array([pl.NCols, pl.NRows]).reshape(2, 1) - .5).all(0) & (rng.random(n) < eff)
+        size = where(hit, 1 + minimum(rng.poisson(.4 if pl.IsDUT else 1.5, n), 9), 0)
+        if pl.IsDUT:  # single pixel clusters are in the centre of the pixel
+            xy = where(size == 1, floor(txy + .5), txy + rng.normal(0, .15, (2, n)))
+        else:
+            xy = txy + rng.normal(0, SyntheticRun.TelRes, (2, n)) / pl.PXY.reshape(2, 1)
+        cuv = self.to_metric(xy, pl)
+        charge = clip(rng.gumbel(100, 20, n), 1, None) if pl.IsDUT else size
+        tracks = {'U': uv[0], 'V': uv[1], 'X': txy[0], 'Y': txy[1], 'eU': full(n, 4e-3), 'eV': full(n, 4e-3)}
+        clusters = {'Size': size, 'N': hit + rng.poisson(.05, n), 'U': cuv[0][hit], 'V': cuv[1][hit], 'X': xy[0][hit], 'Y': xy[1][hit], 'Charge': charge[hit]}
+        return tracks, clusters
+
+    def generate(self):
+        """:returns the event times [s], the tracks and for each plane the track interpolations, the matched clusters and the trigger phases (None for non-DUT planes)"""
+        rng = default_rng(self.Seed)
+        trk = self.generate_tracks(rng)
+        uv0 = rng.normal(0, self.Spot, (2, trk['Events'].size))
+        t = cumsum(rng.exponential(1 / self.Rate, self.NEvents))
+        planes = []
+        for pl, z in zip(self.Planes, self.Z):
+            eff = self.Eff[pl.Number - self.NTelPlanes - self.NRefPlanes] if pl.IsDUT else SyntheticRun.TelEff
+            tracks, clusters = self.generate_plane(rng, pl, uv0 + array([trk['SlopeX'], trk['SlopeY']]) * z, eff)
+            phase = rng.binomial(10, .55, self.NEvents).astype('u1') if pl.Number >= self.NTelPlanes + self.NRefPlanes else None
+            planes.append((tracks, clusters, phase))
+        return t, trk, planes
+
+    def write(self):
+        """generates the run, writes the hdf5 file and adds the run to the run log"""
+        t0 = info(f'generating {self!r} ...', endl=False)
+        t, trk, planes = self.generate()
+        self.FileName.parent.mkdir(parents=True, exist_ok=True)
+        with h5py.File(self.FileName, 'w') as f:
+            f.create_group('Event').create_dataset('Time', data=(t - t[0]).astype('f4'))
+            self.add_data(f.create_group('Tracks'), trk, SyntheticRun.Types['Tracks'])
+            for pl, (tracks, clusters, phase) in zip(self.Planes, planes):
+                g = f.create_group(str(pl))
+                g.create_dataset('Mask', data=zeros((2, 0), 'u2'))  # no masked pixels
+                self.add_data(g.create_group('Tracks'), tracks, SyntheticRun.Types['PlaneTracks'])
+                self.add_data(g.create_group('Clusters'), clusters, SyntheticRun.Types['Clusters'])
+                if phase is not None:
+                    g.create_group('Trigger').create_dataset('Phase', data=phase)
+        self.add_to_runlog(t[-1] - t[0])
+        add_to_info(t0, color=GREEN)
+        return self.FileName
+
+    def write_raw(self):
+        """writes the settings as raw file of the run, which the stand-in of the EUDAQ converter turns into data (see `StandIn`)"""
+        self.RawFileName.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.RawFileName, 'w') as f:
+            dump(self.Settings, f)
+        self.add_to_runlog(self.NEvents / self.Rate)
+        return self.RawFileName
+
+    @staticmethod
+    def add_data(g, data, types):
+        for key, dtype in types.items():
+            g.create_dataset(key, data=array(data[key]).astype(dtype))
+    # endregion GENERATE
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region RUN LOG
+    def make_log(self, duration):
+        start = int(self.BeamTest.T.timestamp()) + self.Number * 60
+        n = len(self.DUTs)
+        return {'start': start, 'end': start + int(ceil(duration)), 'events': self.NEvents, 'duts': list(self.DUTs), 'hv supplies': [''] * n, 'hv': ['100'] * n,
+                'current': [''] * n, 'trim': [self.find_trim(dut) for dut in self.DUTs], 'angle': 0, 'status': 'green', 'batch': f'S{self.Number}',
+                'comment': self.Comment, 'dut position': list(range(n))}
+
+    def add_to_runlog(self, duration):
+        log = load_json(self.LogFile) if self.LogFile.exists() else {}
+        log[str(self.Number)] = self.make_log(duration)
+        with open(self.LogFile, 'w') as f:
+            dump(log, f, indent=2)
+
+    def remove(self):
+        """removes the hdf5 file and the entry in the run log"""
+        remove_file(self.FileName, self.RawFileName, warn=False)
+        log = load_json(self.LogFile) if self.LogFile.exists() else {}
+        if log.pop(str(self.Number), None) is not None:
+            with open(self.LogFile, 'w') as f:
+                dump(log, f, indent=2)
+    # endregion RUN LOG
+    # ----------------------------------------
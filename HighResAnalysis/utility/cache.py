@@ -0,0 +1,329 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/43_utility.cache.ipynb.
+
+# %% auto 0
+__all__ = ['ContentIDs', 'MetaCache', 'set_cid', 'get_cid', 'combine_cid', 'fast_hash', 'array_id', 'main']
+
+# %% ../../nbs/43_utility.cache.ipynb 2
+import sqlite3
+import pickle
+import h5py
+from io import BytesIO
+from os import getpid
+from pathlib import Path
+from time import time
+from atexit import register
+from fnmatch import fnmatchcase
+from collections import OrderedDict
+from numpy import save, load, ndarray, array, ascontiguousarray, packbits
+from weakref import ref
+from zlib import crc32, adler32
+from hashlib import md5
+from fastcore.script import *
+
+from ..plotting.utils import info, choose, remove_file
+
+# %% ../../nbs/43_utility.cache.ipynb 4
+class MetaCache:
+    """ Store of the meta data of the analyses with a size budget, LRU eviction and hit/miss statistics. """
+
+    Budget = 20.  # GB
+    Stores = {}   # one store per directory
+    Miss = object()
+
+    Memo = OrderedDict()  # recently used entries of all stores in memory {(store, key): (kind, value, size, content ID)}
+    MemoSize = 0
+    MemoBudget = 2.  # GB
+
+    UsageBuffer = 100  # number of entries whose last use and hits are buffered before they are written
+    Flush = None  # exit hook writing the buffered usage of all stores, registered with the first store
+
+    def __init__(self, d):
+        self.Dir = Path(d)
+        self.FileName = self.Dir.joinpath('cache.sqlite')
+        self.PID, self.Con = None, None
+        self.Total = None  # size of the store in bytes, only queried once per process and then tracked in memory
+        self.Used = {}  # buffered usage {key: (last use, hits)} which is not yet written
+
+        # Statistics of this process
+        self.Hits = self.Misses = self.Writes = self.Evictions = self.MemoHits = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} in {self.FileName}'
+
+    # ----------------------------------------
+    # region INIT
+    @staticmethod
+    def load(d):
+        d = Path(d)
+        if d not in MetaCache.Stores:
+            MetaCache.Stores[d] = MetaCache(d)
+        if MetaCache.Flush is None:
+            MetaCache.Flush = register(MetaCache.flush_all)
+        return MetaCache.Stores[d]
+
+    @staticmethod
+    def from_path(p, root=None):
+        """:returns the store of the meta directory [root] and the key of the meta file path [p] in it"""
+        p = Path(p)
+        if root is None or Path(root) not in p.parents:
+            raise ValueError(f'meta file {p} is not in the meta directory {root}')
+        return MetaCache.load(root), p.relative_to(root).as_posix()
+
+    @property
+    def con(self):
+        """:returns the connection to the store, which has to be reopened in forked processes"""
+        if self.PID != getpid():
+            self.Dir.mkdir(parents=True, exist_ok=True)
+            self.Con = sqlite3.connect(self.FileName, timeout=60, isolation_level=None)
+            self.Con.execute('PRAGMA journal_mode=WAL')
+            self.Con.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, kind TEXT, data BLOB, size INTEGER, created REAL, used REAL, hits INTEGER DEFAULT 0)')
+            self.Con.execute('CREATE INDEX IF NOT EXISTS used_idx ON cache(used)')
+            self.PID, self.Total, self.Used = getpid(), None, {}  # the buffered usage belongs to the parent process
+        return self.Con
+    # endregion INIT
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region ENCODING
+    @staticmethod
+    def encode(value):
+        if isinstance(value, ndarray) and value.dtype != object:
+            b = BytesIO()
+            save(b, value, allow_pickle=False)
+            return 'npy', b.getvalue()
+        return 'pickle', pickle.dumps(value)
+
+    @staticmethod
+    def decode(kind, data):
+        return load(BytesIO(data), allow_pickle=False) if kind == 'npy' else pickle.loads(data)
+
+    def migrate(self, key):
+        """moves the old meta file of [key] into the store"""
+        p = self.Dir.joinpath(key)
+        if not p.is_file():
+            return MetaCache.Miss
+        try:
+            if p.suffix == '.hdf5':
+                with h5py.File(p, 'r') as f:
+                    value = array(f['data'])
+            else:
+                with open(p, 'rb') as f:
+                    value = pickle.load(f)
+        except (OSError, KeyError, EOFError, pickle.UnpicklingError, ImportError):
+            return MetaCache.Miss
+        self.put(key, value)
+        remove_file(p, warn=False)
+        return value
+    # endregion ENCODING
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region MEMO
+    def memo_get(self, key):
+        m = MetaCache.Memo.get((self.FileName, key))
+        if m is None:
+            return MetaCache.Miss
+        MetaCache.Memo.move_to_end((self.FileName, key))
+        kind, value, size, cid = m
+        return set_cid(value.view(), cid) if kind == 'npy' else pickle.loads(value)
+
+    def memo_put(self, key, kind, value, data, t, copy=False):
+        """keeps arrays as read-only arrays (tagged with a content ID) and other values as pickled bytes in memory, :returns the value.
+        With [copy] a copy of the array is kept, such that the [value] of the caller stays writable."""
+        self.memo_drop(key)
+        cid = md5(f'{self.FileName}{key}{t}'.encode()).hexdigest()[:16]  # changes whenever the entry is written
+        if kind == 'npy':
+            a = value.copy() if copy else value
+            a.flags.writeable = False
+            set_cid(a, cid)
+        m = (kind, a, a.nbytes, cid) if kind == 'npy' else (kind, data, len(data), cid)
+        if m[2] <= MetaCache.MemoBudget * 2 ** 30:
+            MetaCache.Memo[(self.FileName, key)] = m
+            MetaCache.MemoSize += m[2]
+            while MetaCache.MemoSize > MetaCache.MemoBudget * 2 ** 30:
+                MetaCache.MemoSize -= MetaCache.Memo.popitem(last=False)[1][2]
+        return value
+
+    def memo_drop(self, *keys):
+        for key in keys:
+            m = MetaCache.Memo.pop((self.FileName, key), None)
+            MetaCache.MemoSize -= 0 if m is None else m[2]
+    # endregion MEMO
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region GET
+    def get(self, key):
+        """:returns the value of [key] or `MetaCache.Miss` if it is not stored. Recently used entries are taken from memory.
+        The usage of all entries is buffered, see `use`."""
+        value = self.memo_get(key)
+        if value is not MetaCache.Miss:
+            self.MemoHits += 1
+            self.use(key)
+            return value
+        row = self.con.execute('SELECT kind, data, created FROM cache WHERE key=?', (key,)).fetchone()
+        value = self.memo_put(key, row[0], self.decode(*row[:2]), row[1], row[2]) if row is not None else self.migrate(key)
+        if value is MetaCache.Miss:
+            self.Misses += 1
+        else:
+            self.Hits += 1
+            self.use(key)
+        return value
+
+    def use(self, key):
+        """buffers the last use and the hit of [key], such that reads do not write to the store"""
+        self.Used[key] = (time(), self.Used.get(key, (0, 0))[1] + 1)
+        if len(self.Used) >= MetaCache.UsageBuffer:
+            self.flush()
+
+    def flush(self):
+        """writes the buffered usage in a single transaction"""
+        con = self.con
+        if self.Used:
+            used, self.Used = self.Used, {}
+            con.execute('BEGIN')
+            con.executemany('UPDATE cache SET used=?, hits=hits+? WHERE key=?', [(t, n, key) for key, (t, n) in used.items()])
+            con.execute('COMMIT')
+
+    @staticmethod
+    def flush_all():
+        for store in MetaCache.Stores.values():
+            store.flush() if store.PID == getpid() else None
+
+    def __contains__(self, key):
+        return self.con.execute('SELECT 1 FROM cache WHERE key=?', (key,)).fetchone() is not None or self.Dir.joinpath(key).is_file()
+
+    def keys(self, pattern='*'):
+        """:returns all keys matching the glob [pattern]"""
+        return [k for k, in self.con.execute('SELECT key FROM cache WHERE key GLOB ?', (pattern,))]
+
+    def sizes(self, pattern='*'):
+        """:returns the keys and sizes in bytes of all entries matching the glob [pattern]"""
+        return self.con.execute('SELECT key, size FROM cache WHERE key GLOB ?', (pattern,)).fetchall()
+
+    def size(self, pattern='*'):
+        return self.con.execute('SELECT TOTAL(size) FROM cache WHERE key GLOB ?', (pattern,)).fetchone()[0]
+
+    def stats(self):
+        self.flush()
+        n, size, hits = self.con.execute('SELECT COUNT(*), TOTAL(size), TOTAL(hits) FROM cache').fetchone()
+        return {'entries': n, 'size': size, 'budget': MetaCache.Budget * 2 ** 30, 'total hits': int(hits),
+                'hits': self.Hits, 'misses': self.Misses, 'writes': self.Writes, 'evictions': self.Evictions,
+                'memo hits': self.MemoHits, 'memo entries': len(MetaCache.Memo), 'memo size': MetaCache.MemoSize, 'memo budget': MetaCache.MemoBudget * 2 ** 30}
+
+    def print_stats(self):
+        from HighResAnalysis.utility.utils import byte2str
+        s = self.stats()
+        info(f'{self}: {s["entries"]} entries, {byte2str(s["size"])} of {byte2str(s["budget"])}, {s["total hits"]} hits in total')
+        info(f'this session: {s["hits"]} hits, {s["misses"]} misses, {s["writes"]} writes, {s["evictions"]} evictions')
+        info(f'memory: {s["memo hits"]} hits, {s["memo entries"]} entries, {byte2str(s["memo size"])} of {byte2str(s["memo budget"])}')
+    # endregion GET
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region SET
+    @property
+    def total(self):
+        """:returns the size of the store in bytes, which is tracked in memory after the first query"""
+        if self.Total is None or self.PID != getpid():
+            self.Total = self.size()
+        return self.Total
+
+    def put(self, key, value):
+        kind, data = self.encode(value)
+        t, total = time(), self.total
+        old = self.con.execute('SELECT size FROM cache WHERE key=?', (key,)).fetchone()
+        self.con.execute('INSERT OR REPLACE INTO cache (key, kind, data, size, created, used) VALUES (?, ?, ?, ?, ?, ?)', (key, kind, data, len(data), t, t))
+        self.Writes += 1
+        self.Used.pop(key, None)
+        self.Total = total + len(data) - (0 if old is None else old[0])
+        self.evict() if self.Total > MetaCache.Budget * 2 ** 30 else None
+        return self.memo_put(key, kind, value, data, t, copy=True)
+
+    def evict(self, budget=None):
+        """removes the least recently used entries until the store is smaller than [budget] GB, :returns the number of removed entries"""
+        self.flush()  # the order needs the last uses
+        self.Total = self.size()  # other processes may have written to the store as well
+        excess = self.Total - choose(budget, MetaCache.Budget) * 2 ** 30
+        if excess <= 0:
+            return 0
+        keys = []
+        for key, size in self.con.execute('SELECT key, size FROM cache ORDER BY used'):
+            keys.append((key,))
+            excess -= size
+            self.Total -= size
+            if excess <= 0:
+                break
+        self.con.executemany('DELETE FROM cache WHERE key=?', keys)
+        self.memo_drop(*[key for key, in keys])
+        self.Evictions += len(keys)
+        return len(keys)
+
+    def remove(self, pattern):
+        """removes all entries matching the glob [pattern], :returns the number of removed entries"""
+        self.memo_drop(*[key for f, key in list(MetaCache.Memo) if f == self.FileName and fnmatchcase(key, pattern)])
+        self.Total = None
+        return self.con.execute('DELETE FROM cache WHERE key GLOB ?', (pattern,)).rowcount
+
+    def vacuum(self):
+        """shrinks the file after entries were removed"""
+        self.con.execute('VACUUM')
+    # endregion SET
+    # ----------------------------------------
+
+# %% ../../nbs/43_utility.cache.ipynb 6
+ContentIDs = {}  # id of the array -> (weak reference, content ID)
+
+# %% ../../nbs/43_utility.cache.ipynb 7
+def set_cid(a, cid):
+    "tags the array [a] with the content ID [cid], :returns [a]"
+    if isinstance(a, ndarray) and cid is not None:
+        k = id(a)
+        ContentIDs[k] = (ref(a, lambda _: ContentIDs.pop(k, None)), cid)
+    return a
+
+# %% ../../nbs/43_utility.cache.ipynb 8
+def get_cid(a):
+    ":returns the content ID of the array [a] or `None` if it is not tagged"
+    r = ContentIDs.get(id(a))
+    return r[1] if r is not None and r[0]() is a else None
+
+# %% ../../nbs/43_utility.cache.ipynb 9
+def combine_cid(op:str, *arrays):
+    ":returns the content ID of the result of [op] applied to the [arrays] or `None` if one of them is not tagged"
+    ids = [get_cid(a) for a in arrays]
+    return None if None in ids else md5(f'{op}{ids}'.encode()).hexdigest()[:16]
+
+# %% ../../nbs/43_utility.cache.ipynb 10
+def fast_hash(a:ndarray) -> str:
+    ":returns a fast non-cryptographic 64 bit hash of the content of the array [a]"
+    b = ascontiguousarray(packbits(a) if a.dtype == bool else a)
+    return f'{a.dtype.char}{a.size}_{crc32(b):08x}{adler32(b):08x}'
+
+# %% ../../nbs/43_utility.cache.ipynb 11
+def array_id(a:ndarray) -> str:
+    ":returns the content ID of the array [a] or the hash of its content if it is not tagged"
+    cid = get_cid(a)
+    return fast_hash(a) if cid is None else cid
+
+# %% ../../nbs/43_utility.cache.ipynb 12
+@call_parse
+def main(d:str=None,            # meta directory, defaults to the one of the main config
+         ls:str=None,           # list the entries matching this glob pattern
+         rm:str=None,           # remove the entries matching this glob pattern
+         prune:float=None,      # evict least recently used entries until the store is smaller than this [GB]
+         vacuum:bool=False):    # shrink the file after removing entries
+    "inspect and prune the meta cache"
+    from HighResAnalysis.src.analysis import Analysis
+    from HighResAnalysis.utility.utils import byte2str
+    c = MetaCache.load(choose(d, Analysis.MetaDir))
+    if ls is not None:
+        for key, size in c.sizes(ls):
+            print(f'{byte2str(size):>10}  {key}')
+    if rm is not None:
+        info(f'removed {c.remove(rm)} entries')
+    if prune is not None:
+        info(f'evicted {c.evict(prune)} entries')
+    if vacuum:
+        c.vacuum()
+    c.print_stats()
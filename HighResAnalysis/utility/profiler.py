@@ -0,0 +1,242 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/47_utility.profiler.ipynb.
+
+# %% auto 0
+__all__ = ['Stage', 'Profiler', 'profiled']
+
+# %% ../../nbs/47_utility.profiler.ipynb 2
+import cProfile
+import marshal
+from atexit import register
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from json import dump
+from os import times, getpid
+from pathlib import Path
+from resource import getrusage, RUSAGE_SELF
+from sys import setprofile
+from time import perf_counter
+
+from ..plotting import html
+from ..plotting.utils import info, choose
+from .utils import Dir, print_table, byte2str, ensure_dir
+
+# %% ../../nbs/47_utility.profiler.ipynb 4
+class Stage:
+    """ Node of the profile tree with the resources summed over all calls of the stage. """
+
+    def __init__(self, name, parent=None):
+        self.Name, self.Parent = name, parent
+        self.Children = {}
+        self.Calls = 0
+        self.Wall = self.CPU = 0.  # [s]
+        self.RSS = 0               # peak resident memory [B]
+        self.Read = 0              # [B]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} {self.Name} ({self.Calls} calls, {self.Wall:.3f} s)'
+
+    def child(self, name):
+        if name not in self.Children:
+            self.Children[name] = Stage(name, self)
+        return self.Children[name]
+
+    def add(self, wall=0., cpu=0., rss=0, read=0, calls=1):
+        self.Calls += calls
+        self.Wall, self.CPU, self.RSS, self.Read = self.Wall + wall, self.CPU + cpu, max(self.RSS, rss), self.Read + read
+
+    def merge(self, d: dict):
+        """adds the stage tree [d] (e.g. from a worker process) as child"""
+        s = self.child(d['name'])
+        s.add(d['wall'], d['cpu'], d['rss'], d['read'], d['calls'])
+        for c in d['children']:
+            s.merge(c)
+
+    def to_dict(self):
+        return {'name': self.Name, 'calls': self.Calls, 'wall': round(self.Wall, 6), 'cpu': round(self.CPU, 6), 'rss': self.RSS, 'read': self.Read,
+                'children': [c.to_dict() for c in self.Children.values()]}
+
+    def walk(self, depth=0):
+        """:returns all stages of the tree with their depth"""
+        yield depth, self
+        for c in self.Children.values():
+            yield from c.walk(depth + 1)
+
+# %% ../../nbs/47_utility.profiler.ipynb 5
+class Profiler:
+    """ Lightweight timer and memory tracker of the stages of the analysis and the conversion. """
+
+    Active = False
+    CProfile = False  # profile the outermost stages with cProfile and keep the slowest
+    Dir = Dir.joinpath('profiles')
+
+    Root = Stage('total')
+    Stack = [Root]
+    T0 = None       # state at the start
+    Prof = None     # running cProfile.Profile
+    Slowest = None  # (wall time, stage name, cProfile statistics) of the slowest outermost stage
+
+    @staticmethod
+    def start(name, cprofile=False):
+        """activates the profiler, the report is written at exit"""
+        Profiler.Active, Profiler.CProfile = True, cprofile
+        Profiler.Root = Stage(name)
+        Profiler.Stack = [Profiler.Root]
+        Profiler.peak_rss(reset=True)
+        Profiler.T0 = Profiler.state()
+        register(Profiler.save)
+
+    # ----------------------------------------
+    # region RESOURCES
+    @staticmethod
+    def state():
+        """:returns the wall time, the CPU time (with the finished child processes) and the bytes read of the process"""
+        t = times()
+        return perf_counter(), t.user + t.system + t.children_user + t.children_system, Profiler.bytes_read()
+
+    @staticmethod
+    def bytes_read():
+        try:
+            return int(next(line for line in Path('/proc/self/io').read_text().splitlines() if line.startswith('rchar')).split()[1])
+        except (OSError, StopIteration):
+            return 0
+
+    @staticmethod
+    def peak_rss(reset=False):
+        """:returns the peak resident memory [B] since the last reset (only on Linux, otherwise the peak of the process)"""
+        try:
+            v = int(next(line for line in Path('/proc/self/status').read_text().splitlines() if line.startswith('VmHWM')).split()[1]) * 1024
+        except (OSError, StopIteration):
+            return getrusage(RUSAGE_SELF).ru_maxrss * 1024
+        if reset:
+            try:
+                Path('/proc/self/clear_refs').write_text('5')
+            except OSError:
+                pass
+        return v
+    # endregion RESOURCES
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region STAGES
+    @staticmethod
+    def stage(name):
+        """:returns the context manager recording the stage [name] inside the current stage, which does nothing if the profiler is not active"""
+        return Profiler._stage(name) if Profiler.Active else nullcontext()
+
+    @staticmethod
+    @contextmanager
+    def _stage(name):
+        parent = Profiler.Stack[-1]
+        s = parent.child(name)
+        parent.RSS = max(parent.RSS, Profiler.peak_rss(reset=True))
+        Profiler.Stack.append(s)
+        prof = Profiler.start_cprofile()
+        t0 = Profiler.state()
+        try:
+            yield s
+        finally:
+            t1 = Profiler.state()
+            Profiler.stop_cprofile(prof, t1[0] - t0[0], name)
+            Profiler.Stack.pop()
+            s.add(*[v1 - v0 for v0, v1 in zip(t0[:2], t1[:2])], Profiler.peak_rss(reset=True), t1[2] - t0[2])
+            parent.RSS = max(parent.RSS, s.RSS)
+
+    @staticmethod
+    def start_cprofile():
+        if Profiler.CProfile and Profiler.Prof is None:
+            Profiler.Prof = cProfile.Profile()
+            Profiler.Prof.enable()
+            return Profiler.Prof
+
+    @staticmethod
+    def stop_cprofile(prof, wall, name):
+        if prof is not None:
+            prof.disable()
+            Profiler.Prof = None
+            if Profiler.Slowest is None or wall > Profiler.Slowest[0]:
+                prof.create_stats()
+                Profiler.Slowest = (wall, name, prof.stats)
+
+    @staticmethod
+    def fork():
+        """resets the cProfile state inherited by a forked worker process, use as initializer of the pools"""
+        setprofile(None)  # drop the inherited hook, disabling the inherited profiler object corrupts the heap of the child
+        Profiler.Prof, Profiler.Slowest = None, None
+
+    @staticmethod
+    def export(s: Stage):
+        """:returns the stage [s] of a worker process and its slowest cProfile statistics for `merge`"""
+        d = None if s is None else {'stage': s.to_dict(), 'slowest': Profiler.Slowest}
+        Profiler.Slowest = None
+        return d
+
+    @staticmethod
+    def merge(d: dict):
+        """adds the exported stage of a worker process to the current stage"""
+        if d is not None and Profiler.Active:
+            Profiler.Stack[-1].merge(d['stage'])
+            if d['slowest'] is not None and (Profiler.Slowest is None or d['slowest'][0] > Profiler.Slowest[0]):
+                Profiler.Slowest = d['slowest']
+    # endregion STAGES
+    # ----------------------------------------
+
+    # ----------------------------------------
+    # region REPORT
+    @staticmethod
+    def finish():
+        """adds the resources since the start to the root stage"""
+        t1, r = Profiler.state(), Profiler.Root
+        r.Calls, r.Wall, r.CPU, r.Read = 1, *[v1 - v0 for v0, v1 in zip(Profiler.T0, t1)]
+        r.RSS = max([r.RSS, Profiler.peak_rss()] + [s.RSS for s in r.Children.values()])
+
+    @staticmethod
+    def rows():
+        total = max(Profiler.Root.Wall, 1e-9)
+        return [[f'{"  " * d}{s.Name}', s.Calls, f'{s.Wall:.3f}', f'{s.CPU:.3f}', f'{s.Wall / total:.1%}', byte2str(s.RSS), byte2str(s.Read)] for d, s in Profiler.Root.walk()]
+
+    @staticmethod
+    def show():
+        print_table(Profiler.rows(), ['stage', 'calls', 'wall [s]', 'cpu [s]', 'share', 'peak rss', 'read'])
+
+    @staticmethod
+    def html(title):
+        rows = [[(f'{"&nbsp;" * 4 * d}{s.Name}',), s.Calls, f'{s.Wall:.3f}', f'{s.CPU:.3f}', html.div('', html.style_(('width', f'{100 * s.Wall / max(Profiler.Root.Wall, 1e-9):.1f}%'), ('background', html.Good), ('height', '1em'))),
+                 byte2str(s.RSS), byte2str(s.Read)] for d, s in Profiler.Root.walk()]
+        return html.File.add_root(html.table(title, ['stage', 'calls', 'wall [s]', 'cpu [s]', 'share', 'peak rss', 'read'], rows))
+
+    @staticmethod
+    def save():
+        """writes the JSON and HTML report and the cProfile statistics of the slowest stage"""
+        if not Profiler.Active:
+            return
+        Profiler.Active = False
+        Profiler.finish()
+        f = ensure_dir(Profiler.Dir).joinpath(f'{Profiler.Root.Name}-{datetime.now():%Y%m%d-%H%M%S}')
+        d = {'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'pid': getpid(), 'cprofile': None, 'stages': Profiler.Root.to_dict()}
+        if Profiler.Slowest is not None:
+            wall, name, stats = Profiler.Slowest
+            with open(f.with_suffix('.prof'), 'wb') as fp:
+                marshal.dump(stats, fp)
+            d['cprofile'] = {'stage': name, 'wall': round(wall, 6), 'file': str(f.with_suffix('.prof'))}
+        with open(f.with_suffix('.json'), 'w') as fp:
+            dump(d, fp, indent=2)
+        f.with_suffix('.html').write_text(Profiler.html(f'Profile of {Profiler.Root.Name}'))
+        Profiler.show()
+        info(f'saved profile to {f}.{{json,html}}' + ('' if Profiler.Slowest is None else f', cProfile of "{Profiler.Slowest[1]}" to {f}.prof'))
+        return f
+    # endregion REPORT
+    # ----------------------------------------
+
+# %% ../../nbs/47_utility.profiler.ipynb 6
+def profiled(name=None):
+    """decorator recording each call of the function as stage [name] (default: function name)"""
+    def inner(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Profiler.Active:
+                return func(*args, **kwargs)
+            with Profiler.stage(choose(name, func.__name__)):
+                return func(*args, **kwargs)
+        return wrapper
+    return inner
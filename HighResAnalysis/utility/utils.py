@@ -14,13 +14,12 @@ __all__ = ['type_dict', 'PBAR', 'move_up', 'file_exists', 'dir_exists', 'time_st
 # %% ../../nbs/28_utility.utils.ipynb 2
 import ROOT
 from os.path import isfile, exists, isdir, dirname, realpath, join, basename
-from os import makedirs, environ, devnull
+from os import makedirs, environ, devnull, getpid
 from subprocess import call
-from ROOT import TFile
 from json import loads
 from uncertainties import ufloat
 from uncertainties.core import Variable, AffineScalarFunc
-from numpy import sqrt, array, arange, mean, exp, concatenate, zeros, log2, log10, array_split, ndarray, full, frombuffer
+from numpy import sqrt, array, arange, mean, exp, concatenate, zeros, log2, log10, array_split, ndarray, full, frombuffer, inf
 from progressbar import Bar, ETA, FileTransferSpeed, Percentage, ProgressBar, SimpleProgress, Widget
 import h5py
 import pickle
@@ -28,15 +27,17 @@ from copy import deepcopy
 from inspect import signature
 from functools import wraps
 from datetime import timedelta, datetime
-from time import time
-from multiprocessing import Pool, cpu_count
+from time import time, perf_counter
+from multiprocessing import Pool, cpu_count, Value
 from hashlib import md5, sha256
 from pathlib import Path
+from sys import stdout
 
 from ..plotting.utils import info, critical, add_to_info, get_kw, remove_file
+from .cache import MetaCache, array_id
 
 # %% ../../nbs/28_utility.utils.ipynb 3
-ROOT.PyConfig.IgnoreCommandLineOptions = True  # disable ROOT overwriting the help settings...
+ROOT.PyConfig.IgnoreCommandLineOptions = True  # disable ROOT overwriting the help settings... (the libraries are only loaded on first use of ROOT.X)
 
 # %% ../../nbs/28_utility.utils.ipynb 4
 if environ.get('ANALYSIS_DIR'):
@@ -181,12 +182,12 @@ def has_root():
 # %% ../../nbs/28_utility.utils.ipynb 28
 def open_root_file(filename, option=''):
     if file_exists(filename):
-        return TFile(str(filename), option)
+        return ROOT.TFile(str(filename), option)
     critical(f'The file: "{filename}" does not exist...')
 
 # %% ../../nbs/28_utility.utils.ipynb 29
 def create_root_file(filename, option='recreate'):
-    return TFile(str(filename), option)
+    return ROOT.TFile(str(filename), option)
 
 # %% ../../nbs/28_utility.utils.ipynb 30
 def choose(v, default, decider='None', *args, **kwargs):
@@ -350,47 +351,97 @@ def update_pbar(func):
     @wraps(func)
     def my_func(*args, **kwargs):
         value = func(*args, **kwargs)
-        if PBAR is not None and PBAR.PBar is not None and not PBAR.is_finished():
-            PBAR.update()
+        PBAR.update()
         return value
     return my_func
 
 # %% ../../nbs/28_utility.utils.ipynb 55
 class PBar(object):
-    def __init__(self, start=None, counter=False, t=None):
+    """progress bar which only counts in [update] and redraws at most every [Interval] seconds.
+       Worker processes add their counts to a shared counter (see [attach]) and only the process which started the bar draws it.
+       Without a terminal on stdout the bar is never drawn."""
+
+    Interval = .2  # [s] between two redraws or pushes of a worker
+
+    def __init__(self, start=None, counter=False, t=None, shared=False):
         self.PBar = None
         self.Widgets = self.init_widgets(counter, t)
         self.Step = 0
         self.N = 0
+        self.Check = inf  # step at which the clock is looked at next, inf if there is nothing to draw
+        self.Stride = 1  # steps between two looks at the clock, adapted to the speed of the loop
+        self.Next = inf  # time of the next refresh
+        self.PID = getpid()
+        self.Shared = Value('q', 0) if shared else None  # counts of the worker processes
+        self.Sent = 0  # counts already added to the shared counter
         self.start(start)
 
-    def __reduce__(self):
-        return self.__class__, (None, False, None), (self.Widgets, self.Step, self.N)
+    def __reduce__(self):  # only the counts travel to other processes, they never draw
+        return self.__class__, (None, False, None), (self.Step, self.N)
 
     def __setstate__(self, state):
-        self.Widgets, self.Step, self.N = state
-        if self.N:
-            self.PBar = ProgressBar(widgets=self.Widgets, maxval=self.N).start()
-            self.update(self.Step) if self.Step > 0 else do_nothing()
+        self.Step, self.N = state
 
     @staticmethod
     def init_widgets(counter, t):
         return ['Progress: ', SimpleProgress('/') if counter else Percentage(), ' ', Bar(marker='>'), ' ', ETA(), ' ', FileTransferSpeed() if t is None else EventSpeed(t)]
 
+    @staticmethod
+    def attach(counter):
+        """pool initializer: the updates of the worker go to the shared [counter] of the parent's bar"""
+        PBAR.PBar, PBAR.Shared, PBAR.PID, PBAR.Step, PBAR.Sent, PBAR.N = None, counter, getpid(), 0, 0, inf
+        PBAR.Check, PBAR.Stride, PBAR.Next = 1, 1, perf_counter() + PBar.Interval
+
     def start(self, n, counter=None, t=None):
         if n is not None:
-            self.Step = 0
-            self.PBar = ProgressBar(widgets=self.Widgets if t is None and counter is None else self.init_widgets(counter, t), maxval=n).start()
-            self.N = n
+            self.Step, self.Sent, self.N, self.PID = 0, 0, n, getpid()
+            if self.Shared is not None:
+                self.Shared.value = 0
+            if stdout.isatty():
+                self.PBar = ProgressBar(widgets=self.Widgets if t is None and counter is None else self.init_widgets(counter, t), maxval=n).start()
+                self.Check, self.Stride, self.Next = 1, 1, perf_counter() + self.Interval
 
     def update(self, i=None):
-        i = self.Step if i is None else i
-        if i >= self.PBar.maxval:
+        self.Step = self.Step + 1 if i is None else i + 1
+        if self.Step >= self.Check:
+            self.tick()
+
+    def tick(self):
+        """looks at the clock only every [Stride] steps, which doubles while the loop is faster than [Interval]"""
+        if perf_counter() < self.Next and self.Step < self.N:
+            self.Stride *= 2
+        else:
+            self.refresh()
+            self.Stride = max(1, self.Stride // 2)
+        self.Check = min(self.Step + self.Stride, self.N) if self.Check < inf else inf
+
+    @property
+    def value(self):
+        return self.Step + (0 if self.Shared is None else self.Shared.value)
+
+    def refresh(self):
+        if self.PBar is not None and self.PID != getpid():  # inherited copy in a forked process
+            self.PBar, self.Check, self.Next = None, inf, inf
+        if self.PBar is None:
+            if self.Shared is not None and self.Step > self.Sent:
+                with self.Shared.get_lock():
+                    self.Shared.value += self.Step - self.Sent
+                self.Sent = self.Step
+                self.Next = perf_counter() + self.Interval
             return
-        self.PBar.update(i + 1)
-        self.Step += 1
-        if i == self.PBar.maxval - 1:
-            self.finish()
+        v = self.value
+        if v >= self.N:
+            return self.finish()
+        self.PBar.update(v)
+        self.Next = perf_counter() + self.Interval
+
+    def wait(self, res):
+        """redraws the bar until the asynchronous result [res] of a pool is ready and returns it"""
+        while not res.ready():
+            res.wait(self.Interval)
+            self.refresh()
+        self.finish()
+        return res.get()
 
     def set_last(self):
         if self.PBar:
@@ -398,14 +449,17 @@ class PBar(object):
             self.PBar.finished = True
 
     def finish(self):
-        self.PBar.finish()
+        if self.PBar is not None and self.PID == getpid():
+            self.PBar.finish()
+        self.PBar, self.Check, self.Next = None, inf, inf
 
     def is_finished(self):
-        return self.PBar.currval == self.N
+        return self.PBar is None or self.PBar.finished
 
     def eta(self, i, h, m, s=0):
-        self.PBar.start_time = time_stamp(datetime.now() - timedelta(hours=h, minutes=m, seconds=s))
-        self.update(i - 1)
+        if self.PBar is not None:
+            self.PBar.start_time = time_stamp(datetime.now() - timedelta(hours=h, minutes=m, seconds=s))
+            self.update(i - 1)
 
 # %% ../../nbs/28_utility.utils.ipynb 56
 class EventSpeed(Widget):
@@ -442,7 +496,7 @@ def get_field(obj, field: str):
 
 # %% ../../nbs/28_utility.utils.ipynb 60
 def make_suffix(*values):
-    vals = [md5(val).hexdigest() if type(val) is ndarray else f'{int(val):.0f}' if isint(val) else val for val in values if val is not None]
+    vals = [array_id(val) if type(val) is ndarray else f'{int(val):.0f}' if isint(val) else val for val in values if val is not None]
     return '_'.join(str(val) for val in vals)
 
 # %% ../../nbs/28_utility.utils.ipynb 61
@@ -467,16 +521,17 @@ def save_pickle(*pargs, print_dur=False, low_rate=False, high_rate=False, suf_ar
             run = ana.Run.get_high_rate_run(high=not low_rate) if low_rate or high_rate else None
             pickle_path = ana.make_pickle_path(*pargs, **prep_kw(pkwargs, run=run, suf=prep_suffix(func, ana, args, kwargs, suf_args, field)))
             info(f'Pickle path: {pickle_path}', prnt=verbose)
+            cache, key = MetaCache.from_path(pickle_path, getattr(ana, 'MetaDir', None))
             redo = (kwargs['_redo'] if '_redo' in kwargs else False) or (kwargs['show'] if 'show' in kwargs else False)
-            if file_exists(pickle_path) and not redo:
-                return load_pickle(pickle_path)
+            if not redo:
+                value = cache.get(key)
+                if value is not MetaCache.Miss:
+                    return value
             if not get_kw('_save', kwargs, default=True):
                 return func(ana, *args, **kwargs)
             prnt = print_dur and (kwargs['prnt'] if 'prnt' in kwargs else True)
             t = (ana.info if hasattr(ana, 'info') else info)(f'{ana.__class__.__name__}: {func.__name__.replace("_", " ")} ...', endl=False, prnt=prnt)
-            value = func(ana, *args, **kwargs)
-            with open(pickle_path, 'wb') as f:
-                pickle.dump(value, f)
+            value = cache.put(key, func(ana, *args, **kwargs))
             (ana.add_to_info if hasattr(ana, 'add_to_info') else add_to_info)(t, prnt=prnt)
             return value
         return wrapper
@@ -489,19 +544,18 @@ def save_hdf5(*pargs, arr=False, dtype=None, suf_args='[]', field=None, verbose=
         def wrapper(ana, *args, **kwargs):
             file_path = ana.make_hdf5_path(*pargs, **prep_kw(pkwargs, suf=prep_suffix(f, ana, args, kwargs, suf_args, field)))
             info(f'HDF5 path: {file_path}', prnt=verbose)
+            cache, key = MetaCache.from_path(file_path, getattr(ana, 'MetaDir', None))
             redo = kwargs['_redo'] if '_redo' in kwargs else False
-            if file_exists(file_path) and not redo:
-                d = h5py.File(file_path, 'r')['data']
-                return array(d) if arr else d
+            if not redo:
+                d = cache.get(key)
+                if d is not MetaCache.Miss:
+                    return d
             if not get_kw('_save', kwargs, default=True):
                 return f(ana, *args, **kwargs)
             data = f(ana, *args, **kwargs)
             if data is None:
                 return
-            remove_file(file_path)
-            hf = h5py.File(file_path, 'w')
-            hf.create_dataset('data', data=data.astype(choose(dtype, data.dtype)))
-            return array(hf['data']) if arr else hf['data']
+            return cache.put(key, array(data).astype(choose(dtype, data.dtype)))
         return wrapper
     return inner
 
@@ -510,25 +564,24 @@ def parallel(fp, what='something'):
     def inner(f):
         @wraps(f)
         def my_f(ana, *args, **kwargs):
-            with Pool() as pool:
-                ana.info(f'generate {what} for {ana}')
-                r = f(ana, *args, **kwargs)
-                d, fargs = (r[0], r[1:]) if len(r) > 1 else (r, [])
-                pbar = PBar(d.shape[0] // cpu_count())
+            ana.info(f'generate {what} for {ana}')
+            r = f(ana, *args, **kwargs)
+            d, fargs = (r[0], r[1:]) if len(r) > 1 else (r, [])
+            pbar = PBar(d.shape[0], shared=True)
+            with Pool(initializer=PBar.attach, initargs=(pbar.Shared,)) as pool:
                 f_ = getattr(ana.__class__, fp)
-                result = pool.starmap(_parallel, [(f_, d, i, pbar, *fargs) for i in array_split(arange(d.shape[0]), cpu_count())])
-                return concatenate(result)
+                result = pool.starmap_async(_parallel, [(f_, d, i, *fargs) for i in array_split(arange(d.shape[0]), cpu_count())])
+                return concatenate(pbar.wait(result))
         return my_f
     return inner
 
 # %% ../../nbs/28_utility.utils.ipynb 66
-def _parallel(f, d, i, pbar, *args):
+def _parallel(f, d, i, *args):
     ret = []
-    use_pbar = i[0] == 0
     for v in d[i]:
-        if use_pbar:
-            pbar.update()
         ret.append(f(v, *args))
+        PBAR.update()
+    PBAR.refresh()  # push the remaining counts
     return ret
 
 # %% ../../nbs/28_utility.utils.ipynb 67